@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+"""
+Compare the time and peak memory use of parsing a large JSON instance file by
+reading it into memory, and by parsing it from a memory map of the file.
+
+Each measurement is made in a new process, so that the peak of one does not hide
+that of another. Peak RSS counts the pages of a memory mapped file which have been
+read, although the kernel can drop them at any time, so the peak size of the
+Python heap, which holds any copy of the file, is measured as well.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+MEASURE = """
+import resource, sys, time, tracemalloc
+
+from check_jsonschema.parsers import json_
+
+method, filename = sys.argv[1:]
+if method == "read":
+    json_.MMAP_MIN_SIZE = float("inf")
+
+with open(filename, "rb") as fp:
+    start = time.perf_counter()
+    json_.load(fp)
+    elapsed = time.perf_counter() - start
+peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024
+
+tracemalloc.start()
+with open(filename, "rb") as fp:
+    json_.load(fp)
+peak_heap = tracemalloc.get_traced_memory()[1] // (1 << 20)
+print(elapsed, peak_rss, peak_heap)
+"""
+
+
+def write_instance(path, size_mb):
+    record = {"name": "x" * 40, "tags": ["a", "b", "c"], "value": 1.5, "ok": True}
+    line = json.dumps(record)
+    count = size_mb * (1 << 20) // (len(line) + 1)
+    with open(path, "w") as fp:
+        fp.write("[")
+        fp.write(",".join([line] * count))
+        fp.write("]")
+
+
+def measure(method, filename):
+    output = subprocess.check_output(
+        [sys.executable, "-c", MEASURE, method, filename], text=True
+    )
+    elapsed, peak_rss_mb, peak_heap_mb = output.split()
+    return float(elapsed), int(peak_rss_mb), int(peak_heap_mb)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-mb", type=int, default=128)
+    parser.add_argument("-n", "--number", type=int, default=3)
+    args = parser.parse_args()
+
+    from check_jsonschema.parsers import json_
+
+    if not json_.has_orjson:
+        sys.exit("memory mapped files are only parsed with orjson, which is missing")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "instance.json")
+        write_instance(filename, args.size_mb)
+        print(f"{os.path.getsize(filename) / (1 << 20):.0f}MB instance file")
+
+        for method in ("read", "mmap"):
+            results = [measure(method, filename) for _ in range(args.number)]
+            elapsed = min(r[0] for r in results)
+            peak_rss = min(r[1] for r in results)
+            peak_heap = min(r[2] for r in results)
+            print(
+                f"{method:<5} {elapsed:6.2f}s  "
+                f"peak RSS {peak_rss:5d}MB  peak heap {peak_heap:5d}MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
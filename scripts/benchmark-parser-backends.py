@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""
+Compare the time taken by each available parser backend to parse the example files
+of the test suite, or other files given on the command line.
+
+Backends provided by installed plugins are included. Files which a backend fails to
+parse are counted, and left out of its time.
+"""
+
+import argparse
+import glob
+import io
+import os
+import timeit
+
+from check_jsonschema.identify_filetype import path_to_type
+from check_jsonschema.parsers import backends
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), "..", "tests", "example-files")
+
+
+def find_files(paths):
+    if not paths:
+        paths = glob.glob(os.path.join(EXAMPLES_DIR, "**", "*"), recursive=True)
+    files_by_type = {filetype: [] for filetype in backends.BACKEND_FILETYPES}
+    for path in sorted(paths):
+        if not os.path.isfile(path):
+            continue
+        filetype = path_to_type(path, default_type="unknown")
+        if filetype in files_by_type:
+            with open(path, "rb") as fp:
+                files_by_type[filetype].append(fp.read())
+    return files_by_type
+
+
+def time_backend(backend, contents, number):
+    parsed, failed = [], 0
+    for data in contents:
+        try:
+            backend.load(io.BytesIO(data))
+        except backend.error_types:
+            failed += 1
+        else:
+            parsed.append(data)
+
+    def run():
+        for data in parsed:
+            backend.load(io.BytesIO(data))
+
+    return min(timeit.repeat(run, number=number, repeat=5)), failed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--number", type=int, default=200)
+    parser.add_argument(
+        "paths", nargs="*", help="files to parse, instead of the example files"
+    )
+    args = parser.parse_args()
+
+    files_by_type = find_files(args.paths)
+    for filetype, by_name in backends.get_backends().items():
+        contents = files_by_type[filetype]
+        if not contents or not by_name:
+            continue
+        size = sum(len(data) for data in contents)
+        print(f"{filetype}: {len(contents)} files, {size / 1024:.1f}KiB")
+
+        default_time = None
+        for name in sorted(by_name, key=lambda n: n != backends.DEFAULT_BACKEND):
+            elapsed, failed = time_backend(by_name[name], contents, args.number)
+            if name == backends.DEFAULT_BACKEND:
+                default_time = elapsed
+            relative = f"({default_time / elapsed:.2f}x)" if default_time else ""
+            failures = f"  {failed} failed to parse" if failed else ""
+            print(
+                f"  {name:<16} {elapsed / args.number * 1000:8.3f}ms per pass  "
+                f"{relative}{failures}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""
+Compare the time taken to validate the passing example files of the vendored
+schemas, with the 'anyOf' and 'oneOf' implementations of 'jsonschema' and with the
+lazy implementations used by check-jsonschema.
+"""
+
+import argparse
+import glob
+import os
+import timeit
+
+import jsonschema
+
+from check_jsonschema.formats import FormatOptions
+from check_jsonschema.parsers import ParserSet
+from check_jsonschema.regex_variants import RegexImplementation, RegexVariantName
+from check_jsonschema.schema_loader import BuiltinSchemaLoader
+
+EXAMPLES_DIR = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "example-files", "hooks", "positive"
+)
+
+
+def load_examples(parsers, name):
+    docs = []
+    for filename in sorted(glob.glob(os.path.join(EXAMPLES_DIR, name, "*"))):
+        try:
+            docs.append(parsers.parse_file(filename, "yaml"))
+        # skip files which need an optional parser, or a data transform
+        except Exception:
+            continue
+    return docs
+
+
+def time_validation(validator, docs, number):
+    def run():
+        for doc in docs:
+            list(validator.iter_errors(doc))
+
+    return min(timeit.repeat(run, number=number, repeat=5))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--number", type=int, default=20)
+    args = parser.parse_args()
+
+    regex_impl = RegexImplementation(RegexVariantName.default)
+    format_opts = FormatOptions(regex_impl=regex_impl)
+    parsers = ParserSet()
+
+    for name in sorted(os.listdir(EXAMPLES_DIR)):
+        docs = load_examples(parsers, name)
+        try:
+            loader = BuiltinSchemaLoader(f"vendor.{name}")
+            lazy_validator = loader.get_validator(
+                name, {}, format_opts, regex_impl, False
+            )
+        except Exception:
+            continue
+        if not docs or not all(lazy_validator.is_valid(doc) for doc in docs):
+            continue
+
+        # rebuild the validator with the keywords of 'jsonschema'
+        builtin_cls = jsonschema.validators.extend(
+            type(lazy_validator),
+            {
+                "anyOf": jsonschema.Draft202012Validator.VALIDATORS["anyOf"],
+                "oneOf": jsonschema.Draft202012Validator.VALIDATORS["oneOf"],
+            },
+        )
+        builtin_validator = builtin_cls(
+            lazy_validator.schema,
+            registry=lazy_validator._registry,
+            format_checker=lazy_validator.format_checker,
+        )
+
+        builtin_time = time_validation(builtin_validator, docs, args.number)
+        lazy_time = time_validation(lazy_validator, docs, args.number)
+        print(
+            f"{name:<22} {len(docs):>2} files  "
+            f"jsonschema {builtin_time * 1000:8.1f}ms  "
+            f"lazy {lazy_time * 1000:8.1f}ms  "
+            f"({builtin_time / lazy_time:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""
+Compare two ways of matching object keys against each 'patternProperties' block of
+the vendored schemas: a loop over every pattern and key, and the precompiled
+matcher.
+"""
+
+import argparse
+import glob
+import json
+import os
+import timeit
+
+from check_jsonschema.regex_variants import RegexImplementation, RegexVariantName
+
+VENDOR_DIR = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "src",
+    "check_jsonschema",
+    "builtin_schemas",
+    "vendor",
+)
+
+# keys typical of the configs which these schemas check
+SAMPLE_KEYS = (
+    "x-common",
+    "x-env",
+    "name",
+    "image",
+    "build-success",
+    "environment",
+    "MY_ENV_VAR",
+    "path.to.file",
+    "include",
+    "branches-ignore",
+    "job_1",
+    "deploy-prod",
+)
+
+
+def iter_pattern_properties(schema):
+    if isinstance(schema, dict):
+        pattern_properties = schema.get("patternProperties")
+        if isinstance(pattern_properties, dict):
+            yield tuple(pattern_properties)
+        for value in schema.values():
+            yield from iter_pattern_properties(value)
+    elif isinstance(schema, list):
+        for value in schema:
+            yield from iter_pattern_properties(value)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--variant",
+        choices=[x.value for x in RegexVariantName],
+        default=RegexVariantName.default.value,
+    )
+    parser.add_argument("-n", "--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    regex_impl = RegexImplementation(RegexVariantName(args.variant))
+    concrete = regex_impl._concrete
+    if args.variant == RegexVariantName.python.value:
+
+        def compile_search(pattern):
+            return concrete._patterns.get(pattern).search
+
+    else:
+
+        def compile_search(pattern):
+            return concrete._compile_pattern(pattern).find
+
+    for filename in sorted(glob.glob(os.path.join(VENDOR_DIR, "*.json"))):
+        with open(filename, "rb") as fp:
+            blocks = list(iter_pattern_properties(json.load(fp)))
+        if not blocks:
+            continue
+
+        def simple_loop(blocks=blocks):
+            for patterns in blocks:
+                for pattern in patterns:
+                    search = compile_search(pattern)
+                    for key in SAMPLE_KEYS:
+                        search(key)
+
+        def matcher(blocks=blocks):
+            for patterns in blocks:
+                concrete._matchers.get(patterns).match(SAMPLE_KEYS)
+
+        simple_time = timeit.timeit(simple_loop, number=args.number)
+        matcher_time = timeit.timeit(matcher, number=args.number)
+        print(
+            f"{os.path.basename(filename):<28} {len(blocks):>3} blocks  "
+            f"loop {simple_time * 1000:8.1f}ms  "
+            f"matcher {matcher_time * 1000:8.1f}ms  "
+            f"({simple_time / matcher_time:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
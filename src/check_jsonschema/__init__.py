@@ -1,5 +1,18 @@
 from __future__ import annotations
 
-from .cli import main
+import typing as t
+
+if t.TYPE_CHECKING:
+    from .cli import main
 
 __all__ = ("main",)
+
+
+def __getattr__(name: str) -> t.Any:
+    # the CLI is imported lazily so that lightweight modules, like the client for
+    # 'check-jsonschema serve', do not pay for importing it
+    if name == "main":
+        from .cli import main
+
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,144 @@
+"""
+Validation of a very large top-level array, one element at a time.
+
+When the root of a schema only constrains an array through keywords which can be
+checked on each element, or with a little bookkeeping across elements, the elements
+of an instance can be validated as they are parsed, without loading the whole
+instance.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import typing as t
+
+import jsonschema
+
+# keywords at the root of a schema which are either checked here, or have no effect
+# on validation
+_STREAMABLE_KEYWORDS = frozenset(
+    {
+        "$schema",
+        "$id",
+        "id",
+        "$anchor",
+        "$comment",
+        "$defs",
+        "definitions",
+        "title",
+        "description",
+        "default",
+        "examples",
+        "deprecated",
+        "readOnly",
+        "writeOnly",
+        "type",
+        "items",
+        "minItems",
+        "maxItems",
+        "uniqueItems",
+    }
+)
+
+
+def is_streamable(schema: t.Any) -> bool:
+    """
+    Whether a top-level array can be validated against a schema one element at a
+    time.
+    """
+    if schema is True:
+        return True
+    if not isinstance(schema, dict) or not schema.keys() <= _STREAMABLE_KEYWORDS:
+        return False
+
+    types = schema.get("type", "array")
+    if isinstance(types, str):
+        types = [types]
+    if not isinstance(types, list) or "array" not in types:
+        return False
+    # a list of 'items' validates each element against a different schema
+    if not isinstance(schema.get("items", True), (dict, bool)):
+        return False
+    return True
+
+
+def iter_array_errors(
+    validator: t.Any, elements: t.Iterable[t.Any]
+) -> t.Iterator[jsonschema.ValidationError]:
+    """
+    Validate the elements of a top-level array as they are given.
+
+    Errors for the elements are the same as those found by validating the whole
+    array. Errors for the root keywords, which are found only once all elements
+    have been seen, describe the array by its length rather than by its content.
+    """
+    schema = validator.schema
+    if schema is True:
+        schema = {}
+    items = schema.get("items", True)
+    min_items = schema.get("minItems")
+    max_items = schema.get("maxItems")
+    # the first index of each distinct element, by digest, so that elements are
+    # not kept in memory
+    first_indexes: dict[bytes, int] | None = (
+        {} if schema.get("uniqueItems") is True else None
+    )
+
+    count = 0
+    for index, element in enumerate(elements):
+        count += 1
+        if items is not True:
+            yield from validator.descend(
+                element, items, path=index, schema_path="items"
+            )
+
+        if first_indexes is not None:
+            digest = _unique_items_digest(element)
+            if digest in first_indexes:
+                yield _root_error(
+                    schema,
+                    "uniqueItems",
+                    "array has non-unique elements, at indexes "
+                    f"{first_indexes[digest]} and {index}",
+                )
+                # one error is reported, as for a whole array
+                first_indexes = None
+            else:
+                first_indexes[digest] = index
+
+    if min_items is not None and count < min_items:
+        yield _root_error(schema, "minItems", f"array of {count} items is too short")
+    if max_items is not None and count > max_items:
+        yield _root_error(schema, "maxItems", f"array of {count} items is too long")
+
+
+def _root_error(
+    schema: dict[str, t.Any], keyword: str, message: str
+) -> jsonschema.ValidationError:
+    return jsonschema.ValidationError(
+        message,
+        validator=keyword,
+        validator_value=schema[keyword],
+        schema=schema,
+        schema_path=[keyword],
+    )
+
+
+def _unique_items_digest(value: t.Any) -> bytes:
+    # 'uniqueItems' compares numbers by value, so that 1 and 1.0 are equal, but
+    # compares booleans by type, so that true and 1 are not
+    canonical = json.dumps(
+        _normalize_numbers(value), sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.blake2b(canonical.encode(), digest_size=16).digest()
+
+
+def _normalize_numbers(value: t.Any) -> t.Any:
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, dict):
+        return {k: _normalize_numbers(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_normalize_numbers(v) for v in value]
+    return value
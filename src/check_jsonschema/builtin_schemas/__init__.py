@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import importlib.resources
-import json
 import typing as t
 
+from ..parsers import json_
+
+_VENDOR_PACKAGE = "check_jsonschema.builtin_schemas.vendor"
+_CUSTOM_PACKAGE = "check_jsonschema.builtin_schemas.custom"
+
 
 class NoSuchSchemaError(ValueError):
     pass
@@ -13,7 +17,7 @@ def _get(package: str, resource: str, name: str) -> dict[str, t.Any]:
     try:
         return t.cast(
             "dict[str, t.Any]",
-            json.loads(
+            json_.loads(
                 importlib.resources.files(package).joinpath(resource).read_bytes()
             ),
         )
@@ -22,22 +26,42 @@ def _get(package: str, resource: str, name: str) -> dict[str, t.Any]:
 
 
 def _get_vendored_schema(name: str) -> dict[str, t.Any]:
-    return _get("check_jsonschema.builtin_schemas.vendor", f"{name}.json", name)
+    return _get(_VENDOR_PACKAGE, f"{name}.json", name)
 
 
 def _get_custom_schema(name: str) -> dict[str, t.Any]:
-    return _get("check_jsonschema.builtin_schemas.custom", f"{name}.json", name)
+    return _get(_CUSTOM_PACKAGE, f"{name}.json", name)
 
 
-def get_builtin_schema(name: str) -> dict[str, t.Any]:
+def _find_builtin_schema(name: str) -> tuple[str, str]:
+    """
+    Get the package and unprefixed name of a builtin schema.
+    """
     # first, look for an identifying prefix
     if name.startswith("vendor."):
-        return _get_vendored_schema(name[7:])
+        return (_VENDOR_PACKAGE, name[7:])
     elif name.startswith("custom."):
-        return _get_custom_schema(name[7:])
+        return (_CUSTOM_PACKAGE, name[7:])
 
     # if there is no prefix, just try in order: first custom, then vendored
-    try:
-        return _get_custom_schema(name)
-    except NoSuchSchemaError:
+    if importlib.resources.files(_CUSTOM_PACKAGE).joinpath(f"{name}.json").is_file():
+        return (_CUSTOM_PACKAGE, name)
+    return (_VENDOR_PACKAGE, name)
+
+
+def get_builtin_schema(name: str) -> dict[str, t.Any]:
+    package, name = _find_builtin_schema(name)
+    if package == _VENDOR_PACKAGE:
         return _get_vendored_schema(name)
+    return _get_custom_schema(name)
+
+
+def get_builtin_schema_source(name: str) -> bytes:
+    """
+    Get the JSON text of a builtin schema, without parsing it.
+    """
+    package, name = _find_builtin_schema(name)
+    try:
+        return importlib.resources.files(package).joinpath(f"{name}.json").read_bytes()
+    except (FileNotFoundError, ModuleNotFoundError):
+        raise NoSuchSchemaError(f"no builtin schema named {name} was found")
@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import calendar
 import contextlib
+import email.utils
 import hashlib
 import io
+import json
 import os
 import platform
 import shutil
 import tempfile
+import threading
 import time
 import typing as t
 
@@ -15,6 +18,42 @@ import requests
 
 _LASTMOD_FMT = "%a, %d %b %Y %H:%M:%S %Z"
 
+# metadata about each cached file is stored next to it, in a file with this suffix
+# the modification time of the metadata file records when the cached file was last
+# used
+_METADATA_SUFFIX = ".meta.json"
+
+# each cache dir is kept below this size by evicting the least recently used files
+DEFAULT_MAX_CACHE_SIZE = 128 * 1024 * 1024
+
+# each thread downloads with its own session, because 'requests' does not promise
+# that a session is safe to share between threads
+# a session keeps a pool of connections to each host alive, so that they are reused
+# across the schemas and '$ref's which a thread downloads
+# a thread makes one request at a time, so the default pool sizes are enough
+_local = threading.local()
+
+
+def get_http_session() -> requests.Session:
+    """
+    Get the session used for downloads by the calling thread.
+    """
+    session: requests.Session | None = getattr(_local, "session", None)
+    if session is None:
+        session = _local.session = requests.Session()
+    return session
+
+
+def _reset_http_session_in_child() -> None:
+    # open connections belong to the parent process, and must not be used or
+    # closed by a forked child
+    global _local
+    _local = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_http_session_in_child)
+
 
 def _base_cache_dir() -> str | None:
     sysname = platform.system()
@@ -55,19 +94,25 @@ def _lastmod_from_response(response: requests.Response) -> float:
 
 
 def _get_request(
-    file_url: str, *, response_ok: t.Callable[[requests.Response], bool]
+    file_url: str,
+    *,
+    response_ok: t.Callable[[requests.Response], bool],
+    headers: dict[str, str] | None = None,
 ) -> requests.Response:
     num_retries = 2
+    session = get_http_session()
     r: requests.Response | None = None
     for _attempt in range(num_retries + 1):
         try:
-            r = requests.get(file_url, stream=True)
+            r = session.get(file_url, stream=True, headers=headers)
         except requests.RequestException as e:
             if _attempt == num_retries:
                 raise FailedDownloadError("encountered error during download") from e
             continue
         if r.ok and response_ok(r):
             return r
+        # release the connection back to the pool before retrying
+        r.close()
     assert r is not None
     raise FailedDownloadError(
         f"got response with status={r.status_code}, retries exhausted"
@@ -85,11 +130,94 @@ def _atomic_write(dest: str, content: bytes) -> None:
     os.remove(fp.name)
 
 
+def _metadata_path(cachefile: str) -> str:
+    return cachefile + _METADATA_SUFFIX
+
+
+def _read_metadata(cachefile: str) -> dict[str, t.Any]:
+    try:
+        with open(_metadata_path(cachefile), "rb") as fp:
+            metadata = json.load(fp)
+    # missing or corrupt metadata is treated as empty
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(metadata, dict):
+        return {}
+    return metadata
+
+
+def _write_metadata(
+    cachefile: str, file_url: str, response: requests.Response | None
+) -> None:
+    """
+    Record that a cached file was fetched, along with the validators of 'response'.
+
+    'response' must be for the cached file's content, i.e. a response which was
+    downloaded into it or which confirmed it. Pass None to record only the time.
+    """
+    # a '304 Not Modified' may omit the validators, so keep any which are not sent
+    metadata = _read_metadata(cachefile)
+    metadata["url"] = file_url
+    if response is not None:
+        for key, header in (("etag", "etag"), ("last_modified", "last-modified")):
+            if header in response.headers:
+                metadata[key] = response.headers[header]
+    metadata["fetched_at"] = time.time()
+    _atomic_write(_metadata_path(cachefile), json.dumps(metadata).encode())
+
+
+def _mark_used(cachefile: str) -> None:
+    try:
+        os.utime(_metadata_path(cachefile))
+    except OSError:
+        pass
+
+
+def _conditional_headers(cachefile: str) -> dict[str, str]:
+    """
+    Get the headers for a request which only downloads the file if it has changed
+    since it was cached.
+    """
+    if not os.path.exists(cachefile):
+        return {}
+    metadata = _read_metadata(cachefile)
+    headers = {}
+    if isinstance(metadata.get("etag"), str):
+        headers["If-None-Match"] = metadata["etag"]
+    if isinstance(metadata.get("last_modified"), str):
+        headers["If-Modified-Since"] = metadata["last_modified"]
+    # files cached without metadata fall back to their modification time
+    elif not headers:
+        headers["If-Modified-Since"] = email.utils.formatdate(
+            os.path.getmtime(cachefile), usegmt=True
+        )
+    return headers
+
+
+def _server_confirms_cache(cachefile: str, response: requests.Response) -> bool | None:
+    """
+    Whether the server confirmed that a cached file is current, or None if the
+    response cannot tell.
+    """
+    if response.status_code == 304:
+        return True
+    etag = response.headers.get("etag")
+    cached_etag = _read_metadata(cachefile).get("etag")
+    # a different ETag means that the content changed, whatever its timestamps say
+    if etag is not None and isinstance(cached_etag, str):
+        return etag == cached_etag
+    return None
+
+
 def _cache_hit(cachefile: str, response: requests.Response) -> bool:
     # no file? miss
     if not os.path.exists(cachefile):
         return False
 
+    confirmed = _server_confirms_cache(cachefile, response)
+    if confirmed is not None:
+        return confirmed
+
     # compare mtime on any cached file against the remote last-modified time
     # it is considered a hit if the local file is at least as new as the remote file
     local_mtime = os.path.getmtime(cachefile)
@@ -116,14 +244,148 @@ def url_to_cache_filename(ref_url: str) -> str:
     return filename
 
 
+class CacheEntry:
+    """
+    A cached file, along with the metadata recorded when it was downloaded.
+
+    Files cached before metadata was recorded have no URL or validators, and use
+    their modification time as the time of last use.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.metadata_path = _metadata_path(path)
+        metadata = _read_metadata(path)
+
+        url = metadata.get("url")
+        self.url: str | None = url if isinstance(url, str) else None
+        etag = metadata.get("etag")
+        self.etag: str | None = etag if isinstance(etag, str) else None
+        last_modified = metadata.get("last_modified")
+        self.last_modified: str | None = (
+            last_modified if isinstance(last_modified, str) else None
+        )
+
+        stat = os.stat(path)
+        self.size = stat.st_size
+        fetched_at = metadata.get("fetched_at")
+        self.fetched_at: float = (
+            fetched_at if isinstance(fetched_at, (int, float)) else stat.st_mtime
+        )
+        try:
+            self.last_used = os.path.getmtime(self.metadata_path)
+            self.size += os.path.getsize(self.metadata_path)
+        except OSError:
+            self.last_used = stat.st_mtime
+
+    def remove(self) -> None:
+        for path in (self.path, self.metadata_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+def iter_cache_entries(cache_dir: str) -> t.Iterator[CacheEntry]:
+    """
+    Iterate over the files in a cache dir, which is given as a full path.
+    """
+    try:
+        names = os.listdir(cache_dir)
+    except FileNotFoundError:
+        return
+    for name in sorted(names):
+        if name.endswith(_METADATA_SUFFIX):
+            continue
+        path = os.path.join(cache_dir, name)
+        # skip files removed by a concurrent run
+        try:
+            yield CacheEntry(path)
+        except FileNotFoundError:
+            continue
+
+
+def prune_cache_dir(
+    cache_dir: str, max_size: int, *, keep: t.Container[str] = ()
+) -> list[CacheEntry]:
+    """
+    Evict the least recently used files in a cache dir until it fits in 'max_size'
+    bytes. Files whose paths are in 'keep' are never evicted.
+
+    Returns the evicted entries.
+    """
+    try:
+        names = set(os.listdir(cache_dir))
+    except FileNotFoundError:
+        return []
+    # metadata files whose cached files are gone are always removed
+    for name in names:
+        if (
+            name.endswith(_METADATA_SUFFIX)
+            and name.removesuffix(_METADATA_SUFFIX) not in names
+        ):
+            try:
+                os.remove(os.path.join(cache_dir, name))
+            except FileNotFoundError:
+                pass
+
+    entries = list(iter_cache_entries(cache_dir))
+    total_size = sum(entry.size for entry in entries)
+
+    evicted: list[CacheEntry] = []
+    for entry in sorted(entries, key=lambda e: e.last_used):
+        if total_size <= max_size:
+            break
+        if entry.path in keep:
+            continue
+        entry.remove()
+        evicted.append(entry)
+        total_size -= entry.size
+    return evicted
+
+
 class FailedDownloadError(Exception):
     pass
 
 
 class CacheDownloader:
-    def __init__(self, cache_dir: str, *, disable_cache: bool = False) -> None:
+    def __init__(
+        self,
+        cache_dir: str,
+        *,
+        disable_cache: bool = False,
+        cache_ttl: float | None = None,
+        offline: bool = False,
+        max_size: int = DEFAULT_MAX_CACHE_SIZE,
+    ) -> None:
         self._cache_dir = _resolve_cache_dir(cache_dir)
         self._disable_cache = disable_cache
+        # files fetched less than 'cache_ttl' seconds ago are used without a request
+        # and when offline, cached files are always used and nothing is downloaded
+        self._cache_ttl = cache_ttl
+        self._offline = offline
+        self._max_size = max_size
+
+    def _get_fresh_cachefile(self, filename: str) -> str | None:
+        """
+        Get the path to a cached file if it may be used without making any request.
+        """
+        if (not self._cache_dir) or self._disable_cache:
+            return None
+        cachefile = os.path.join(self._cache_dir, filename)
+        if not os.path.exists(cachefile):
+            return None
+        if self._offline:
+            return cachefile
+        if self._cache_ttl is None:
+            return None
+
+        fetched_at = _read_metadata(cachefile).get("fetched_at")
+        if not isinstance(fetched_at, (int, float)):
+            fetched_at = os.path.getmtime(cachefile)
+        if time.time() - fetched_at < self._cache_ttl:
+            return cachefile
+        return None
 
     def _download(
         self,
@@ -144,11 +406,32 @@ class CacheDownloader:
             # we now know it's not a hit, so validate the content (forces download)
             return response_ok(r)
 
-        response = _get_request(file_url, response_ok=check_response_for_download)
+        response = _get_request(
+            file_url,
+            response_ok=check_response_for_download,
+            headers=_conditional_headers(dest),
+        )
         # check to see if we have a file which matches the connection
         # only download if we do not (cache miss, vs hit)
-        if not _cache_hit(dest, response):
-            _atomic_write(dest, response.content)
+        # responses are closed explicitly, as they are not context managers in older
+        # versions of 'requests'
+        try:
+            cache_hit = _cache_hit(dest, response)
+            if not cache_hit:
+                _atomic_write(dest, response.content)
+                _write_metadata(dest, file_url, response)
+            # a hit found by comparing times is not known to match the validators of
+            # the response, so they are only kept when the server confirmed the file
+            elif _server_confirms_cache(dest, response):
+                _write_metadata(dest, file_url, response)
+            else:
+                _write_metadata(dest, file_url, None)
+        finally:
+            response.close()
+
+        # the cache only grows when a file is written, so only check its size then
+        if not cache_hit:
+            prune_cache_dir(self._cache_dir, self._max_size, keep=(dest,))
 
         return dest
 
@@ -159,10 +442,23 @@ class CacheDownloader:
         filename: str,
         validate_response: t.Callable[[requests.Response], bool],
     ) -> t.Iterator[t.IO[bytes]]:
-        if (not self._cache_dir) or self._disable_cache:
-            yield io.BytesIO(
-                _get_request(file_url, response_ok=validate_response).content
+        fresh_cachefile = self._get_fresh_cachefile(filename)
+        if fresh_cachefile is not None:
+            _mark_used(fresh_cachefile)
+            with open(fresh_cachefile, "rb") as fp:
+                yield fp
+        elif self._offline:
+            raise FailedDownloadError(
+                f"cannot download {file_url} in offline mode, "
+                "and it has not been cached"
             )
+        elif (not self._cache_dir) or self._disable_cache:
+            response = _get_request(file_url, response_ok=validate_response)
+            try:
+                content = response.content
+            finally:
+                response.close()
+            yield io.BytesIO(content)
         else:
             with open(
                 self._download(file_url, filename, response_ok=validate_response), "rb"
@@ -1,21 +1,37 @@
 from __future__ import annotations
 
+import collections
+import concurrent.futures
+import contextlib
+import functools
+import itertools
+import multiprocessing
+import multiprocessing.managers
 import pathlib
+import queue
 import typing as t
 
 import click
 import jsonschema
 import referencing.exceptions
 
-from . import format_errors
+from . import array_stream, format_errors, pickling
+from .cli.param_types import CustomLazyFile
 from .formats import FormatOptions
-from .instance_loader import InstanceLoader
+from .instance_loader import InstanceLoader, StreamedArray
 from .parsers import ParseError
 from .regex_variants import RegexImplementation
-from .reporter import Reporter
+from .reporter import Reporter, StreamingReporter
 from .result import CheckResult
+from .result_cache import ResultCache
 from .schema_loader import SchemaLoaderBase, SchemaParseError, UnsupportedUrlScheme
 
+_REF_RESOLUTION_ERRORS = (
+    referencing.exceptions.NoSuchResource,
+    referencing.exceptions.Unretrievable,
+    referencing.exceptions.Unresolvable,
+)
+
 
 class _Exit(Exception):
     def __init__(self, code: int) -> None:
@@ -23,6 +39,51 @@ class _Exit(Exception):
         self.code = code
 
 
+class _Failure(Exception):
+    """
+    A fatal error, with a message and optional details to show the user.
+
+    The details are rendered when the failure is raised because tracebacks and
+    exception chains do not survive being sent back from a worker process.
+    """
+
+    def __init__(self, message: str, detail: str | None = None) -> None:
+        super().__init__(message, detail)
+        self.message = message
+        self.detail = detail
+
+
+def _describe_validator_error(err: Exception) -> str:
+    if isinstance(err, SchemaParseError):
+        return "Error: schemafile could not be parsed as JSON"
+    elif isinstance(err, jsonschema.SchemaError):
+        return "Error: schemafile was not valid\n"
+    elif isinstance(err, UnsupportedUrlScheme):
+        return f"Error: {err}\n"
+    return "Error: Unexpected Error building schema validator"
+
+
+_CheckOutcome = ParseError | list[jsonschema.ValidationError]
+# the name of a failing instance, its outcome, and whether any more instances of the
+# same file follow it
+_CheckFailure = tuple[str, _CheckOutcome, bool]
+# the name of a checked file, and its failing instances
+_CheckedFile = tuple[str, t.Iterable[_CheckFailure]]
+
+
+# the number of files for each worker process which are submitted ahead of the file
+# whose results are being reported
+_FILES_IN_FLIGHT_PER_JOB = 2
+# the failures of a file with many instances are sent back from a worker in chunks
+# of this many, and a worker waits while this many chunks are not yet reported
+_FAILURE_CHUNK_SIZE = 100
+_MAX_PENDING_FAILURE_CHUNKS = 4
+
+
+def _count_errors(count: int | None) -> str:
+    return "1 error" if count == 1 else f"{count} errors"
+
+
 class SchemaChecker:
     def __init__(
         self,
@@ -34,6 +95,12 @@ class SchemaChecker:
         regex_impl: RegexImplementation,
         traceback_mode: t.Literal["minimal", "short", "full"] = "short",
         fill_defaults: bool = False,
+        jobs: int = 1,
+        result_cache: ResultCache | None = None,
+        fail_fast: bool = False,
+        max_errors: int | None = None,
+        max_errors_per_file: int | None = None,
+        stream_json_arrays: bool = False,
     ) -> None:
         self._schema_loader = schema_loader
         self._instance_loader = instance_loader
@@ -43,12 +110,26 @@ class SchemaChecker:
         self._regex_impl = regex_impl
         self._traceback_mode = traceback_mode
         self._fill_defaults = fill_defaults
+        self._jobs = jobs
+
+        self._result_cache = result_cache
+        self._schema_fingerprint: str | None = None
+
+        self._fail_fast = fail_fast
+        self._max_errors = max_errors
+        self._max_errors_per_file = max_errors_per_file
+        # the number of errors which may still be collected under '--max-errors'
+        # updated as results are recorded, so worker processes only see the
+        # initial value
+        self._errors_remaining = max_errors
+
+        self._stream_json_arrays = stream_json_arrays
 
     def _fail(self, msg: str, err: Exception | None = None) -> t.NoReturn:
-        click.echo(msg, err=True)
+        detail = None
         if err is not None:
-            format_errors.print_error(err, mode=self._traceback_mode)
-        raise _Exit(1)
+            detail = format_errors.format_error(err, mode=self._traceback_mode)
+        raise _Failure(msg, detail)
 
     def get_validator(
         self, path: pathlib.Path | str, doc: dict[str, t.Any]
@@ -57,39 +138,329 @@ class SchemaChecker:
             return self._schema_loader.get_validator(
                 path, doc, self._format_opts, self._regex_impl, self._fill_defaults
             )
-        except SchemaParseError as e:
-            self._fail("Error: schemafile could not be parsed as JSON", e)
-        except jsonschema.SchemaError as e:
-            self._fail("Error: schemafile was not valid\n", e)
-        except UnsupportedUrlScheme as e:
-            self._fail(f"Error: {e}\n", e)
         except Exception as e:
-            self._fail("Error: Unexpected Error building schema validator", e)
+            self._fail(_describe_validator_error(e), e)
+
+    def get_schema_fingerprint(self) -> str:
+        if self._schema_fingerprint is None:
+            try:
+                self._schema_fingerprint = self._schema_loader.get_schema_fingerprint()
+            except Exception as e:
+                self._fail(_describe_validator_error(e), e)
+        return self._schema_fingerprint
+
+    def _error_limit(self) -> int | None:
+        limits = [
+            limit
+            for limit in (self._max_errors_per_file, self._errors_remaining)
+            if limit is not None
+        ]
+        return min(limits) if limits else None
+
+    def _check_instance(self, path: str, data: t.Any) -> _CheckOutcome:
+        if isinstance(data, ParseError):
+            return data
+        validator = self.get_validator(path, data)
+        return self._collect_errors(validator.iter_errors(data))
+
+    def _collect_errors(
+        self, errors: t.Iterator[jsonschema.ValidationError]
+    ) -> list[jsonschema.ValidationError]:
+        limit = self._error_limit()
+        try:
+            if limit is None:
+                return list(errors)
+            # collect one more error than the limit, to know if any were left out
+            return list(itertools.islice(errors, limit + 1))
+        except _REF_RESOLUTION_ERRORS as e:
+            self._fail("Failure resolving $ref within schema\n", e)
+
+    def _check_file(self, file: t.IO[bytes] | CustomLazyFile) -> _CheckedFile:
+        if self._instance_loader.is_record_file(file):
+            return self._check_record_file(file)
+        path, outcome = self._check_document_file(file)
+        return path, [(path, outcome, False)] if outcome else []
+
+    def _check_record_file(self, file: t.IO[bytes] | CustomLazyFile) -> _CheckedFile:
+        """
+        Check the instances of a file which holds many of them, one at a time as
+        they are read, so that memory use does not grow with the size of the file.
+
+        The results are not cached, since that would mean reading the whole file
+        before checking it.
+        """
+
+        def iter_failures() -> t.Iterator[_CheckFailure]:
+            for name, data, more in self._instance_loader.iter_records(file):
+                outcome = self._check_instance(name, data)
+                if outcome:
+                    yield (name, outcome, more)
+
+        return self._instance_loader.get_name(file), iter_failures()
+
+    def _check_document_file(
+        self, file: t.IO[bytes] | CustomLazyFile
+    ) -> tuple[str, _CheckOutcome]:
+        if self._can_stream_array(file):
+            return self._check_streamed_array_file(file)
+
+        if self._result_cache is None:
+            path, data = self._instance_loader.load_file(file)
+            return path, self._check_instance(path, data)
+
+        path, content = self._instance_loader.read_file(file)
+        cache_key = self._result_cache.make_key(
+            content,
+            self._instance_loader.get_filetype(path),
+            self.get_schema_fingerprint(),
+        )
+        cached_errors = self._result_cache.get(cache_key)
+        if cached_errors is not None:
+            return path, cached_errors
+
+        outcome = self._check_instance(
+            path, self._instance_loader.parse_data(path, content)
+        )
+        # parse errors are not cached, as they are cheap to reproduce
+        # errors cut short by a limit are not cached, as they are incomplete
+        if not isinstance(outcome, ParseError) and not self._over_limit(
+            outcome, self._error_limit()
+        ):
+            self._result_cache.put(cache_key, outcome)
+        return path, outcome
+
+    def _can_stream_array(self, file: t.IO[bytes] | CustomLazyFile) -> bool:
+        if not (
+            self._stream_json_arrays and self._instance_loader.can_stream_array(file)
+        ):
+            return False
+        validator = self.get_validator(self._instance_loader.get_name(file), {})
+        return hasattr(validator, "descend") and array_stream.is_streamable(
+            validator.schema
+        )
+
+    def _check_streamed_array_file(
+        self, file: t.IO[bytes] | CustomLazyFile
+    ) -> tuple[str, _CheckOutcome]:
+        """
+        Check a JSON file, validating the elements of a top-level array one at a
+        time as they are parsed, so that memory use does not grow with the size of
+        the file.
+
+        The results are not cached, since that would mean reading the whole file
+        before checking it.
+        """
+        path, data = self._instance_loader.load_array_stream(file)
+        if not isinstance(data, StreamedArray):
+            return path, self._check_instance(path, data)
+
+        try:
+            validator = self.get_validator(path, {})
+            return path, self._collect_errors(
+                array_stream.iter_array_errors(validator, data)
+            )
+        except ParseError as err:
+            return path, err
+        finally:
+            data.close()
+
+    def _limit_failures(
+        self, failures: t.Iterable[_CheckFailure]
+    ) -> t.Iterator[_CheckFailure]:
+        """
+        Limit the failures of a file in a worker process, which are sent back.
+
+        A worker cannot see the results of other files, so it stops once the limits
+        are reached as they stood when it started. The limits are applied again as
+        the results are recorded.
+        """
+        num_errors = 0
+        for failure in failures:
+            yield failure
+            if self._fail_fast:
+                return
+            outcome = failure[1]
+            if not isinstance(outcome, ParseError):
+                num_errors += len(outcome)
+            if self._max_errors is not None and num_errors >= self._max_errors:
+                return
+
+    @staticmethod
+    def _over_limit(
+        errors: list[jsonschema.ValidationError], limit: int | None
+    ) -> bool:
+        return limit is not None and len(errors) > limit
+
+    def _iter_checked_files(self) -> t.Iterator[_CheckedFile]:
+        if self._jobs > 1:
+            yield from self._iter_checked_files_parallel()
+        else:
+            for file in self._instance_loader.files:
+                yield self._check_file(file)
+
+    def _iter_checked_files_parallel(self) -> t.Iterator[_CheckedFile]:
+        # compute the fingerprint once, before it is sent to the workers
+        if self._result_cache is not None:
+            self.get_schema_fingerprint()
+
+        # files are submitted in order and their results are consumed in the same
+        # order, so that the output is stable regardless of scheduling
+        # only a few files per worker are submitted ahead of the one being reported,
+        # so that results waiting to be reported do not pile up
+        #
+        # only named files on disk are sent to workers; stdin and in-memory
+        # streams cannot cross the process boundary and are checked in this process
+        # when their turn comes
+        files = iter(self._instance_loader.files)
+        window = self._jobs * _FILES_IN_FLIGHT_PER_JOB
+        in_flight: collections.deque[
+            tuple[concurrent.futures.Future[t.Any] | None, t.Callable[[], _CheckedFile]]
+        ] = collections.deque()
+        with (
+            concurrent.futures.ProcessPoolExecutor(
+                max_workers=self._jobs,
+                initializer=_init_worker,
+                initargs=(self,),
+            ) as pool,
+            contextlib.ExitStack() as stack,
+        ):
+            # files with many instances send their failures back through a queue
+            # the manager which holds the queues is shut down on exit, before the
+            # pool, so that no worker is left waiting to send failures
+            manager: multiprocessing.managers.SyncManager | None = None
+
+            def submit(
+                file: t.IO[bytes] | CustomLazyFile,
+            ) -> tuple[
+                concurrent.futures.Future[t.Any] | None, t.Callable[[], _CheckedFile]
+            ]:
+                nonlocal manager
+                if not (isinstance(file, CustomLazyFile) and file.name != "-"):
+                    return None, functools.partial(self._check_file, file)
+                if not self._instance_loader.is_record_file(file):
+                    future = pool.submit(_check_file_in_worker, file.name)
+                    return future, future.result
+                if manager is None:
+                    manager = stack.enter_context(multiprocessing.Manager())
+                chunks = manager.Queue(maxsize=_MAX_PENDING_FAILURE_CHUNKS)
+                record_future = pool.submit(
+                    _check_record_file_in_worker, file.name, chunks
+                )
+                name = self._instance_loader.get_name(file)
+                return record_future, lambda: (
+                    name,
+                    _iter_chunked_failures(record_future, chunks),
+                )
+
+            try:
+                in_flight.extend(
+                    submit(file) for file in itertools.islice(files, window)
+                )
+                while in_flight:
+                    _, get_checked_file = in_flight.popleft()
+                    checked_file = get_checked_file()
+                    for file in itertools.islice(files, 1):
+                        in_flight.append(submit(file))
+                    yield checked_file
+            finally:
+                for future, _ in in_flight:
+                    if future is not None:
+                        future.cancel()
+
+    def __getstate__(self) -> dict[str, t.Any]:
+        # workers never report results themselves, so the reporter is not sent
+        state = self.__dict__.copy()
+        state["_reporter"] = None
+        return state
 
     def _build_result(self) -> CheckResult:
-        result = CheckResult()
-        for path, data in self._instance_loader.iter_files():
-            if isinstance(data, ParseError):
-                result.record_parse_error(path, data)
-            else:
-                validator = self.get_validator(path, data)
-                passing = True
-                for err in validator.iter_errors(data):
-                    result.record_validation_error(path, err)
-                    passing = False
-                if passing:
-                    result.record_validation_success(path)
+        # a streaming reporter is given each file's results as soon as they are
+        # available, and the results are not kept
+        streaming_reporter = None
+        if isinstance(self._reporter, StreamingReporter):
+            streaming_reporter = self._reporter
+        result = CheckResult(retain_details=streaming_reporter is None)
+
+        num_files = len(self._instance_loader.files)
+        for num_checked, (path, failures) in enumerate(
+            self._iter_checked_files(), start=1
+        ):
+            file_failed = False
+            for name, outcome, more in failures:
+                file_failed = True
+                errors_left_out = False
+                if isinstance(outcome, ParseError):
+                    result.record_parse_error(name, outcome)
+                    if streaming_reporter is not None:
+                        streaming_reporter.report_file_parse_error(name, outcome)
+                else:
+                    errors, errors_left_out = self._limit_validation_errors(
+                        result, name, outcome
+                    )
+                    for err in errors:
+                        result.record_validation_error(name, err)
+                    if streaming_reporter is not None:
+                        streaming_reporter.report_file_validation_errors(name, errors)
+
+                results_left = more or num_checked < num_files
+                if self._should_stop(result, errors_left_out, results_left):
+                    return result
+
+            if not file_failed:
+                result.record_validation_success(path)
+                if streaming_reporter is not None:
+                    streaming_reporter.report_file_success(path)
         return result
 
+    def _should_stop(
+        self, result: CheckResult, errors_left_out: bool, results_left: bool
+    ) -> bool:
+        """
+        Check whether a limit has been reached after recording a failure, and if
+        any results are left out because of it, note that they were truncated.
+        """
+        if self._errors_remaining == 0:
+            if errors_left_out or results_left:
+                result.record_truncation(
+                    f"stopped after {_count_errors(self._max_errors)} (--max-errors)"
+                )
+            return True
+        if self._fail_fast and not result.success:
+            if results_left:
+                result.record_truncation(
+                    "stopped after the first failing file (--fail-fast)"
+                )
+            return True
+        return False
+
+    def _limit_validation_errors(
+        self, result: CheckResult, path: str, errors: list[jsonschema.ValidationError]
+    ) -> tuple[list[jsonschema.ValidationError], bool]:
+        """
+        Apply the limits on the number of errors to the errors for a file.
+
+        Returns the errors to record, and whether any were left out by
+        '--max-errors'.
+        """
+        if self._over_limit(errors, self._max_errors_per_file):
+            assert self._max_errors_per_file is not None
+            errors = errors[: self._max_errors_per_file]
+            result.record_truncation(
+                f"{path}: stopped after {_count_errors(self._max_errors_per_file)} "
+                "(--max-errors-per-file)"
+            )
+
+        errors_left_out = False
+        if self._errors_remaining is not None:
+            errors_left_out = len(errors) > self._errors_remaining
+            errors = errors[: self._errors_remaining]
+            self._errors_remaining -= len(errors)
+        return errors, errors_left_out
+
     def _run(self) -> None:
-        try:
-            result = self._build_result()
-        except (
-            referencing.exceptions.NoSuchResource,
-            referencing.exceptions.Unretrievable,
-            referencing.exceptions.Unresolvable,
-        ) as e:
-            self._fail("Failure resolving $ref within schema\n", e)
+        result = self._build_result()
+        if self._result_cache is not None:
+            self._result_cache.prune()
 
         self._reporter.report_result(result)
         if not result.success:
@@ -98,6 +469,56 @@ class SchemaChecker:
     def run(self) -> int:
         try:
             self._run()
+        except _Failure as e:
+            click.echo(e.message, err=True)
+            if e.detail is not None:
+                click.echo(e.detail, err=True)
+            return 1
         except _Exit as e:
             return e.code
         return 0
+
+
+# the checker used by the current worker process, set by the pool initializer
+_WORKER_CHECKER: SchemaChecker | None = None
+
+
+def _init_worker(checker: SchemaChecker) -> None:
+    global _WORKER_CHECKER
+    _WORKER_CHECKER = checker
+
+
+def _check_file_in_worker(filename: str) -> tuple[str, list[_CheckFailure]]:
+    assert _WORKER_CHECKER is not None
+    path, failures = _WORKER_CHECKER._check_file(open(filename, "rb"))
+    return path, list(_WORKER_CHECKER._limit_failures(failures))
+
+
+def _check_record_file_in_worker(filename: str, chunks: queue.Queue[bytes]) -> None:
+    """
+    Check a file with many instances, sending its failures back in chunks as they
+    are found. The end of the failures is marked with an empty chunk.
+
+    The chunks are pickled here, so that the process which relays them does not
+    need to unpickle validation errors.
+    """
+    assert _WORKER_CHECKER is not None
+    try:
+        _, failures = _WORKER_CHECKER._check_file(open(filename, "rb"))
+        limited_failures = _WORKER_CHECKER._limit_failures(failures)
+        while chunk := list(itertools.islice(limited_failures, _FAILURE_CHUNK_SIZE)):
+            chunks.put(pickling.dumps(chunk))
+    finally:
+        chunks.put(b"")
+
+
+def _iter_chunked_failures(
+    future: concurrent.futures.Future[None], chunks: queue.Queue[bytes]
+) -> t.Iterator[_CheckFailure]:
+    while chunk := chunks.get():
+        yield from pickling.loads(chunk)
+    # raise any error from the worker
+    future.result()
+
+
+pickling.register_multiprocessing_reducers()
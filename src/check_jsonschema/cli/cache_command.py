@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import concurrent.futures
+import json
+import os
+import shutil
+import time
+import typing as t
+
+import click
+
+from ..cachedownloader import (
+    DEFAULT_MAX_CACHE_SIZE,
+    CacheEntry,
+    FailedDownloadError,
+    _resolve_cache_dir,
+    iter_cache_entries,
+    prune_cache_dir,
+)
+from ..catalog import SCHEMA_CATALOG
+from ..parsers import ParseError, ParserSet
+from ..schema_loader.errors import SchemaParseError
+from ..schema_loader.readers import HttpSchemaReader
+from ..schema_loader.resolver import (
+    collect_referenced_documents,
+    create_retrieve_callable,
+)
+from .param_types import ByteSize, JobCount
+
+# the cache dirs which hold downloaded schemas and '$ref's
+DOWNLOAD_CACHE_NAMES = ("schemas", "refs")
+
+
+def _download_cache_dirs() -> dict[str, str]:
+    cache_dirs = {}
+    for name in DOWNLOAD_CACHE_NAMES:
+        cache_dir = _resolve_cache_dir(name)
+        if cache_dir is None:
+            raise click.UsageError("no cache dir could be found for this platform")
+        cache_dirs[name] = cache_dir
+    return cache_dirs
+
+
+def _format_size(size: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GiB"
+
+
+def _format_time(timestamp: float) -> str:
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp))
+
+
+def _entry_to_dict(cache_name: str, entry: CacheEntry) -> dict[str, t.Any]:
+    return {
+        "cache": cache_name,
+        "path": entry.path,
+        "url": entry.url,
+        "size": entry.size,
+        "fetched_at": entry.fetched_at,
+        "last_used": entry.last_used,
+        "etag": entry.etag,
+        "last_modified": entry.last_modified,
+    }
+
+
+@click.group(
+    "cache",
+    help="""\
+Manage the cache of downloaded schemas and '$ref's.
+
+Each downloaded file is stored with a record of its URL, its validators
+(ETag and Last-Modified), when it was fetched, and when it was last used.
+""",
+)
+@click.help_option("-h", "--help")
+def cache() -> None:
+    pass
+
+
+@cache.command("list", help="List the cached files.")
+@click.help_option("-h", "--help")
+@click.option(
+    "-o",
+    "--output-format",
+    help="Which output format to use.",
+    type=click.Choice(("text", "json"), case_sensitive=False),
+    default="text",
+)
+def list_cache(*, output_format: str) -> None:
+    entries = [
+        (cache_name, entry)
+        for cache_name, cache_dir in _download_cache_dirs().items()
+        for entry in iter_cache_entries(cache_dir)
+    ]
+
+    if output_format == "json":
+        click.echo(json.dumps([_entry_to_dict(name, entry) for name, entry in entries]))
+        return
+
+    for cache_name, entry in entries:
+        click.echo(
+            f"{cache_name:<8} {_format_size(entry.size):>9}  "
+            f"fetched {_format_time(entry.fetched_at)}  "
+            f"used {_format_time(entry.last_used)}  "
+            f"{entry.url or entry.path}"
+        )
+    total_size = sum(entry.size for _, entry in entries)
+    click.echo(f"{len(entries)} cached files, {_format_size(total_size)}")
+
+
+@cache.command(
+    "prune",
+    help="Evict the least recently used files until each cache fits in a size.",
+)
+@click.help_option("-h", "--help")
+@click.option(
+    "--max-size",
+    help=(
+        "The largest size to allow for each cache, e.g. '512K' or '100M'. "
+        f"Defaults to {DEFAULT_MAX_CACHE_SIZE // (1024 * 1024)}M."
+    ),
+    type=ByteSize(),
+    default=DEFAULT_MAX_CACHE_SIZE,
+)
+def prune(*, max_size: int) -> None:
+    evicted: list[CacheEntry] = []
+    for cache_dir in _download_cache_dirs().values():
+        evicted.extend(prune_cache_dir(cache_dir, max_size))
+    click.echo(
+        f"removed {len(evicted)} cached files, "
+        f"{_format_size(sum(entry.size for entry in evicted))}"
+    )
+
+
+def _warm_url(url: str) -> list[str]:
+    """
+    Download a schema and all of the remote documents which it references.
+
+    Returns the URLs of any referenced documents which could not be downloaded.
+    """
+    schema = HttpSchemaReader(url, disable_cache=False).read_schema()
+
+    # retrieve references in the same way as validation will, so that they are
+    # cached under the same names
+    id_attribute = schema.get("$id")
+    if not isinstance(id_attribute, str):
+        id_attribute = None
+    retrieve = create_retrieve_callable(
+        ParserSet(), url, id_attribute, disable_cache=False
+    )
+    documents = collect_referenced_documents(
+        retrieve, schema, id_attribute if id_attribute is not None else url
+    )
+    return [
+        ref_url
+        for ref_url, contents in documents.items()
+        if contents is None and ref_url.startswith(("http://", "https://"))
+    ]
+
+
+@cache.command(
+    "warm",
+    help="""\
+Download schemas into the cache, along with all of the remote '$ref's which
+they use, so that they can be used later with '--offline'.
+""",
+)
+@click.help_option("-h", "--help")
+@click.option(
+    "--catalog",
+    is_flag=True,
+    help="Download every schema in the catalog of builtin schemas.",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    help="The number of schemas to download at once. Defaults to 4.",
+    type=JobCount(),
+    default=4,
+)
+@click.argument("urls", nargs=-1)
+def warm(*, catalog: bool, jobs: int, urls: tuple[str, ...]) -> None:
+    for url in urls:
+        if not url.startswith(("http://", "https://")):
+            raise click.UsageError(f"'{url}' is not an http or https URL")
+    all_urls = list(urls)
+    if catalog:
+        all_urls.extend(entry["url"] for entry in SCHEMA_CATALOG.values())
+    if not all_urls:
+        raise click.UsageError("pass schema URLs to download, or use '--catalog'")
+    # dedupe, keeping the order given
+    all_urls = list(dict.fromkeys(all_urls))
+
+    failed = False
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(_warm_url, url) for url in all_urls]
+        for url, future in zip(all_urls, futures):
+            try:
+                failed_refs = future.result()
+            except (FailedDownloadError, SchemaParseError, ParseError) as e:
+                click.echo(f"failed to cache {url}: {e}", err=True)
+                failed = True
+                continue
+            for ref_url in failed_refs:
+                click.echo(f"failed to cache {ref_url}, used by {url}", err=True)
+                failed = True
+            click.echo(f"cached {url}")
+    if failed:
+        raise click.exceptions.Exit(1)
+
+
+@cache.command("clear", help="Remove all cached files.")
+@click.help_option("-h", "--help")
+@click.option(
+    "--all",
+    "clear_all",
+    is_flag=True,
+    help=(
+        "Also remove cached validation results and records of verified schemas, "
+        "not only downloads."
+    ),
+)
+def clear(*, clear_all: bool) -> None:
+    if clear_all:
+        base_dir = _resolve_cache_dir("")
+        if base_dir is None:
+            raise click.UsageError("no cache dir could be found for this platform")
+        shutil.rmtree(base_dir, ignore_errors=True)
+        click.echo(f"removed {os.path.normpath(base_dir)}")
+        return
+
+    removed = 0
+    for cache_dir in _download_cache_dirs().values():
+        for entry in iter_cache_entries(cache_dir):
+            entry.remove()
+            removed += 1
+    click.echo(f"removed {removed} cached files")
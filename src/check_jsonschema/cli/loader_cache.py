@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import collections
+import typing as t
+
+from ..schema_loader import SchemaLoaderBase
+
+# the number of schema loaders kept, beyond which the least recently used is dropped
+DEFAULT_MAX_LOADERS = 32
+
+
+class SchemaLoaderCache:
+    """
+    A collection of schema loaders which is kept across many runs of the CLI within
+    one process, so that the validators which they build stay warm.
+
+    This is used by 'check-jsonschema serve'. When a cache is present on the click
+    context, schema loaders are taken from it rather than built from scratch.
+
+    A loader is only reused while the schema and the documents which it references
+    are unchanged, and are within the download cache TTL if they are remote.
+    Otherwise it is replaced by a new one.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_LOADERS) -> None:
+        self._max_size = max_size
+        self._loaders: collections.OrderedDict[t.Hashable, SchemaLoaderBase] = (
+            collections.OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._loaders)
+
+    def get_or_build(
+        self, key: t.Hashable, build: t.Callable[[], SchemaLoaderBase]
+    ) -> SchemaLoaderBase:
+        loader = self._loaders.pop(key, None)
+        if loader is None or not loader.is_current():
+            loader = build()
+        # keep the most recently used loaders at the end
+        self._loaders[key] = loader
+        while len(self._loaders) > self._max_size:
+            self._loaders.popitem(last=False)
+        return loader
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import importlib
 import os
+import sys
 import textwrap
 import typing as t
 
@@ -14,6 +16,7 @@ from ..instance_loader import InstanceLoader
 from ..parsers import SUPPORTED_FILE_FORMATS
 from ..regex_variants import RegexImplementation, RegexVariantName
 from ..reporter import REPORTER_BY_NAME, Reporter
+from ..result_cache import ResultCache
 from ..schema_loader import (
     BuiltinSchemaLoader,
     MetaSchemaLoader,
@@ -21,7 +24,16 @@ from ..schema_loader import (
     SchemaLoaderBase,
 )
 from ..transforms import TRANSFORM_LIBRARY
-from .param_types import CommaDelimitedList, LazyBinaryReadFile, ValidatorClassName
+from ..utils import filename2path
+from .loader_cache import SchemaLoaderCache
+from .param_types import (
+    CommaDelimitedList,
+    Duration,
+    JobCount,
+    LazyBinaryReadFile,
+    ParserBackendChoice,
+    ValidatorClassName,
+)
 from .parse_result import ParseResult, SchemaLoadingMode
 
 BUILTIN_SCHEMA_NAMES = [f"vendor.{k}" for k in SCHEMA_CATALOG.keys()] + [
@@ -57,8 +69,44 @@ def pretty_helptext_list(values: list[str] | tuple[str, ...]) -> str:
     )
 
 
+class _MainCommand(click.Command):
+    """
+    The 'check-jsonschema' command, which also dispatches to subcommands when the
+    first argument is exactly the name of one.
+
+    Only the first argument is considered, so a subcommand is never run when any
+    option comes before it, and an instance file named like a subcommand can still
+    be checked, e.g. as './serve' or after an option.
+
+    Subcommands are given as import paths and loaded only when they are used.
+    """
+
+    subcommands: dict[str, str] = {
+        "cache": "check_jsonschema.cli.cache_command:cache",
+        "serve": "check_jsonschema.daemon.server:serve",
+    }
+
+    def main(  # type: ignore[override]
+        self,
+        args: t.Sequence[str] | None = None,
+        prog_name: str | None = None,
+        **kwargs: t.Any,
+    ) -> t.Any:
+        argv = list(sys.argv[1:] if args is None else args)
+        if argv and argv[0] in self.subcommands:
+            module_name, _, attr = self.subcommands[argv[0]].partition(":")
+            subcommand = getattr(importlib.import_module(module_name), attr)
+            return subcommand.main(
+                args=argv[1:],
+                prog_name=f"{prog_name or self.name} {argv[0]}",
+                **kwargs,
+            )
+        return super().main(args, prog_name, **kwargs)
+
+
 @click.command(
     "check-jsonschema",
+    cls=_MainCommand,
     help="""\
 Check JSON and YAML files against a JSON Schema.
 
@@ -84,7 +132,17 @@ The '--builtin-schema' flag supports the following schema names:
 \b
 The '--disable-formats' flag supports the following formats:
 """
-    + pretty_helptext_list(KNOWN_FORMATS),
+    + pretty_helptext_list(KNOWN_FORMATS)
+    + """\
+
+\b
+Subcommands are run with 'check-jsonschema SUBCOMMAND', when the subcommand
+is the first argument:
+    cache  |  list, prune, warm, or clear the download cache
+    serve  |  run a server which keeps validators warm between checks
+To check an instance file named like a subcommand, pass it after an option or
+as a path such as './serve'.
+""",
 )
 @click.help_option("-h", "--help")
 @click.version_option()
@@ -128,6 +186,54 @@ The '--disable-formats' flag supports the following formats:
 @click.option(
     "--cache-filename", help="Deprecated. This option no longer has any effect."
 )
+@click.option(
+    "--result-cache",
+    is_flag=True,
+    help=(
+        "Cache validation results on disk, keyed by the content of each instance "
+        "file. Unchanged files are not parsed or validated again."
+    ),
+)
+@click.option(
+    "--cache-ttl",
+    help=(
+        "Use cached downloads fetched less than this long ago without checking "
+        "for updates, e.g. '30m' or '1h'."
+    ),
+    type=Duration(),
+)
+@click.option(
+    "--offline",
+    is_flag=True,
+    help=(
+        "Never download schemas or '$ref's, and only use cached copies. "
+        "Fail if a document has not been cached."
+    ),
+)
+@click.option(
+    "--prefetch-refs",
+    is_flag=True,
+    help=(
+        "Download all remote '$ref's of the schema concurrently before validating, "
+        "rather than one at a time as they are used."
+    ),
+)
+@click.option(
+    "--validator-snapshots",
+    is_flag=True,
+    help=(
+        "Store the schema and all of its '$ref's in the cache dir after loading "
+        "them, and reuse them on later runs without parsing or downloading."
+    ),
+)
+@click.option(
+    "--recheck-schema",
+    is_flag=True,
+    help=(
+        "Always check the schema under its metaschema, even if it passed the "
+        "check in an earlier run."
+    ),
+)
 @click.option(
     "--disable-formats",
     multiple=True,
@@ -166,6 +272,32 @@ The '--disable-formats' flag supports the following formats:
     help="Force a file type to use when parsing instance files",
     type=click.Choice(SUPPORTED_FILE_FORMATS, case_sensitive=True),
 )
+@click.option(
+    "--multi-document-yaml",
+    help=(
+        "Check each document of a YAML instance file, separated by '---', as a "
+        "separate instance. Documents are read and checked one at a time."
+    ),
+    is_flag=True,
+)
+@click.option(
+    "--stream-json-arrays",
+    help=(
+        "Check the elements of a JSON instance file which holds one array one at a "
+        "time, as they are parsed, if the schema allows it. For very large files."
+    ),
+    is_flag=True,
+)
+@click.option(
+    "--parser-backend",
+    help=(
+        "Select the parser used for instance files of a filetype, in the form "
+        "'FILETYPE=NAME', e.g. 'json=stdlib'. Backends can be provided by "
+        "installed plugins. May be given once for each filetype."
+    ),
+    multiple=True,
+    type=ParserBackendChoice(),
+)
 @click.option(
     "--traceback-mode",
     help=(
@@ -202,6 +334,32 @@ The '--disable-formats' flag supports the following formats:
     ),
     type=ValidatorClassName(),
 )
+@click.option(
+    "-j",
+    "--jobs",
+    help=(
+        "The number of processes to use for parsing and checking instance files. "
+        "Pass 'auto' to use one process per CPU."
+    ),
+    type=JobCount(),
+    default=1,
+    show_default=True,
+)
+@click.option(
+    "--fail-fast",
+    is_flag=True,
+    help="Stop checking files after the first file which fails.",
+)
+@click.option(
+    "--max-errors",
+    help="Stop checking once this many validation errors have been found.",
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "--max-errors-per-file",
+    help="Report at most this many validation errors for each file.",
+    type=click.IntRange(min=1),
+)
 @click.option(
     "-o",
     "--output-format",
@@ -243,16 +401,29 @@ def main(
     check_metaschema: bool,
     no_cache: bool,
     cache_filename: str | None,
+    result_cache: bool,
+    cache_ttl: float | None,
+    offline: bool,
+    prefetch_refs: bool,
+    validator_snapshots: bool,
+    recheck_schema: bool,
     disable_formats: tuple[list[str], ...],
     format_regex: t.Literal["python", "nonunicode", "default"] | None,
     regex_variant: t.Literal["python", "nonunicode", "default"] | None,
-    default_filetype: t.Literal["json", "yaml", "toml", "json5"],
-    force_filetype: t.Literal["json", "yaml", "toml", "json5"] | None,
+    default_filetype: t.Literal["json", "jsonl", "yaml", "toml", "json5"],
+    force_filetype: t.Literal["json", "jsonl", "yaml", "toml", "json5"] | None,
+    multi_document_yaml: bool,
+    stream_json_arrays: bool,
+    parser_backend: tuple[tuple[str, str], ...],
     traceback_mode: t.Literal["full", "short"],
     data_transform: t.Literal["azure-pipelines", "gitlab-ci"] | None,
     fill_defaults: bool,
     validator_class: type[jsonschema.protocols.Validator] | None,
-    output_format: t.Literal["text", "json"],
+    jobs: int,
+    fail_fast: bool,
+    max_errors: int | None,
+    max_errors_per_file: int | None,
+    output_format: t.Literal["text", "json", "text-stream", "ndjson"],
     verbose: int,
     quiet: int,
     instancefiles: tuple[t.IO[bytes], ...],
@@ -276,10 +447,24 @@ def main(
         args.disable_formats = normalized_disable_formats
 
     args.disable_cache = no_cache
+    args.cache_ttl = cache_ttl
+    args.set_offline(offline)
+    args.result_cache = result_cache
+    args.prefetch_refs = prefetch_refs
+    args.validator_snapshots = validator_snapshots
+    args.recheck_schema = recheck_schema
     args.default_filetype = default_filetype
     args.force_filetype = force_filetype
+    args.multi_document_yaml = multi_document_yaml
+    args.set_stream_json_arrays(stream_json_arrays)
+    args.set_parser_backends(parser_backend)
     args.fill_defaults = fill_defaults
+    args.set_jobs(jobs)
+    args.fail_fast = fail_fast
+    args.max_errors = max_errors
+    args.max_errors_per_file = max_errors_per_file
     if data_transform is not None:
+        args.data_transform_name = data_transform
         args.data_transform = TRANSFORM_LIBRARY[data_transform]
 
     # verbosity behavior:
@@ -296,17 +481,65 @@ def main(
 # separate parsing from execution for simpler mocking for unit tests
 
 
+def _schema_loader_cache_key(args: ParseResult) -> t.Hashable:
+    schema_location = args.schema_path
+    # local schemas are keyed by their absolute paths, so that the same schema is
+    # found from any working directory
+    # a loader whose schema or references have changed is replaced by the cache
+    if (
+        args.schema_mode == SchemaLoadingMode.filepath
+        and args.schema_path is not None
+        and args.schema_path != "-"
+        and not args.schema_path.startswith(("http://", "https://"))
+    ):
+        schema_location = str(filename2path(args.schema_path).absolute())
+    return (
+        args.schema_mode,
+        schema_location,
+        args.base_uri,
+        args.disable_cache,
+        args.recheck_schema,
+        args.prefetch_refs,
+        args.validator_snapshots,
+        args.cache_ttl,
+        args.offline,
+        args.validator_class,
+    )
+
+
 def build_schema_loader(args: ParseResult) -> SchemaLoaderBase:
+    ctx = click.get_current_context(silent=True)
+    loader_cache = ctx.find_object(SchemaLoaderCache) if ctx is not None else None
+    if loader_cache is not None:
+        return loader_cache.get_or_build(
+            _schema_loader_cache_key(args), lambda: _build_schema_loader(args)
+        )
+    return _build_schema_loader(args)
+
+
+def _build_schema_loader(args: ParseResult) -> SchemaLoaderBase:
     if args.schema_mode == SchemaLoadingMode.metaschema:
         return MetaSchemaLoader(base_uri=args.base_uri)
     elif args.schema_mode == SchemaLoadingMode.builtin:
         assert args.schema_path is not None
-        return BuiltinSchemaLoader(args.schema_path, base_uri=args.base_uri)
+        return BuiltinSchemaLoader(
+            args.schema_path,
+            base_uri=args.base_uri,
+            recheck_schema=args.recheck_schema,
+            prefetch_refs=args.prefetch_refs,
+            offline=args.offline,
+            validator_snapshots=args.validator_snapshots,
+        )
     elif args.schema_mode == SchemaLoadingMode.filepath:
         assert args.schema_path is not None
         return SchemaLoader(
             args.schema_path,
             disable_cache=args.disable_cache,
+            recheck_schema=args.recheck_schema,
+            prefetch_refs=args.prefetch_refs,
+            cache_ttl=args.cache_ttl,
+            offline=args.offline,
+            validator_snapshots=args.validator_snapshots,
             base_uri=args.base_uri,
             validator_class=args.validator_class,
         )
@@ -320,6 +553,8 @@ def build_instance_loader(args: ParseResult) -> InstanceLoader:
         default_filetype=args.default_filetype,
         force_filetype=args.force_filetype,
         data_transform=args.data_transform,
+        multi_document_yaml=args.multi_document_yaml,
+        parser_backends=args.parser_backends,
     )
 
 
@@ -328,6 +563,21 @@ def build_reporter(args: ParseResult) -> Reporter:
     return cls(verbosity=args.verbosity)
 
 
+def build_result_cache(args: ParseResult) -> ResultCache | None:
+    if not args.result_cache:
+        return None
+    return ResultCache(
+        settings={
+            "regex_variant": args.regex_variant.value,
+            "formats_enabled": not args.disable_all_formats,
+            "disabled_formats": sorted(args.disable_formats),
+            "data_transform": args.data_transform_name,
+            "fill_defaults": args.fill_defaults,
+            "parser_backends": sorted(args.parser_backends.items()),
+        }
+    )
+
+
 def build_checker(args: ParseResult) -> SchemaChecker:
     schema_loader = build_schema_loader(args)
     instance_loader = build_instance_loader(args)
@@ -340,6 +590,12 @@ def build_checker(args: ParseResult) -> SchemaChecker:
         regex_impl=RegexImplementation(args.regex_variant),
         traceback_mode=args.traceback_mode,
         fill_defaults=args.fill_defaults,
+        jobs=args.jobs,
+        result_cache=build_result_cache(args),
+        fail_fast=args.fail_fast,
+        max_errors=args.max_errors,
+        max_errors_per_file=args.max_errors_per_file,
+        stream_json_arrays=args.stream_json_arrays,
     )
 
 
@@ -11,13 +11,16 @@ import click
 import jsonschema
 from click._compat import open_stream
 
+from ..parsers import backends
+
 C = t.TypeVar("C", bound=t.Callable[..., t.Any])
 
 
 def _shim_click_8_2_get_metavar(func: C) -> C:
     @functools.wraps(func)
     def wrapper(*args: t.Any, **kwargs: t.Any) -> None:
-        if len(args) > 1 or "ctx" in kwargs:
+        # called as get_metavar(param, ctx) on click 8.2+, and get_metavar(param) before
+        if len(args) > 2 or "ctx" in kwargs:
             return func(*args, **kwargs)
         return func(*args, ctx=None, **kwargs)
 
@@ -67,6 +70,150 @@ class CommaDelimitedList(click.ParamType):
         return resolved
 
 
+class JobCount(click.ParamType):
+    name = "jobs"
+
+    @_shim_click_8_2_get_metavar
+    def get_metavar(self, param: click.Parameter, ctx: click.Context | None) -> str:
+        return "[N|auto]"
+
+    def convert(
+        self, value: str | int, param: click.Parameter | None, ctx: click.Context | None
+    ) -> int:
+        """
+        Convert a job count, where 'auto' means "one job per available CPU".
+        """
+        if isinstance(value, int):
+            count = value
+        elif value == "auto":
+            count = os.cpu_count() or 1
+        else:
+            try:
+                count = int(value)
+            except ValueError:
+                self.fail(
+                    f"'{value}' is not a valid job count, use an integer or 'auto'",
+                    param,
+                    ctx,
+                )
+        if count < 1:
+            self.fail(f"the job count must be at least 1, got {count}", param, ctx)
+        return count
+
+
+class Duration(click.ParamType):
+    name = "duration"
+
+    _UNITS = {"s": 1, "m": 60, "h": 60 * 60, "d": 24 * 60 * 60}
+
+    @_shim_click_8_2_get_metavar
+    def get_metavar(self, param: click.Parameter, ctx: click.Context | None) -> str:
+        return "DURATION"
+
+    def convert(
+        self,
+        value: str | float,
+        param: click.Parameter | None,
+        ctx: click.Context | None,
+    ) -> float:
+        """
+        Convert a duration to a number of seconds.
+
+        A duration is a number with an optional unit of 's', 'm', 'h', or 'd', as in
+        '90s' or '1h'. A number without a unit is a number of seconds.
+        """
+        if isinstance(value, (int, float)):
+            seconds = float(value)
+        else:
+            number, multiplier = value.strip(), 1
+            if number and number[-1].lower() in self._UNITS:
+                number, multiplier = number[:-1], self._UNITS[number[-1].lower()]
+            try:
+                seconds = float(number) * multiplier
+            except ValueError:
+                self.fail(
+                    f"'{value}' is not a valid duration, use a number of seconds "
+                    "or a number with a unit of 's', 'm', 'h', or 'd'",
+                    param,
+                    ctx,
+                )
+        if seconds < 0:
+            self.fail(f"the duration must not be negative, got '{value}'", param, ctx)
+        return seconds
+
+
+class ByteSize(click.ParamType):
+    name = "size"
+
+    _UNITS = {"k": 1024, "m": 1024**2, "g": 1024**3}
+
+    @_shim_click_8_2_get_metavar
+    def get_metavar(self, param: click.Parameter, ctx: click.Context | None) -> str:
+        return "SIZE"
+
+    def convert(
+        self, value: str | int, param: click.Parameter | None, ctx: click.Context | None
+    ) -> int:
+        """
+        Convert a size to a number of bytes.
+
+        A size is a number with an optional unit of 'K', 'M', or 'G', as in '512K' or
+        '100M'. A number without a unit is a number of bytes.
+        """
+        if isinstance(value, int):
+            size = value
+        else:
+            number, multiplier = value.strip(), 1
+            if number and number[-1].lower() in self._UNITS:
+                number, multiplier = number[:-1], self._UNITS[number[-1].lower()]
+            try:
+                size = int(float(number) * multiplier)
+            except ValueError:
+                self.fail(
+                    f"'{value}' is not a valid size, use a number of bytes "
+                    "or a number with a unit of 'K', 'M', or 'G'",
+                    param,
+                    ctx,
+                )
+        if size < 0:
+            self.fail(f"the size must not be negative, got '{value}'", param, ctx)
+        return size
+
+
+class ParserBackendChoice(click.ParamType):
+    name = "parser_backend"
+
+    @_shim_click_8_2_get_metavar
+    def get_metavar(self, param: click.Parameter, ctx: click.Context | None) -> str:
+        return "FILETYPE=NAME"
+
+    def convert(
+        self,
+        value: str | tuple[str, str],
+        param: click.Parameter | None,
+        ctx: click.Context | None,
+    ) -> tuple[str, str]:
+        """
+        Convert 'FILETYPE=NAME' to a pair of a filetype and the name of an available
+        parser backend for it.
+        """
+        if isinstance(value, tuple):
+            return value
+        filetype, sep, backend_name = value.partition("=")
+        filetype, backend_name = filetype.strip(), backend_name.strip()
+        if not sep or not filetype or not backend_name:
+            self.fail(
+                f"'{value}' is not a valid parser backend, use 'FILETYPE=NAME'",
+                param,
+                ctx,
+            )
+        try:
+            backends.get_backend(filetype, backend_name)
+        except backends.UnknownParserBackendError as e:
+            self.fail(str(e), param, ctx)
+        return (filetype, backend_name)
+
+
 class ValidatorClassName(click.ParamType):
     name = "validator"
 
@@ -27,14 +27,32 @@ class ParseResult:
         # cache controls
         self.disable_cache: bool = False
         self.cache_filename: str | None = None
+        self.result_cache: bool = False
+        self.recheck_schema: bool = False
+        self.prefetch_refs: bool = False
+        self.validator_snapshots: bool = False
+        self.cache_ttl: float | None = None
+        self.offline: bool = False
         # filetype detection (JSON, YAML, TOML, etc)
         self.default_filetype: str = "json"
         self.force_filetype: str | None = None
+        self.multi_document_yaml: bool = False
+        self.stream_json_arrays: bool = False
+        # the parser backend selected for each filetype, if not the default
+        self.parser_backends: dict[str, str] = {}
         # data-transform (for Azure Pipelines and potentially future transforms)
+        self.data_transform_name: str | None = None
         self.data_transform: Transform | None = None
         # validation behavioral controls
         self.validator_class: type[jsonschema.protocols.Validator] | None = None
         self.fill_defaults: bool = False
+        # parallelism: the number of processes used to check instances
+        self.jobs: int = 1
+        # early termination: stop checking once a failure or number of errors
+        # is reached
+        self.fail_fast: bool = False
+        self.max_errors: int | None = None
+        self.max_errors_per_file: int | None = None
         # regex format options
         self.disable_all_formats: bool = False
         self.disable_formats: tuple[str, ...] = ()
@@ -93,6 +111,33 @@ class ParseResult:
             )
         self.validator_class = validator_class
 
+    def set_jobs(self, jobs: int) -> None:
+        if jobs > 1 and self.schema_path == "-":
+            raise click.UsageError(
+                "--jobs cannot be used when the schema is read from stdin"
+            )
+        self.jobs = jobs
+
+    def set_stream_json_arrays(self, stream_json_arrays: bool) -> None:
+        if stream_json_arrays and self.schema_mode == SchemaLoadingMode.metaschema:
+            raise click.UsageError(
+                "--stream-json-arrays cannot be used with --check-metaschema"
+            )
+        self.stream_json_arrays = stream_json_arrays
+
+    def set_parser_backends(self, parser_backends: t.Sequence[tuple[str, str]]) -> None:
+        for filetype, backend_name in parser_backends:
+            if self.parser_backends.get(filetype, backend_name) != backend_name:
+                raise click.UsageError(
+                    f"--parser-backend was given more than one backend for {filetype}"
+                )
+            self.parser_backends[filetype] = backend_name
+
+    def set_offline(self, offline: bool) -> None:
+        if offline and self.disable_cache:
+            raise click.UsageError("--offline cannot be used with --no-cache")
+        self.offline = offline
+
     @property
     def format_opts(self) -> FormatOptions:
         return FormatOptions(
@@ -0,0 +1,7 @@
+"""
+A long-lived server which keeps schema validators warm, and a thin client for it.
+
+The server is started with 'check-jsonschema serve' and the client is
+'check-jsonschema-client'. The client takes the same arguments as
+'check-jsonschema' and only uses the standard library, so that it starts quickly.
+"""
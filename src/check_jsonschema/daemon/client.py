@@ -0,0 +1,77 @@
+"""
+A thin client for 'check-jsonschema serve'.
+
+Usage is the same as 'check-jsonschema', with the server's socket given either with
+a leading '--socket PATH' or with the CHECK_JSONSCHEMA_SOCKET environment variable.
+The arguments are sent to the server, which runs the check in its own process and
+sends back the output and exit code.
+
+If no server can be reached, or if stdin is used, the check runs locally instead.
+
+This module must only use the standard library, so that the client starts quickly.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import sys
+import typing as t
+
+from . import protocol
+
+SOCKET_ENV_VAR = "CHECK_JSONSCHEMA_SOCKET"
+
+
+def _split_socket_arg(argv: list[str]) -> tuple[str | None, list[str]]:
+    if len(argv) > 1 and argv[0] == "--socket":
+        return argv[1], argv[2:]
+    if argv and argv[0].startswith("--socket="):
+        return argv[0].partition("=")[2], argv[1:]
+    return os.getenv(SOCKET_ENV_VAR), argv
+
+
+def _color_args() -> list[str]:
+    # the server cannot see the client's terminal, so decide on color here
+    # any explicit '--color' option given by the user comes later and takes priority
+    if "NO_COLOR" in os.environ:
+        return ["--color", "never"]
+    if sys.stdout.isatty():
+        return ["--color", "always"]
+    return []
+
+
+def request_check(socket_path: str, argv: list[str], cwd: str) -> dict[str, t.Any]:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        with sock.makefile("rwb") as stream:
+            protocol.write_message(stream, {"argv": argv, "cwd": cwd})
+            return protocol.read_message(stream)
+
+
+def _run_locally(argv: list[str]) -> t.NoReturn:
+    from check_jsonschema import main as cli_main
+
+    cli_main(args=argv, prog_name="check-jsonschema")
+    sys.exit(0)
+
+
+def main(argv: list[str] | None = None) -> t.NoReturn:
+    socket_path, check_argv = _split_socket_arg(sys.argv[1:] if argv is None else argv)
+    if socket_path is None or not hasattr(socket, "AF_UNIX") or "-" in check_argv:
+        _run_locally(check_argv)
+
+    try:
+        response = request_check(socket_path, _color_args() + check_argv, os.getcwd())
+    except (OSError, protocol.ProtocolError):
+        _run_locally(check_argv)
+
+    sys.stdout.write(response["stdout"])
+    sys.stdout.flush()
+    sys.stderr.write(response["stderr"])
+    sys.stderr.flush()
+    sys.exit(response["exit_code"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+The wire protocol between the server and client.
+
+Each message is a JSON document, preceded by its length as a 4 byte big-endian
+integer. A request holds the arguments and working directory of the client, and a
+response holds the exit code and output of the check.
+
+This module must only use the standard library.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import typing as t
+
+_HEADER = struct.Struct("!I")
+
+
+class ProtocolError(Exception):
+    pass
+
+
+class _ReadableStream(t.Protocol):
+    def read(self, size: int, /) -> bytes: ...
+
+
+class _WritableStream(t.Protocol):
+    def write(self, data: bytes, /) -> int: ...
+
+    def flush(self) -> None: ...
+
+
+def write_message(stream: _WritableStream, message: dict[str, t.Any]) -> None:
+    data = json.dumps(message).encode()
+    stream.write(_HEADER.pack(len(data)) + data)
+    stream.flush()
+
+
+def _read_exact(stream: _ReadableStream, size: int) -> bytes:
+    data = stream.read(size)
+    if len(data) != size:
+        raise ProtocolError("connection closed before a full message was read")
+    return data
+
+
+def read_message(stream: _ReadableStream) -> dict[str, t.Any]:
+    (size,) = _HEADER.unpack(_read_exact(stream, _HEADER.size))
+    message = json.loads(_read_exact(stream, size))
+    if not isinstance(message, dict):
+        raise ProtocolError("message was not a JSON object")
+    return message
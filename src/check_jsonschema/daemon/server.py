@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import contextlib
+import io
+import os
+import socket
+import socketserver
+import traceback
+import typing as t
+
+import click
+
+from ..cli.loader_cache import SchemaLoaderCache
+from ..cli.main_command import main as cli_main
+from . import protocol
+
+
+@contextlib.contextmanager
+def _working_directory(path: str) -> t.Iterator[None]:
+    original = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(original)
+
+
+def run_check(
+    argv: list[str], cwd: str, loader_cache: SchemaLoaderCache
+) -> dict[str, t.Any]:
+    """
+    Run 'check-jsonschema' in this process, capturing its output and exit code.
+
+    Schema loaders are taken from the given cache, so that validators built by
+    earlier checks are reused.
+    """
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    with (
+        _working_directory(cwd),
+        contextlib.redirect_stdout(stdout),
+        contextlib.redirect_stderr(stderr),
+    ):
+        try:
+            exit_code = cli_main.main(
+                args=argv,
+                prog_name="check-jsonschema",
+                standalone_mode=False,
+                obj=loader_cache,
+            )
+        except click.ClickException as e:
+            e.show()
+            exit_code = e.exit_code
+        except click.Abort:
+            click.echo("Aborted!", err=True)
+            exit_code = 1
+        except Exception:
+            traceback.print_exc()
+            exit_code = 1
+    return {
+        "exit_code": exit_code or 0,
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+    }
+
+
+class _CheckRequestHandler(socketserver.StreamRequestHandler):
+    server: CheckServer
+
+    def handle(self) -> None:
+        try:
+            request = protocol.read_message(self.rfile)
+        except (protocol.ProtocolError, ValueError):
+            return
+        response = run_check(
+            list(request["argv"]), str(request["cwd"]), self.server.loader_cache
+        )
+        protocol.write_message(self.wfile, response)
+
+
+if hasattr(socketserver, "UnixStreamServer"):
+
+    class CheckServer(socketserver.UnixStreamServer):
+        """
+        Serve checks over a Unix socket, one at a time.
+
+        Requests are handled serially because each one changes the working
+        directory and captures stdout and stderr, all of which are process-wide.
+        """
+
+        def __init__(self, socket_path: str) -> None:
+            self.loader_cache = SchemaLoaderCache()
+            _remove_stale_socket(socket_path)
+            super().__init__(socket_path, _CheckRequestHandler)
+            # only the user running the server may send it requests
+            os.chmod(socket_path, 0o600)
+
+        def server_close(self) -> None:
+            super().server_close()
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self.server_address)  # type: ignore[arg-type]
+
+
+def _remove_stale_socket(socket_path: str) -> None:
+    if not os.path.exists(socket_path):
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except ConnectionRefusedError:
+            os.remove(socket_path)
+            return
+    raise click.UsageError(f"a server is already listening on {socket_path}")
+
+
+@click.command(
+    "serve",
+    help="""\
+Run a server which checks files on behalf of 'check-jsonschema-client'.
+
+The server keeps schemas and validators loaded between checks, so that repeated
+checks with the same schema skip startup and schema loading costs.
+""",
+)
+@click.help_option("-h", "--help")
+@click.option(
+    "--socket",
+    "socket_path",
+    required=True,
+    help="The path of the Unix socket on which to listen.",
+    type=click.Path(dir_okay=False),
+)
+def serve(*, socket_path: str) -> None:
+    if not hasattr(socketserver, "UnixStreamServer"):
+        raise click.UsageError("'serve' requires Unix socket support")
+
+    with CheckServer(socket_path) as server:
+        click.echo(f"check-jsonschema is listening on {socket_path}", err=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
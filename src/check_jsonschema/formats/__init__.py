@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-import copy
+import functools
+import types
+import typing as t
 
 import jsonschema
 import jsonschema.validators
@@ -48,6 +50,17 @@ class FormatOptions:
         self.regex_impl = regex_impl
         self.disabled_formats = disabled_formats
 
+    def _key(self) -> tuple[bool, RegexImplementation, frozenset[str]]:
+        return (self.enabled, self.regex_impl, frozenset(self.disabled_formats))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FormatOptions):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
 
 def get_base_format_checker(schema_dialect: str | None) -> jsonschema.FormatChecker:
     # mypy does not consider a class whose instances match a protocol to match
@@ -64,6 +77,44 @@ def get_base_format_checker(schema_dialect: str | None) -> jsonschema.FormatChec
     return validator_class.FORMAT_CHECKER
 
 
+class _SharedFormatChecker(jsonschema.FormatChecker):
+    """
+    A format checker which is shared by all of the validators which use the same
+    format options, and so cannot be modified.
+    """
+
+    def __init__(self, checkers: dict[str, t.Any]) -> None:
+        self.checkers = types.MappingProxyType(checkers)  # type: ignore[assignment]
+
+    def checks(self, format: str, raises: t.Any = ()) -> t.NoReturn:
+        raise TypeError("shared format checkers cannot be modified")
+
+
+@functools.lru_cache
+def _build_format_checker(
+    schema_dialect: str | None,
+    regex_impl: RegexImplementation,
+    disabled_formats: frozenset[str],
+    custom_formats: bool,
+) -> jsonschema.FormatChecker:
+    # copy the checks of the schema-derived format checker, for safe modification
+    checkers = dict(get_base_format_checker(schema_dialect).checkers)
+
+    # replace the regex check
+    checkers["regex"] = (regex_impl.check_format, ())
+
+    # add other custom format checks
+    if custom_formats:
+        checkers["date-time"] = (validate_rfc3339, ())
+        checkers["time"] = (validate_time, ())
+
+    # remove the disabled checks, which may include the regex check
+    for checkname in disabled_formats:
+        checkers.pop(checkname, None)
+
+    return _SharedFormatChecker(checkers)
+
+
 def make_format_checker(
     opts: FormatOptions,
     schema_dialect: str | None = None,
@@ -71,32 +122,16 @@ def make_format_checker(
     if not opts.enabled:
         return None
 
-    # customize around regex checking first
-    checker = format_checker_for_regex_impl(opts.regex_impl)
-
-    # add other custom format checks
-    checker.checks("date-time")(validate_rfc3339)
-    checker.checks("time")(validate_time)
-
-    # remove the disabled checks, which may include the regex check
-    for checkname in opts.disabled_formats:
-        if checkname not in checker.checkers:
-            continue
-        del checker.checkers[checkname]
-
-    return checker
+    # the checks of the latest draft are used for all dialects
+    #
+    # format checkers are built once per set of options and shared, so the
+    # returned checker must not be modified
+    return _build_format_checker(
+        None, opts.regex_impl, frozenset(opts.disabled_formats), True
+    )
 
 
 def format_checker_for_regex_impl(
     regex_impl: RegexImplementation, schema_dialect: str | None = None
 ) -> jsonschema.FormatChecker:
-    # convert to a schema-derived format checker, and copy it
-    # for safe modification
-    base_checker = get_base_format_checker(schema_dialect)
-    checker = copy.deepcopy(base_checker)
-
-    # replace the regex check
-    del checker.checkers["regex"]
-    checker.checks("regex")(regex_impl.check_format)
-
-    return checker
+    return _build_format_checker(schema_dialect, regex_impl, frozenset(), False)
@@ -11,6 +11,8 @@ _EXTENSION_MAP = {
     "json": "json",
     "jsonld": "json",
     "geojson": "json",
+    "jsonl": "jsonl",
+    "ndjson": "jsonl",
     "yaml": "yaml",
     "yml": "yaml",
     "ymlld": "yaml",
@@ -5,7 +5,8 @@ import typing as t
 
 from check_jsonschema.cli.param_types import CustomLazyFile
 
-from .parsers import ParseError, ParserSet
+from .identify_filetype import path_to_type
+from .parsers import FailedFileLoadError, ParseError, ParserSet, json_stream
 from .transforms import Transform
 
 
@@ -16,44 +17,181 @@ class InstanceLoader:
         default_filetype: str = "json",
         force_filetype: str | None = None,
         data_transform: Transform | None = None,
+        multi_document_yaml: bool = False,
+        parser_backends: t.Mapping[str, str] | None = None,
     ) -> None:
         self._files = files
         self._default_filetype = default_filetype
         self._force_filetype = force_filetype
+        self._has_data_transform = data_transform is not None
         self._data_transform = (
             data_transform if data_transform is not None else Transform()
         )
 
         self._parsers = ParserSet(
-            modify_yaml_implementation=self._data_transform.modify_yaml_implementation
+            modify_yaml_implementation=self._data_transform.modify_yaml_implementation,
+            multi_document_yaml=multi_document_yaml,
+            parser_backends=parser_backends,
         )
 
+    def __getstate__(self) -> dict[str, t.Any]:
+        # open file handles are not sent along when an InstanceLoader is pickled
+        # for use in a worker process; workers are given paths to load instead
+        state = self.__dict__.copy()
+        state["_files"] = ()
+        return state
+
+    @property
+    def files(self) -> t.Sequence[t.IO[bytes] | CustomLazyFile]:
+        return self._files
+
     def iter_files(self) -> t.Iterator[tuple[str, ParseError | t.Any]]:
         for file in self._files:
-            if hasattr(file, "name"):
-                name = file.name
-            # allowing for BytesIO to be special-cased here is useful for
-            # simpler test setup, since this is what tests will pass and we naturally
-            # support it here
-            elif isinstance(file, io.BytesIO) or file.fileno() == 0:
-                name = "<stdin>"
-            else:
-                raise ValueError(f"File {file} has no name attribute")
-
-            try:
-                if isinstance(file, CustomLazyFile):
-                    stream: t.IO[bytes] = t.cast(t.IO[bytes], file.open())
-                else:
-                    stream = file
-
-                try:
-                    data: t.Any = self._parsers.parse_data_with_path(
-                        stream, name, self._default_filetype, self._force_filetype
-                    )
-                except ParseError as err:
-                    data = err
-                else:
-                    data = self._data_transform(data)
-            finally:
+            yield self.load_file(file)
+
+    def get_name(self, file: t.IO[bytes] | CustomLazyFile) -> str:
+        return _get_name(file)
+
+    def load_file(
+        self, file: t.IO[bytes] | CustomLazyFile
+    ) -> tuple[str, ParseError | t.Any]:
+        name = _get_name(file)
+        try:
+            data = self.parse_data(name, _open_stream(file))
+        finally:
+            file.close()
+        return (name, data)
+
+    def is_record_file(self, file: t.IO[bytes] | CustomLazyFile) -> bool:
+        """
+        Whether a file holds many instances, such as a JSON Lines file, which are
+        loaded with `iter_records` rather than `load_file`.
+        """
+        return self._parsers.is_record_file(
+            _get_name(file), self._default_filetype, self._force_filetype
+        )
+
+    def iter_records(
+        self, file: t.IO[bytes] | CustomLazyFile
+    ) -> t.Iterator[tuple[str, ParseError | t.Any, bool]]:
+        """
+        Load the instances in a file one at a time, as they are read.
+
+        Each instance is named after the file and its place in it, as in
+        'events.jsonl:3' for a line or 'manifests.yaml[2]' for a YAML document,
+        and is given along with whether any more instances follow it.
+        """
+        name = self.get_name(file)
+        try:
+            for record_name, record, more in self._parsers.iter_records_with_path(
+                _open_stream(file), name, self._default_filetype, self._force_filetype
+            ):
+                if not isinstance(record, ParseError):
+                    record = self._data_transform(record)
+                yield (record_name, record, more)
+        finally:
+            file.close()
+
+    def can_stream_array(self, file: t.IO[bytes] | CustomLazyFile) -> bool:
+        """
+        Whether a file may be loaded with `load_array_stream`: that is, whether it
+        is a JSON file to which no data transform applies.
+        """
+        return (
+            not self._has_data_transform
+            and self.get_filetype(self.get_name(file)) == "json"
+        )
+
+    def load_array_stream(
+        self, file: t.IO[bytes] | CustomLazyFile
+    ) -> tuple[str, StreamedArray | ParseError | t.Any]:
+        """
+        Load a JSON file, giving the elements of a top-level array as a stream.
+
+        If the file does not hold an array, it is loaded as with `load_file`.
+        """
+        name = self.get_name(file)
+        stream = _open_stream(file)
+        is_array = False
+        try:
+            is_array, prefix = json_stream.read_array_start(stream)
+            if is_array:
+                # the file is closed by the StreamedArray
+                return (name, StreamedArray(name, stream, prefix, file))
+            return (name, self.parse_data(name, prefix + stream.read()))
+        finally:
+            if not is_array:
                 file.close()
-            yield (name, data)
+
+    def read_file(self, file: t.IO[bytes] | CustomLazyFile) -> tuple[str, bytes]:
+        """
+        Read the raw content of a file without parsing it.
+        The content can be parsed later with `parse_data`.
+        """
+        name = _get_name(file)
+        try:
+            content = _open_stream(file).read()
+        finally:
+            file.close()
+        return (name, content)
+
+    def get_filetype(self, name: str) -> str:
+        if self._force_filetype:
+            return self._force_filetype
+        return path_to_type(name, default_type=self._default_filetype)
+
+    def parse_data(self, name: str, data: t.IO[bytes] | bytes) -> ParseError | t.Any:
+        try:
+            parsed: t.Any = self._parsers.parse_data_with_path(
+                data, name, self._default_filetype, self._force_filetype
+            )
+        except ParseError as err:
+            return err
+        return self._data_transform(parsed)
+
+
+class StreamedArray:
+    """
+    The elements of a top-level JSON array in an instance file, which are parsed one
+    at a time as they are iterated over.
+
+    A ParseError is raised during iteration if the file is not valid JSON.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        stream: t.IO[bytes],
+        prefix: bytes,
+        file: t.IO[bytes] | CustomLazyFile,
+    ) -> None:
+        self.name = name
+        self._stream = stream
+        self._prefix = prefix
+        self._file = file
+
+    def __iter__(self) -> t.Iterator[t.Any]:
+        try:
+            yield from json_stream.iter_array_elements(self._stream, self._prefix)
+        except (json_stream.StreamDecodeError, UnicodeDecodeError) as e:
+            raise FailedFileLoadError(f"Failed to parse {self.name}") from e
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _get_name(file: t.IO[bytes] | CustomLazyFile) -> str:
+    if hasattr(file, "name"):
+        return str(file.name)
+    # allowing for BytesIO to be special-cased here is useful for
+    # simpler test setup, since this is what tests will pass and we naturally
+    # support it here
+    elif isinstance(file, io.BytesIO) or file.fileno() == 0:
+        return "<stdin>"
+    raise ValueError(f"File {file} has no name attribute")
+
+
+def _open_stream(file: t.IO[bytes] | CustomLazyFile) -> t.IO[bytes]:
+    if isinstance(file, CustomLazyFile):
+        return t.cast(t.IO[bytes], file.open())
+    return file
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import io
+import itertools
 import pathlib
 import typing as t
 
 import ruamel.yaml
 
 from ..identify_filetype import path_to_type
-from . import json5, json_, toml, yaml
+from . import backends, json5, json_, jsonl, toml, yaml
 
 _PARSER_ERRORS: set[type[Exception]] = {
     json_.JSONDecodeError,
@@ -16,9 +17,10 @@ _PARSER_ERRORS: set[type[Exception]] = {
 }
 DEFAULT_LOAD_FUNC_BY_TAG: dict[str, t.Callable[[t.IO[bytes]], t.Any]] = {
     "json": json_.load,
+    "jsonl": jsonl.load,
     "toml": toml.load,
 }
-SUPPORTED_FILE_FORMATS = ["json", "toml", "yaml"]
+SUPPORTED_FILE_FORMATS = ["json", "jsonl", "toml", "yaml"]
 if json5.ENABLED:
     SUPPORTED_FILE_FORMATS.append("json5")
     DEFAULT_LOAD_FUNC_BY_TAG["json5"] = json5.load
@@ -41,13 +43,27 @@ class FailedFileLoadError(ParseError):
     pass
 
 
+# a reader of the records in a file which holds many instances, yielding the name of
+# each record along with the parsed record or the error which prevented parsing it
+RecordReader = t.Callable[[t.IO[bytes], str], t.Iterator[tuple[str, t.Any]]]
+
+
 class ParserSet:
     def __init__(
         self,
         *,
         modify_yaml_implementation: t.Callable[[ruamel.yaml.YAML], None] | None = None,
         supported_formats: t.Sequence[str] | None = None,
+        multi_document_yaml: bool = False,
+        parser_backends: t.Mapping[str, str] | None = None,
     ) -> None:
+        # record the construction arguments so that a ParserSet can be pickled
+        # (e.g. for sending to a worker process) and rebuilt on the other side
+        self._modify_yaml_implementation = modify_yaml_implementation
+        self._supported_formats = supported_formats
+        self._multi_document_yaml = multi_document_yaml
+        self._parser_backends = dict(parser_backends or {})
+
         yaml_impl = yaml.construct_yaml_implementation()
         failover_yaml_impl = yaml.construct_yaml_implementation(pure=True)
         if modify_yaml_implementation:
@@ -64,16 +80,48 @@ class ParserSet:
                 k: v for k, v in base_by_tag.items() if k in supported_formats
             }
 
+        # files of these types hold many instances, which are checked one at a time
+        self._record_readers: dict[str, RecordReader] = {"jsonl": _read_jsonl_records}
+
+        # selected backends replace the default parsers of their filetypes
+        # raises UnknownParserBackendError if a backend is not available
+        self._error_types = LOADING_FAILURE_ERROR_TYPES
+        for filetype, backend_name in self._parser_backends.items():
+            backend = backends.get_backend(filetype, backend_name)
+            if supported_formats is not None and filetype not in supported_formats:
+                continue
+            self._by_tag[filetype] = backend.load
+            self._error_types += backend.error_types
+            # each line of a JSON Lines file is parsed by the JSON backend
+            if filetype == "json" and backend_name != backends.DEFAULT_BACKEND:
+                self._record_readers["jsonl"] = _make_jsonl_reader(
+                    backend.load, backend.error_types
+                )
+        if multi_document_yaml:
+            self._record_readers["yaml"] = _make_yaml_document_reader(
+                yaml.impl2document_iterator(yaml_impl, failover_yaml_impl)
+            )
+
+    def __getstate__(self) -> dict[str, t.Any]:
+        # the loaders are closures over YAML implementations, which cannot be
+        # pickled, so only the construction arguments are preserved
+        return {
+            "modify_yaml_implementation": self._modify_yaml_implementation,
+            "supported_formats": self._supported_formats,
+            "multi_document_yaml": self._multi_document_yaml,
+            "parser_backends": self._parser_backends,
+        }
+
+    def __setstate__(self, state: dict[str, t.Any]) -> None:
+        self.__init__(**state)  # type: ignore[misc]
+
     def get(
         self,
         path: pathlib.Path | str,
         default_filetype: str,
         force_filetype: str | None = None,
     ) -> t.Callable[[t.IO[bytes]], t.Any]:
-        if force_filetype:
-            filetype = force_filetype
-        else:
-            filetype = path_to_type(path, default_type=default_filetype)
+        filetype = _get_filetype(path, default_filetype, force_filetype)
 
         if filetype in self._by_tag:
             return self._by_tag[filetype]
@@ -100,9 +148,41 @@ class ParserSet:
             if isinstance(data, bytes):
                 data = io.BytesIO(data)
             return loadfunc(data)
-        except LOADING_FAILURE_ERROR_TYPES as e:
+        except self._error_types as e:
             raise FailedFileLoadError(f"Failed to parse {path}") from e
 
+    def is_record_file(
+        self,
+        path: pathlib.Path | str,
+        default_filetype: str,
+        force_filetype: str | None = None,
+    ) -> bool:
+        filetype = _get_filetype(path, default_filetype, force_filetype)
+        return filetype in self._record_readers and filetype in self._by_tag
+
+    def iter_records_with_path(
+        self,
+        stream: t.IO[bytes],
+        path: pathlib.Path | str,
+        default_filetype: str,
+        force_filetype: str | None = None,
+    ) -> t.Iterator[tuple[str, ParseError | t.Any, bool]]:
+        """
+        Parse the records of a file which holds many instances one at a time, as
+        they are read.
+
+        Yields the name of each record, the parsed record or the error which
+        prevented parsing it, and whether any more records follow it.
+        """
+        filetype = _get_filetype(path, default_filetype, force_filetype)
+        records = self._record_readers[filetype](stream, str(path))
+        # read one record ahead, to know whether any more follow
+        pending = next(records, None)
+        while pending is not None:
+            following = next(records, None)
+            yield (*pending, following is not None)
+            pending = following
+
     def parse_file(
         self,
         path: pathlib.Path | str,
@@ -111,3 +191,73 @@ class ParserSet:
     ) -> t.Any:
         with open(path, "rb") as fp:
             return self.parse_data_with_path(fp, path, default_filetype, force_filetype)
+
+
+def _get_filetype(
+    path: pathlib.Path | str, default_filetype: str, force_filetype: str | None
+) -> str:
+    if force_filetype:
+        return force_filetype
+    return path_to_type(path, default_type=default_filetype)
+
+
+def _failed_record_load(name: str, cause: Exception) -> FailedFileLoadError:
+    err = FailedFileLoadError(f"Failed to parse {name}")
+    err.__cause__ = cause
+    return err
+
+
+def _read_jsonl_records(
+    stream: t.IO[bytes], path: str
+) -> t.Iterator[tuple[str, t.Any]]:
+    # each line is parsed on its own, so a bad line does not stop the others
+    for lineno, line in jsonl.iter_lines(stream):
+        name = f"{path}:{lineno}"
+        record: t.Any
+        try:
+            record = json_.loads(line)
+        except jsonl.JSONDecodeError as e:
+            record = _failed_record_load(name, e)
+        yield (name, record)
+
+
+def _make_jsonl_reader(
+    load: t.Callable[[t.IO[bytes]], t.Any],
+    error_types: tuple[type[Exception], ...],
+) -> RecordReader:
+    def read(stream: t.IO[bytes], path: str) -> t.Iterator[tuple[str, t.Any]]:
+        for lineno, line in jsonl.iter_lines(stream):
+            name = f"{path}:{lineno}"
+            record: t.Any
+            try:
+                record = load(io.BytesIO(line))
+            except error_types as e:
+                record = _failed_record_load(name, e)
+            yield (name, record)
+
+    return read
+
+
+def _make_yaml_document_reader(
+    iter_documents: t.Callable[[t.IO[bytes]], t.Iterator[t.Any]],
+) -> RecordReader:
+    def read(stream: t.IO[bytes], path: str) -> t.Iterator[tuple[str, t.Any]]:
+        documents = iter_documents(stream)
+        for index in itertools.count():
+            name = f"{path}[{index}]"
+            try:
+                data = next(documents, _end_of_documents)
+            except yaml.ParseError as e:
+                # the rest of the stream cannot be read past an error
+                yield (name, _failed_record_load(name, e))
+                return
+            if data is _end_of_documents:
+                return
+            # empty documents, such as after a trailing '---', are skipped
+            if data is not None:
+                yield (name, data)
+
+    return read
+
+
+_end_of_documents = object()
@@ -0,0 +1,179 @@
+"""
+A registry of parser backends, which are the implementations used to parse
+instance files of a given filetype.
+
+Each filetype has a "default" backend, which is the parser check-jsonschema uses
+when no other backend is selected. More backends can be provided by other packages
+through the 'check_jsonschema.parser_backends' entry point group. Each entry point
+must refer to a ParserBackend, for example:
+
+.. code-block:: toml
+
+    [project.entry-points."check_jsonschema.parser_backends"]
+    msgspec = "my_package.backends:MSGSPEC_JSON_BACKEND"
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib.metadata
+import json
+import typing as t
+import warnings
+
+from . import json5, json_, toml
+
+ENTRY_POINT_GROUP = "check_jsonschema.parser_backends"
+
+# the filetypes for which a backend can be selected
+# YAML is parsed by a ruamel.yaml implementation which data transforms modify, so it
+# always uses its default parser
+BACKEND_FILETYPES = ("json", "json5", "toml")
+
+DEFAULT_BACKEND = "default"
+
+
+class ParserBackend:
+    """
+    A parser for one filetype.
+
+    :param name: The name used to select the backend, as in
+        ``--parser-backend json=NAME``
+    :param filetype: The filetype which the backend parses, one of "json", "json5",
+        or "toml"
+    :param load: A function which parses a binary stream
+    :param error_types: The types of the errors which 'load' raises for malformed
+        data, which are reported as parse errors
+    """
+
+    def __init__(
+        self,
+        name: str,
+        filetype: str,
+        load: t.Callable[[t.IO[bytes]], t.Any],
+        *,
+        error_types: tuple[type[Exception], ...] = (ValueError,),
+    ) -> None:
+        self.name = name
+        self.filetype = filetype
+        self.load = load
+        self.error_types = error_types
+
+    def __repr__(self) -> str:
+        return f"ParserBackend(name={self.name!r}, filetype={self.filetype!r})"
+
+
+class UnknownParserBackendError(ValueError):
+    pass
+
+
+def _load_stdlib_json(stream: t.IO[bytes]) -> t.Any:
+    return json.loads(stream.read())
+
+
+def _normalizing_toml_loader(
+    load: t.Callable[[t.IO[bytes]], t.Any],
+) -> t.Callable[[t.IO[bytes]], t.Any]:
+    # TOML dates and times are converted to strings, whichever backend parses them
+    def normalized_load(stream: t.IO[bytes]) -> t.Any:
+        return toml._normalize(load(stream))
+
+    return normalized_load
+
+
+def _builtin_backends() -> list[ParserBackend]:
+    backends = [
+        ParserBackend(
+            DEFAULT_BACKEND, "json", json_.load, error_types=(json_.JSONDecodeError,)
+        ),
+        ParserBackend(
+            "stdlib", "json", _load_stdlib_json, error_types=(json.JSONDecodeError,)
+        ),
+        ParserBackend(
+            DEFAULT_BACKEND, "toml", toml.load, error_types=(toml.ParseError,)
+        ),
+    ]
+    if json5.ENABLED:
+        backends.append(
+            ParserBackend(
+                DEFAULT_BACKEND, "json5", json5.load, error_types=(json5.ParseError,)
+            )
+        )
+    return backends
+
+
+def _plugin_backends() -> t.Iterator[ParserBackend]:
+    for entry_point in importlib.metadata.entry_points(group=ENTRY_POINT_GROUP):
+        # a broken plugin should not prevent the use of the other parsers
+        try:
+            backend = entry_point.load()
+        except Exception as e:
+            warnings.warn(
+                f"could not load the parser backend '{entry_point.name}' "
+                f"({entry_point.value}): {e}",
+                stacklevel=2,
+            )
+            continue
+        if not isinstance(backend, ParserBackend):
+            warnings.warn(
+                f"the parser backend '{entry_point.name}' ({entry_point.value}) "
+                "is not a ParserBackend",
+                stacklevel=2,
+            )
+            continue
+        if backend.filetype not in BACKEND_FILETYPES:
+            warnings.warn(
+                f"the parser backend '{entry_point.name}' ({entry_point.value}) "
+                f"is for the unsupported filetype '{backend.filetype}'",
+                stacklevel=2,
+            )
+            continue
+        if backend.filetype == "toml":
+            backend = ParserBackend(
+                backend.name,
+                backend.filetype,
+                _normalizing_toml_loader(backend.load),
+                error_types=backend.error_types,
+            )
+        yield backend
+
+
+@functools.lru_cache(maxsize=None)
+def get_backends() -> dict[str, dict[str, ParserBackend]]:
+    """
+    Get all available parser backends, by filetype and then by name.
+
+    Backends from entry points are loaded once, on the first call. A plugin can not
+    replace a builtin backend, or another plugin of the same name.
+    """
+    backends: dict[str, dict[str, ParserBackend]] = {
+        filetype: {} for filetype in BACKEND_FILETYPES
+    }
+    for backend in _builtin_backends():
+        backends[backend.filetype][backend.name] = backend
+    for backend in _plugin_backends():
+        if backend.name in backends[backend.filetype]:
+            warnings.warn(
+                f"ignoring the parser backend '{backend.name}' for "
+                f"{backend.filetype}, as another backend has that name",
+                stacklevel=2,
+            )
+            continue
+        backends[backend.filetype][backend.name] = backend
+    return backends
+
+
+def get_backend(filetype: str, name: str) -> ParserBackend:
+    if filetype not in BACKEND_FILETYPES:
+        raise UnknownParserBackendError(
+            f"parser backends cannot be selected for '{filetype}', only for: "
+            + ", ".join(BACKEND_FILETYPES)
+        )
+    by_name = get_backends()[filetype]
+    if name not in by_name:
+        available = ", ".join(sorted(by_name)) or "none"
+        raise UnknownParserBackendError(
+            f"there is no parser backend '{name}' for {filetype} "
+            f"(available backends: {available})"
+        )
+    return by_name[name]
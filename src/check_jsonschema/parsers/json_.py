@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import json
+import mmap
+import os
+import stat
 import typing as t
 
 try:
@@ -12,9 +15,48 @@ except ImportError:
 
 JSONDecodeError = json.JSONDecodeError
 
+# files at least this large are parsed from a memory map of the file, rather than
+# from a copy of its content
+MMAP_MIN_SIZE = 1 << 20
+
 
 def load(stream: t.IO[bytes]) -> t.Any:
-    bin_data = stream.read()
+    # orjson can parse a memoryview directly, but stdlib JSON cannot
+    if has_orjson:
+        mapped = _map_file(stream)
+        if mapped is not None:
+            try:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+            finally:
+                mapped.close()
+    return loads(stream.read())
+
+
+def _map_file(stream: t.IO[bytes]) -> mmap.mmap | None:
+    """
+    Map a large regular file into memory, if the stream reads it from the start.
+
+    Returns None for other streams, such as pipes or in-memory streams, or if the
+    file cannot be mapped.
+    """
+    try:
+        fileno = stream.fileno()
+        if stream.tell() != 0:
+            return None
+        stat_result = os.fstat(fileno)
+        if not stat.S_ISREG(stat_result.st_mode):
+            return None
+        # an empty file cannot be mapped
+        if stat_result.st_size < max(MMAP_MIN_SIZE, 1):
+            return None
+        return mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+    # 'io.UnsupportedOperation' is raised by streams without a file descriptor
+    except (OSError, ValueError):
+        return None
+
+
+def loads(bin_data: bytes) -> t.Any:
     # if orjson is available, try it first
     if has_orjson:
         # in the event of a decode error, it may be that the data contains
@@ -27,3 +69,9 @@ def load(stream: t.IO[bytes]) -> t.Any:
         return orjson.loads(bin_data)
     # failover to stdlib json
     return json.loads(bin_data)
+
+
+def dumps(data: t.Any) -> bytes:
+    if has_orjson:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode()
@@ -0,0 +1,151 @@
+"""
+Incremental parsing of JSON files which hold one very large array.
+
+The elements of the array are parsed one at a time with the decoder of the 'json'
+module, from a buffer which holds only the part of the file which has not been
+parsed yet.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import typing as t
+
+CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = " \t\n\r"
+
+# the characters which can continue a number which has been decoded in full
+# (e.g. '0' from '0.5', or '1' from '1e5', when the rest is not read yet)
+_NUMBER_CONTINUATION = frozenset("0123456789.eE+-")
+
+
+class StreamDecodeError(ValueError):
+    pass
+
+
+def _decode_error(message: str, position: int) -> StreamDecodeError:
+    return StreamDecodeError(f"{message}: char {position}")
+
+
+def read_array_start(stream: t.IO[bytes]) -> tuple[bool, bytes]:
+    """
+    Read the start of a stream, up to its first non-whitespace byte.
+
+    Returns whether that byte opens an array, along with all of the bytes which were
+    read, which must be passed on to whatever parses the stream.
+    """
+    prefix = b""
+    while True:
+        chunk = stream.read(CHUNK_SIZE)
+        if not chunk:
+            return (False, prefix)
+        prefix += chunk
+        stripped = prefix.lstrip(_WHITESPACE.encode() + codecs.BOM_UTF8)
+        if stripped:
+            return (stripped[:1] == b"[", prefix)
+
+
+class _Buffer:
+    def __init__(self, stream: t.IO[bytes], prefix: bytes, chunk_size: int) -> None:
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self.text = self._decoder.decode(prefix)
+        self.pos = 0
+        # the number of characters dropped from the start of the buffer
+        self.offset = 0
+        self.eof = False
+
+    def read_more(self) -> None:
+        # drop what has been parsed, and read at least as much again as what is
+        # left, so that a large element is not parsed many times over
+        self.offset += self.pos
+        self.text = self.text[self.pos :]
+        self.pos = 0
+        chunk = self._stream.read(max(self._chunk_size, len(self.text)))
+        if not chunk:
+            self.eof = True
+        self.text += self._decoder.decode(chunk, final=self.eof)
+
+    def skip_whitespace(self) -> str | None:
+        """
+        Move past any whitespace, and return the next character, or None at the end
+        of the stream.
+        """
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if self.eof:
+                return None
+            self.read_more()
+
+    def error(self, message: str) -> StreamDecodeError:
+        return _decode_error(message, self.offset + self.pos)
+
+
+def _may_be_cut_off(err: json.JSONDecodeError, buffer_length: int) -> bool:
+    """
+    Whether an error may be caused by a value which continues past the end of the
+    buffer, rather than by invalid data.
+
+    Other errors are raised at once, so that the rest of the stream is not read into
+    the buffer in search of the end of a value.
+    """
+    # an unterminated string is reported at its start, other errors where they occur
+    # (allowing for a partly read escape sequence or literal)
+    return err.msg.startswith("Unterminated string") or err.pos >= buffer_length - 6
+
+
+def iter_array_elements(
+    stream: t.IO[bytes], prefix: bytes = b"", *, chunk_size: int = CHUNK_SIZE
+) -> t.Iterator[t.Any]:
+    """
+    Parse the elements of a JSON array in a stream one at a time, as they are read.
+
+    'prefix' holds any bytes which were already read from the start of the stream.
+    Raises a StreamDecodeError if the stream does not hold one JSON array.
+    """
+    decoder = json.JSONDecoder()
+    buf = _Buffer(stream, prefix, chunk_size)
+
+    if buf.skip_whitespace() != "[":
+        raise buf.error("Expecting '['")
+    buf.pos += 1
+
+    first = True
+    while True:
+        char = buf.skip_whitespace()
+        if char == "]":
+            buf.pos += 1
+            break
+        if not first:
+            if char != ",":
+                raise buf.error("Expecting ',' delimiter")
+            buf.pos += 1
+            char = buf.skip_whitespace()
+        if char is None:
+            raise buf.error("Expecting value")
+
+        while True:
+            try:
+                value, end = decoder.raw_decode(buf.text, buf.pos)
+            except json.JSONDecodeError as e:
+                if buf.eof or not _may_be_cut_off(e, len(buf.text)):
+                    raise _decode_error(e.msg, buf.offset + e.pos) from e
+                buf.read_more()
+                continue
+            # a number at the end of the buffer may continue in the next chunk
+            if not buf.eof and _NUMBER_CONTINUATION.issuperset(buf.text[end:]):
+                buf.read_more()
+                continue
+            break
+        yield value
+        buf.pos = end
+        first = False
+
+    if buf.skip_whitespace() is not None:
+        raise buf.error("Extra data")
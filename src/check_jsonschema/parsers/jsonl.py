@@ -0,0 +1,27 @@
+"""
+JSON Lines (also known as NDJSON) files hold one JSON document per line.
+
+Each line is a separate instance, so these files are read one line at a time rather
+than being loaded whole.
+"""
+
+from __future__ import annotations
+
+import typing as t
+
+from . import json_
+
+JSONDecodeError = json_.JSONDecodeError
+
+
+def iter_lines(stream: t.IO[bytes]) -> t.Iterator[tuple[int, bytes]]:
+    """
+    Iterate over the non-blank lines of a stream, with their line numbers.
+    """
+    for lineno, line in enumerate(stream, start=1):
+        if line.strip():
+            yield (lineno, line)
+
+
+def load(stream: t.IO[bytes]) -> list[t.Any]:
+    return [json_.loads(line) for _, line in iter_lines(stream)]
@@ -72,3 +72,43 @@ def impl2loader(
         return _normalize(data)
 
     return load
+
+
+def impl2document_iterator(
+    primary: ruamel.yaml.YAML, *fallbacks: ruamel.yaml.YAML
+) -> t.Callable[[t.IO[bytes]], t.Iterator[t.Any]]:
+    """
+    Build a function which loads the documents of a YAML stream one at a time, as
+    they are read, so that only one document is held in memory.
+
+    If an implementation fails and the stream can be read again, the stream is read
+    from the start with the next implementation, skipping the documents which were
+    already loaded.
+    """
+    implementations = [primary] + list(fallbacks)
+
+    def iter_documents(stream: t.IO[bytes]) -> t.Iterator[t.Any]:
+        num_loaded = 0
+        for impl_index, impl in enumerate(implementations):
+            documents = impl.load_all(stream)
+            num_seen = 0
+            while True:
+                try:
+                    with warnings.catch_warnings():
+                        warnings.simplefilter(
+                            "ignore", ruamel.yaml.error.ReusedAnchorWarning
+                        )
+                        data = next(documents, _data_sentinel)
+                except ruamel.yaml.YAMLError:
+                    if impl_index == len(implementations) - 1 or not stream.seekable():
+                        raise
+                    stream.seek(0)
+                    break
+                if data is _data_sentinel:
+                    return
+                num_seen += 1
+                if num_seen > num_loaded:
+                    num_loaded += 1
+                    yield _normalize(data)
+
+    return iter_documents
@@ -0,0 +1,108 @@
+"""
+Pickling support for validation results.
+
+Results are pickled when they are sent back from worker processes and when they are
+stored in the result cache. Some of the objects involved do not survive the default
+pickling behaviors, so this module defines reducers for them.
+"""
+
+from __future__ import annotations
+
+import copyreg
+import io
+import pickle
+import typing as t
+from multiprocessing.reduction import ForkingPickler
+
+import jsonschema
+
+from .parsers import BadFileTypeError, FailedFileLoadError, ParseError
+
+# validation errors hold a reference to the type checker of the validator which
+# produced them, and the builtin type checkers are made of lambdas which cannot be
+# pickled
+# send the builtin checkers by name instead
+_BUILTIN_VALIDATOR_NAMES = (
+    "Draft3Validator",
+    "Draft4Validator",
+    "Draft6Validator",
+    "Draft7Validator",
+    "Draft201909Validator",
+    "Draft202012Validator",
+)
+
+
+def _builtin_type_checker(validator_name: str) -> jsonschema.TypeChecker:
+    return t.cast(
+        jsonschema.TypeChecker, getattr(jsonschema, validator_name).TYPE_CHECKER
+    )
+
+
+def _reduce_type_checker(checker: jsonschema.TypeChecker) -> tuple[t.Any, ...]:
+    for name in _BUILTIN_VALIDATOR_NAMES:
+        if _builtin_type_checker(name) is checker:
+            return (_builtin_type_checker, (name,))
+    type_checkers = checker._type_checkers  # type: ignore[attr-defined]
+    return (jsonschema.TypeChecker, (dict(type_checkers),))
+
+
+# the default exception pickling rebuilds an error from its constructor arguments,
+# which do not include the links from sub-errors back to their parents
+# send errors without their parent links and restore the links when rebuilding
+def _rebuild_validation_error(
+    cls: type[jsonschema.ValidationError], state: dict[str, t.Any]
+) -> jsonschema.ValidationError:
+    err = cls(state["message"])
+    err.__dict__.update(state)
+    err.__cause__ = state["cause"]
+    for suberr in err.context:
+        suberr.parent = err
+    return err
+
+
+def _reduce_validation_error(err: jsonschema.ValidationError) -> tuple[t.Any, ...]:
+    state = err.__dict__.copy()
+    state["parent"] = None
+    return (_rebuild_validation_error, (type(err), state))
+
+
+# parse errors are reported along with their causes, which are dropped by the
+# default exception pickling
+def _rebuild_parse_error(
+    cls: type[ParseError], args: tuple[t.Any, ...], cause: BaseException | None
+) -> ParseError:
+    err = cls(*args)
+    err.__cause__ = cause
+    return err
+
+
+def _reduce_parse_error(err: ParseError) -> tuple[t.Any, ...]:
+    return (_rebuild_parse_error, (type(err), err.args, err.__cause__))
+
+
+_REDUCERS: dict[type, t.Callable[[t.Any], tuple[t.Any, ...]]] = {
+    jsonschema.TypeChecker: _reduce_type_checker,
+    jsonschema.ValidationError: _reduce_validation_error,
+    ParseError: _reduce_parse_error,
+    BadFileTypeError: _reduce_parse_error,
+    FailedFileLoadError: _reduce_parse_error,
+}
+
+
+class _ResultPickler(pickle.Pickler):
+    dispatch_table = {**copyreg.dispatch_table, **_REDUCERS}
+
+
+def dumps(obj: t.Any) -> bytes:
+    buf = io.BytesIO()
+    _ResultPickler(buf, protocol=pickle.HIGHEST_PROTOCOL).dump(obj)
+    return buf.getvalue()
+
+
+def loads(data: bytes) -> t.Any:
+    return pickle.loads(data)
+
+
+def register_multiprocessing_reducers() -> None:
+    for cls, reducer in _REDUCERS.items():
+        ForkingPickler.register(cls, reducer)
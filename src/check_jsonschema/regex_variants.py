@@ -1,10 +1,117 @@
+import collections
 import enum
 import re
+import threading
 import typing as t
 
 import jsonschema
 import regress
 
+# the number of compiled patterns kept by each regex implementation
+DEFAULT_PATTERN_CACHE_SIZE = 1024
+
+_K = t.TypeVar("_K", bound=t.Hashable)
+_T = t.TypeVar("_T")
+
+
+class PatternCacheInfo(t.NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _PatternCache(t.Generic[_K, _T]):
+    """
+    A bounded LRU cache of compiled patterns.
+
+    Patterns which fail to compile are not cached, and the error is raised on each
+    attempt.
+    """
+
+    def __init__(self, compile: t.Callable[[_K], _T], maxsize: int) -> None:
+        self._compile = compile
+        self._maxsize = maxsize
+        self._patterns: collections.OrderedDict[_K, _T] = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, pattern: _K) -> _T:
+        with self._lock:
+            compiled = self._patterns.get(pattern)
+            if compiled is not None:
+                self._patterns.move_to_end(pattern)
+                self.hits += 1
+                return compiled
+            self.misses += 1
+
+        compiled = self._compile(pattern)
+        with self._lock:
+            self._patterns[pattern] = compiled
+            if len(self._patterns) > self._maxsize:
+                self._patterns.popitem(last=False)
+        return compiled
+
+    def info(self) -> PatternCacheInfo:
+        with self._lock:
+            return PatternCacheInfo(
+                self.hits, self.misses, self._maxsize, len(self._patterns)
+            )
+
+
+# patterns which match any string
+_MATCH_ALL_PATTERNS = frozenset(("", ".*", "^.*"))
+
+
+class _PatternPropertiesMatcher:
+    """
+    Finds the keys of an object which match each pattern of a 'patternProperties'
+    block.
+
+    A matcher is built once per block, so that its patterns are looked up and
+    compiled once rather than once per object. Patterns which match any key are
+    not tested at all.
+    """
+
+    def __init__(
+        self,
+        patterns: tuple[str, ...],
+        compile_search: t.Callable[[str], t.Callable[[str], object]],
+    ) -> None:
+        self._searches: list[t.Callable[[str], object] | None] = [
+            None if pattern in _MATCH_ALL_PATTERNS else compile_search(pattern)
+            for pattern in patterns
+        ]
+
+    def match(self, keys: t.Collection[str]) -> list[t.Collection[str]]:
+        """
+        Get the keys matched by each pattern, in the order of the patterns.
+        """
+        return [
+            keys if search is None else list(filter(search, keys))
+            for search in self._searches
+        ]
+
+
+def _iter_pattern_properties_errors(
+    validator: t.Any,
+    patternProperties: dict[str, t.Any],
+    instance: dict[str, t.Any],
+    matcher: _PatternPropertiesMatcher,
+) -> t.Iterator[jsonschema.ValidationError]:
+    # errors are produced pattern by pattern, as jsonschema does
+    for (pattern, subschema), keys in zip(
+        patternProperties.items(), matcher.match(instance.keys())
+    ):
+        for k in keys:
+            yield from validator.descend(
+                instance[k],
+                subschema,
+                path=k,
+                schema_path=pattern,
+            )
+
 
 class RegexVariantName(enum.Enum):
     default = "default"
@@ -20,22 +127,58 @@ class RegexImplementation:
 
     _concrete: "_ConcreteImplementation"
 
-    def __init__(self, variant: RegexVariantName) -> None:
+    def __init__(
+        self,
+        variant: RegexVariantName,
+        *,
+        pattern_cache_size: int = DEFAULT_PATTERN_CACHE_SIZE,
+    ) -> None:
         self.variant = variant
+        self.pattern_cache_size = pattern_cache_size
 
         if self.variant == RegexVariantName.default:
-            self._concrete = _RegressImplementation()
+            self._concrete = _RegressImplementation(pattern_cache_size)
         elif self.variant == RegexVariantName.nonunicode:
-            self._concrete = _NonunicodeRegressImplementation()
+            self._concrete = _NonunicodeRegressImplementation(pattern_cache_size)
         else:
-            self._concrete = _PythonImplementation()
+            self._concrete = _PythonImplementation(pattern_cache_size)
 
         self.check_format = self._concrete.check_format
         self.pattern_keyword = self._concrete.pattern_keyword
         self.patternProperties_keyword = self._concrete.patternProperties_keyword
 
+    def pattern_cache_info(self) -> PatternCacheInfo:
+        """
+        Get the hit and miss counts and the size of the compiled pattern cache.
+        """
+        return self._concrete.pattern_cache_info()
+
+    # the pattern cache holds a lock, and compiled 'regress' patterns cannot be
+    # pickled, so an implementation is sent to another process by its variant and
+    # starts there with an empty cache
+    def __reduce__(self) -> tuple[t.Any, ...]:
+        return (_rebuild_regex_implementation, (self.variant, self.pattern_cache_size))
+
+    # implementations compare by variant, so that caches keyed on them can be hit
+    # by separately constructed but equivalent implementations
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RegexImplementation):
+            return NotImplemented
+        return self.variant == other.variant
+
+    def __hash__(self) -> int:
+        return hash(self.variant)
+
+
+def _rebuild_regex_implementation(
+    variant: RegexVariantName, pattern_cache_size: int
+) -> RegexImplementation:
+    return RegexImplementation(variant, pattern_cache_size=pattern_cache_size)
+
 
 class _ConcreteImplementation(t.Protocol):
+    def pattern_cache_info(self) -> PatternCacheInfo: ...
+
     def check_format(self, instance: t.Any) -> bool: ...
 
     def pattern_keyword(
@@ -52,9 +195,28 @@ class _ConcreteImplementation(t.Protocol):
 
 
 class _RegressImplementation:
-    def _compile_pattern(self, pattern: str) -> regress.Regex:
+    def __init__(self, pattern_cache_size: int = DEFAULT_PATTERN_CACHE_SIZE) -> None:
+        self._patterns: _PatternCache[str, regress.Regex] = _PatternCache(
+            self._compile_uncached, pattern_cache_size
+        )
+        self._matchers: _PatternCache[tuple[str, ...], _PatternPropertiesMatcher] = (
+            _PatternCache(self._make_matcher, pattern_cache_size)
+        )
+
+    def _make_matcher(self, patterns: tuple[str, ...]) -> _PatternPropertiesMatcher:
+        return _PatternPropertiesMatcher(
+            patterns, lambda pattern: self._compile_pattern(pattern).find
+        )
+
+    def _compile_uncached(self, pattern: str) -> regress.Regex:
         return regress.Regex(pattern, flags="u")
 
+    def _compile_pattern(self, pattern: str) -> regress.Regex:
+        return self._patterns.get(pattern)
+
+    def pattern_cache_info(self) -> PatternCacheInfo:
+        return self._patterns.info()
+
     def check_format(self, instance: t.Any) -> bool:
         if not isinstance(instance, str):
             return True
@@ -84,29 +246,41 @@ class _RegressImplementation:
         if not validator.is_type(instance, "object"):
             return
 
-        for pattern, subschema in patternProperties.items():
-            regress_pattern = self._compile_pattern(pattern)
-            for k, v in instance.items():
-                if regress_pattern.find(k):
-                    yield from validator.descend(
-                        v,
-                        subschema,
-                        path=k,
-                        schema_path=pattern,
-                    )
+        yield from _iter_pattern_properties_errors(
+            validator,
+            patternProperties,
+            instance,
+            self._matchers.get(tuple(patternProperties)),
+        )
 
 
 class _NonunicodeRegressImplementation(_RegressImplementation):
-    def _compile_pattern(self, pattern: str) -> regress.Regex:
+    def _compile_uncached(self, pattern: str) -> regress.Regex:
         return regress.Regex(pattern)
 
 
 class _PythonImplementation:
+    def __init__(self, pattern_cache_size: int = DEFAULT_PATTERN_CACHE_SIZE) -> None:
+        self._patterns: _PatternCache[str, re.Pattern[str]] = _PatternCache(
+            re.compile, pattern_cache_size
+        )
+        self._matchers: _PatternCache[tuple[str, ...], _PatternPropertiesMatcher] = (
+            _PatternCache(self._make_matcher, pattern_cache_size)
+        )
+
+    def _make_matcher(self, patterns: tuple[str, ...]) -> _PatternPropertiesMatcher:
+        return _PatternPropertiesMatcher(
+            patterns, lambda pattern: self._patterns.get(pattern).search
+        )
+
+    def pattern_cache_info(self) -> PatternCacheInfo:
+        return self._patterns.info()
+
     def check_format(self, instance: t.Any) -> bool:
         if not isinstance(instance, str):
             return True
         try:
-            re.compile(instance)
+            self._patterns.get(instance)
         except re.error:
             return False
         return True
@@ -117,7 +291,7 @@ class _PythonImplementation:
         if not validator.is_type(instance, "string"):
             return
 
-        re_pattern = re.compile(pattern)
+        re_pattern = self._patterns.get(pattern)
         if not re_pattern.search(instance):
             yield jsonschema.ValidationError(f"{instance!r} does not match {pattern!r}")
 
@@ -131,12 +305,9 @@ class _PythonImplementation:
         if not validator.is_type(instance, "object"):
             return
 
-        for pattern, subschema in patternProperties.items():
-            for k, v in instance.items():
-                if re.search(pattern, k):
-                    yield from validator.descend(
-                        v,
-                        subschema,
-                        path=k,
-                        schema_path=pattern,
-                    )
+        yield from _iter_pattern_properties_errors(
+            validator,
+            patternProperties,
+            instance,
+            self._matchers.get(tuple(patternProperties)),
+        )
@@ -39,6 +39,30 @@ class Reporter(abc.ABC):
             self.report_errors(result)
 
 
+class StreamingReporter(Reporter):
+    """
+    A reporter which reports the results of each file as soon as it is checked.
+
+    The checker does not keep the errors of a run which reports to a streaming
+    reporter, so the result passed to 'report_success' and 'report_errors' only
+    holds counts of results and notes on truncation.
+    """
+
+    @abc.abstractmethod
+    def report_file_success(self, filename: str) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def report_file_parse_error(self, filename: str, err: ParseError) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def report_file_validation_errors(
+        self, filename: str, errors: list[jsonschema.ValidationError]
+    ) -> None:
+        raise NotImplementedError
+
+
 class TextReporter(Reporter):
     def __init__(
         self,
@@ -80,13 +104,14 @@ class TextReporter(Reporter):
             self._format_validation_error_message(err, filename=filename), indent=2
         )
         if err.context:
-            best_match = jsonschema.exceptions.best_match(err.context)
+            summary = summarize_error_tree(err, collect_sub_errors=self.verbosity > 1)
+            best_match = summary.best_match
             self._echo("Underlying errors caused this.", indent=2)
             self._echo("")
             self._echo("Best Match:", indent=2)
             self._echo(self._format_validation_error_message(best_match), indent=4)
 
-            best_deep_match = find_best_deep_match(err)
+            best_deep_match = summary.best_deep_match
             if best_deep_match != best_match:
                 self._echo("Best Deep Match:", indent=2)
                 self._echo(
@@ -95,10 +120,10 @@ class TextReporter(Reporter):
 
             if self.verbosity > 1:
                 self._echo("All Errors:", indent=2)
-                for e in iter_validation_error(err):
+                for e in summary.sub_errors:
                     self._echo(self._format_validation_error_message(e), indent=4)
             else:
-                num_other_errors = len(list(iter_validation_error(err))) - 1
+                num_other_errors = summary.num_sub_errors - 1
                 if best_deep_match != best_match:
                     num_other_errors -= 1
                 if num_other_errors > 0:
@@ -132,6 +157,52 @@ class TextReporter(Reporter):
             for filename, parse_errors in result.validation_errors.items():
                 for parse_err in parse_errors:
                     self._show_validation_error(filename, parse_err)
+        self._show_truncations(result)
+
+    def _show_truncations(self, result: CheckResult) -> None:
+        if not result.truncated:
+            return
+        self._echo(
+            click.style("Results were truncated", fg="yellow")
+            + ", and some errors or files were not checked."
+        )
+        for note in result.truncations:
+            self._echo(note, indent=2)
+
+
+class StreamingTextReporter(TextReporter, StreamingReporter):
+    def report_file_success(self, filename: str) -> None:
+        if self.verbosity > 2:
+            self._echo(f"{click.style('ok', fg='green')} -- {filename}")
+
+    def report_file_parse_error(self, filename: str, err: ParseError) -> None:
+        if self.verbosity < 1:
+            return
+        self._show_parse_error(filename, err)
+
+    def report_file_validation_errors(
+        self, filename: str, errors: list[jsonschema.ValidationError]
+    ) -> None:
+        if self.verbosity < 1:
+            return
+        for err in errors:
+            self._show_validation_error(filename, err)
+
+    def report_success(self, result: CheckResult) -> None:
+        if self.verbosity < 1:
+            return
+        ok = click.style("ok", fg="green")
+        self._echo(f"{ok} -- validation done")
+
+    def report_errors(self, result: CheckResult) -> None:
+        if self.verbosity < 1:
+            return
+        self._echo(
+            f"{click.style('fail', fg='red')} -- "
+            f"validation errors: {result.num_validation_errors}, "
+            f"files which failed to parse: {result.num_parse_errors}"
+        )
+        self._show_truncations(result)
 
 
 class JsonReporter(Reporter):
@@ -160,32 +231,7 @@ class JsonReporter(Reporter):
     ) -> t.Iterator[dict]:
         for filename, errors in error_map.items():
             for err in errors:
-                item = {
-                    "filename": filename,
-                    "path": err.json_path,
-                    "message": err.message,
-                    "has_sub_errors": bool(err.context),
-                }
-                if err.context:
-                    best_match = jsonschema.exceptions.best_match(err.context)
-                    best_deep_match = find_best_deep_match(err)
-                    item["best_match"] = {
-                        "path": best_match.json_path,
-                        "message": best_match.message,
-                    }
-                    item["best_deep_match"] = {
-                        "path": best_deep_match.json_path,
-                        "message": best_deep_match.message,
-                    }
-                    num_sub_errors = len(list(iter_validation_error(err))) - 1
-                    item["num_sub_errors"] = num_sub_errors
-                    if self.verbosity > 1:
-                        item["sub_errors"] = [
-                            {"path": suberr.json_path, "message": suberr.message}
-                            for suberr in iter_validation_error(err)
-                        ]
-
-                yield item
+                yield _validation_error_item(filename, err, verbosity=self.verbosity)
 
     def _dump_parse_errors(
         self,
@@ -207,24 +253,167 @@ class JsonReporter(Reporter):
             report_obj["parse_errors"] = list(
                 self._dump_parse_errors(result.parse_errors)
             )
+        if result.truncated:
+            report_obj["truncated"] = list(result.truncations)
         self._dump(report_obj)
 
 
+def _validation_error_item(
+    filename: str, err: jsonschema.ValidationError, *, verbosity: int
+) -> dict[str, t.Any]:
+    item: dict[str, t.Any] = {
+        "filename": filename,
+        "path": err.json_path,
+        "message": err.message,
+        "has_sub_errors": bool(err.context),
+    }
+    if err.context:
+        summary = summarize_error_tree(err, collect_sub_errors=verbosity > 1)
+        item["best_match"] = {
+            "path": summary.best_match.json_path,
+            "message": summary.best_match.message,
+        }
+        item["best_deep_match"] = {
+            "path": summary.best_deep_match.json_path,
+            "message": summary.best_deep_match.message,
+        }
+        item["num_sub_errors"] = summary.num_sub_errors - 1
+        if verbosity > 1:
+            item["sub_errors"] = [
+                {"path": suberr.json_path, "message": suberr.message}
+                for suberr in summary.sub_errors
+            ]
+    return item
+
+
+class NdjsonReporter(StreamingReporter):
+    """
+    Report each result as a JSON object on its own line, followed by a summary.
+
+    Each object has a "type" of "validation_error", "parse_error", "success" (only
+    with '-vv'), or "summary".
+    """
+
+    def _dump(self, data: dict[str, t.Any]) -> None:
+        click.echo(json.dumps(data, separators=(",", ":")))
+
+    def report_file_success(self, filename: str) -> None:
+        if self.verbosity > 1:
+            self._dump({"type": "success", "filename": filename})
+
+    def report_file_parse_error(self, filename: str, err: ParseError) -> None:
+        if self.verbosity > 0:
+            self._dump(
+                {"type": "parse_error", "filename": filename, "message": str(err)}
+            )
+
+    def report_file_validation_errors(
+        self, filename: str, errors: list[jsonschema.ValidationError]
+    ) -> None:
+        if self.verbosity < 1:
+            return
+        for err in errors:
+            self._dump(
+                {
+                    "type": "validation_error",
+                    **_validation_error_item(filename, err, verbosity=self.verbosity),
+                }
+            )
+
+    def _dump_summary(self, result: CheckResult) -> None:
+        summary: dict[str, t.Any] = {
+            "type": "summary",
+            "status": "ok" if result.success else "fail",
+            "num_successes": result.num_successes,
+            "num_validation_errors": result.num_validation_errors,
+            "num_parse_errors": result.num_parse_errors,
+        }
+        if result.truncated:
+            summary["truncated"] = list(result.truncations)
+        self._dump(summary)
+
+    def report_success(self, result: CheckResult) -> None:
+        self._dump_summary(result)
+
+    def report_errors(self, result: CheckResult) -> None:
+        self._dump_summary(result)
+
+
 REPORTER_BY_NAME: dict[str, type[Reporter]] = {
     "text": TextReporter,
     "json": JsonReporter,
+    "text-stream": StreamingTextReporter,
+    "ndjson": NdjsonReporter,
 }
 
 
 def _deep_match_relevance(error: jsonschema.ValidationError) -> tuple[bool | int, ...]:
+    return _deep_match_relevance_at_depth(error, len(error.absolute_path))
+
+
+def _deep_match_relevance_at_depth(
+    error: jsonschema.ValidationError, depth: int
+) -> tuple[bool | int, ...]:
     validator = error.validator
     return (
         validator not in ("anyOf", "oneOf"),
-        len(error.absolute_path),
+        depth,
         -len(error.path),
     )
 
 
+class ErrorTreeSummary(t.NamedTuple):
+    best_match: jsonschema.ValidationError
+    best_deep_match: jsonschema.ValidationError
+    # the number of errors under the summarized error, at any depth
+    num_sub_errors: int
+    # those errors, in the order of 'iter_validation_error', if they were collected
+    sub_errors: list[jsonschema.ValidationError]
+
+
+def summarize_error_tree(
+    err: jsonschema.ValidationError, *, collect_sub_errors: bool = False
+) -> ErrorTreeSummary:
+    """
+    Summarize the errors under an error which has a context, in one walk over them.
+
+    The tree under an 'anyOf' or 'oneOf' error can be very large, so it is not
+    walked again for each part of the summary.
+    """
+    if not err.context:
+        raise ValueError("cannot summarize an error without a context")
+
+    sub_errors = []
+    num_sub_errors = 0
+    best_deep_match = None
+    best_relevance: tuple[bool | int, ...] = ()
+
+    # walk the tree depth-first, in the same order as 'iter_validation_error'
+    #
+    # the length of the absolute path of each error is that of its parent plus the
+    # length of its relative path, so it is passed down rather than being rebuilt
+    # from the chain of parents with 'absolute_path'
+    root_depth = len(err.absolute_path)
+    stack = [(e, root_depth) for e in reversed(err.context)]
+    while stack:
+        e, parent_depth = stack.pop()
+        num_sub_errors += 1
+        if collect_sub_errors:
+            sub_errors.append(e)
+        depth = parent_depth + len(e.path)
+        relevance = _deep_match_relevance_at_depth(e, depth)
+        if best_deep_match is None or relevance > best_relevance:
+            best_deep_match, best_relevance = e, relevance
+        if e.context:
+            stack.extend((child, depth) for child in reversed(e.context))
+    assert best_deep_match is not None
+
+    # 'best_match' only descends into the most relevant branch of the tree
+    best_match = jsonschema.exceptions.best_match(err.context)
+    assert best_match is not None
+    return ErrorTreeSummary(best_match, best_deep_match, num_sub_errors, sub_errors)
+
+
 def find_best_deep_match(
     errors: jsonschema.ValidationError,
 ) -> jsonschema.ValidationError:
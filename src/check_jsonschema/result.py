@@ -8,28 +8,53 @@ from .parsers import ParseError
 
 
 class CheckResult:
-    def __init__(self) -> None:
+    def __init__(self, *, retain_details: bool = True) -> None:
+        # when results are reported as each file is checked, they are only counted
+        # here, so that memory use does not grow with the number of errors
+        self.retain_details = retain_details
+
         self.validation_errors: dict[str, list[jsonschema.ValidationError]] = {}
         self.parse_errors: dict[str, list[ParseError]] = {}
         self.successes: list[str] = []
+        self.num_validation_errors = 0
+        self.num_parse_errors = 0
+        self.num_successes = 0
+        # notes on which results were left out because a limit was reached
+        self.truncations: list[str] = []
 
     @property
     def success(self) -> bool:
-        return not (bool(self.parse_errors) or bool(self.validation_errors))
+        return not (self.num_parse_errors or self.num_validation_errors)
+
+    @property
+    def truncated(self) -> bool:
+        return bool(self.truncations)
 
     def record_validation_success(self, path: pathlib.Path | str) -> None:
+        self.num_successes += 1
+        if not self.retain_details:
+            return
         self.successes.append(str(path))
 
     def record_validation_error(
         self, path: pathlib.Path | str, err: jsonschema.ValidationError
     ) -> None:
+        self.num_validation_errors += 1
+        if not self.retain_details:
+            return
         filename = str(path)
         if filename not in self.validation_errors:
             self.validation_errors[filename] = []
         self.validation_errors[filename].append(err)
 
     def record_parse_error(self, path: pathlib.Path | str, err: ParseError) -> None:
+        self.num_parse_errors += 1
+        if not self.retain_details:
+            return
         filename = str(path)
         if filename not in self.parse_errors:
             self.parse_errors[filename] = []
         self.parse_errors[filename].append(err)
+
+    def record_truncation(self, note: str) -> None:
+        self.truncations.append(note)
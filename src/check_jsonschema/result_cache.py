@@ -0,0 +1,118 @@
+"""
+A persistent cache of validation results, keyed by the content of instance files.
+
+Entries are stored under the user cache dir, one file per result. A result is only
+reused when the instance bytes and every setting which could change the outcome of
+validation (the schema and its references, regex variant, format options, data
+transform, and default filling) are the same.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.metadata
+import json
+import os
+import pickle
+import typing as t
+
+import jsonschema
+
+from . import pickling
+from .cachedownloader import _atomic_write, _resolve_cache_dir, prune_cache_dir
+
+# bump this to invalidate all existing entries if the stored data changes
+_CACHE_FORMAT_VERSION = 1
+
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+
+_ENTRY_SUFFIX = ".pickle"
+
+
+def _package_version(name: str) -> str:
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+class ResultCache:
+    def __init__(
+        self,
+        *,
+        settings: dict[str, t.Any],
+        max_size: int = DEFAULT_MAX_SIZE,
+        cache_dir: str = "results",
+    ) -> None:
+        self._cache_dir = _resolve_cache_dir(cache_dir)
+        self._max_size = max_size
+
+        # results are pickled objects from 'jsonschema', so any version change
+        # is treated as a full invalidation
+        settings_doc = {
+            "cache_format": _CACHE_FORMAT_VERSION,
+            "check_jsonschema": _package_version("check-jsonschema"),
+            "jsonschema": _package_version("jsonschema"),
+            **settings,
+        }
+        self._settings_digest = hashlib.sha256(
+            json.dumps(settings_doc, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache_dir is not None
+
+    def make_key(self, content: bytes, filetype: str, schema_fingerprint: str) -> str:
+        hasher = hashlib.sha256()
+        for part in (self._settings_digest, schema_fingerprint, filetype):
+            hasher.update(part.encode())
+            hasher.update(b"\0")
+        hasher.update(content)
+        return hasher.hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        assert self._cache_dir is not None
+        return os.path.join(self._cache_dir, key + _ENTRY_SUFFIX)
+
+    def get(self, key: str) -> list[jsonschema.ValidationError] | None:
+        if self._cache_dir is None:
+            return None
+        path = self._entry_path(key)
+        try:
+            with open(path, "rb") as fp:
+                errors = pickling.loads(fp.read())
+            # mark the entry as recently used, for eviction
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        # a corrupt or incompatible entry is a miss, and will be overwritten
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+        if not isinstance(errors, list):
+            return None
+        return errors
+
+    def put(self, key: str, errors: list[jsonschema.ValidationError]) -> None:
+        if self._cache_dir is None:
+            return
+        try:
+            data = pickling.dumps(errors)
+        # errors from custom validators may hold data which cannot be pickled
+        # in that case, simply skip caching
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            _atomic_write(self._entry_path(key), data)
+        # failing to write a result only means that the file is checked next time
+        except OSError:
+            pass
+
+    def prune(self) -> None:
+        """
+        Evict the least recently used entries until the cache fits in its size limit.
+        """
+        if self._cache_dir is None or not os.path.isdir(self._cache_dir):
+            return
+        prune_cache_dir(self._cache_dir, self._max_size)
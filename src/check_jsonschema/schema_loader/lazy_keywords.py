@@ -0,0 +1,112 @@
+"""
+'anyOf' and 'oneOf' implementations which only build the errors they report.
+
+The implementations in 'jsonschema' collect every error from every subschema which
+an instance fails, and discard them once a passing subschema is found. Most
+instances pass, so most of that work is wasted.
+
+These implementations take only the first error of each failing subschema, which
+is enough to know that it fails, and keep its error iterator suspended. The rest of
+the errors are only collected if every subschema fails, in which case the result
+is the same as that of 'jsonschema'.
+"""
+
+from __future__ import annotations
+
+import typing as t
+
+import jsonschema
+
+# the first error of a failing subschema, and an iterator over the rest
+_PendingErrors = tuple[
+    jsonschema.ValidationError, t.Iterator[jsonschema.ValidationError]
+]
+
+
+def _first_error(
+    validator: t.Any,
+    instance: t.Any,
+    subschema: t.Any,
+    index: int,
+) -> _PendingErrors | None:
+    errors = validator.descend(instance, subschema, schema_path=index)
+    first = next(errors, None)
+    if first is None:
+        return None
+    return (first, errors)
+
+
+def _collect(pending: list[_PendingErrors]) -> list[jsonschema.ValidationError]:
+    all_errors = []
+    for first, rest in pending:
+        all_errors.append(first)
+        all_errors.extend(rest)
+    return all_errors
+
+
+def anyOf(
+    validator: t.Any,
+    anyOf: list[t.Any],
+    instance: t.Any,
+    schema: t.Any,
+) -> t.Iterator[jsonschema.ValidationError]:
+    pending = []
+    for index, subschema in enumerate(anyOf):
+        errors = _first_error(validator, instance, subschema, index)
+        if errors is None:
+            return
+        pending.append(errors)
+
+    yield jsonschema.ValidationError(
+        f"{instance!r} is not valid under any of the given schemas",
+        context=_collect(pending),
+    )
+
+
+def oneOf(
+    validator: t.Any,
+    oneOf: list[t.Any],
+    instance: t.Any,
+    schema: t.Any,
+) -> t.Iterator[jsonschema.ValidationError]:
+    pending = []
+    for index, subschema in enumerate(oneOf):
+        errors = _first_error(validator, instance, subschema, index)
+        if errors is None:
+            first_valid = subschema
+            break
+        pending.append(errors)
+    else:
+        yield jsonschema.ValidationError(
+            f"{instance!r} is not valid under any of the given schemas",
+            context=_collect(pending),
+        )
+        return
+
+    more_valid = [
+        each
+        for each in oneOf[index + 1 :]
+        if validator.evolve(schema=each).is_valid(instance)
+    ]
+    if more_valid:
+        more_valid.append(first_valid)
+        reprs = ", ".join(repr(each) for each in more_valid)
+        yield jsonschema.ValidationError(f"{instance!r} is valid under each of {reprs}")
+
+
+def extend_with_lazy_keywords(
+    validator_class: type[jsonschema.protocols.Validator],
+) -> type[jsonschema.Validator]:
+    """
+    Use the lazy implementations in place of those of 'jsonschema'.
+
+    Custom implementations of the keywords are left in place.
+    """
+    # the implementations of 'jsonschema' are shared by all of its validators from
+    # draft 4 onwards
+    builtins = jsonschema.validators.Draft202012Validator.VALIDATORS
+    overrides = {}
+    for keyword, lazy in (("anyOf", anyOf), ("oneOf", oneOf)):
+        if validator_class.VALIDATORS.get(keyword) is builtins[keyword]:
+            overrides[keyword] = lazy
+    return jsonschema.validators.extend(validator_class, overrides)
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import functools
+import hashlib
+import importlib.metadata
+import json
 import pathlib
+import time
 import typing as t
 import urllib.error
 import urllib.parse
@@ -9,14 +13,26 @@ import urllib.parse
 import jsonschema
 from referencing import Registry
 
-from ..builtin_schemas import get_builtin_schema
+from ..builtin_schemas import get_builtin_schema, get_builtin_schema_source
 from ..formats import FormatOptions, format_checker_for_regex_impl, make_format_checker
 from ..parsers import ParserSet
 from ..regex_variants import RegexImplementation
 from ..utils import is_url_ish
 from .errors import UnsupportedUrlScheme
+from .lazy_keywords import extend_with_lazy_keywords
 from .readers import HttpSchemaReader, LocalSchemaReader, StdinSchemaReader
-from .resolver import make_reference_registry
+from .resolver import (
+    collect_referenced_documents,
+    create_retrieve_callable,
+    make_reference_registry,
+)
+from .snapshots import (
+    ValidatorSnapshot,
+    ValidatorSnapshotCache,
+    _is_remote,
+    _stat_local_file,
+)
+from .verified_schemas import VerifiedSchemaCache
 
 
 def _extend_with_default(
@@ -60,7 +76,59 @@ def _extend_with_pattern_implementation(
     )
 
 
+def _fingerprint(*parts: t.Any) -> str:
+    return hashlib.sha256(
+        json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str).encode()
+    ).hexdigest()
+
+
+class _LoadedDocuments:
+    """
+    The documents which a schema loader has read, recorded so that a loader which
+    is kept for reuse can tell when they may have changed.
+    """
+
+    def __init__(self) -> None:
+        self.loaded_at: float | None = None
+        self.local_files: dict[str, tuple[int, int] | None] = {}
+        self.uses_remote = False
+
+    def add(self, uri: str) -> None:
+        # local files are recorded before they are read, so that a change made while
+        # one is read is seen as a change
+        if self.loaded_at is None:
+            self.loaded_at = time.time()
+        if _is_remote(uri):
+            self.uses_remote = True
+        elif uri not in self.local_files:
+            self.local_files[uri] = _stat_local_file(uri)
+
+    def are_current(self, *, cache_ttl: float | None, offline: bool) -> bool:
+        for uri, stamp in list(self.local_files.items()):
+            if stamp is None or _stat_local_file(uri) != stamp:
+                return False
+        # remote documents are only reused when they could be used from the
+        # download cache without a request
+        if offline or not self.uses_remote or self.loaded_at is None:
+            return True
+        return cache_ttl is not None and time.time() - self.loaded_at < cache_ttl
+
+
 class SchemaLoaderBase:
+    def is_current(self) -> bool:
+        """
+        Whether the validators built by this loader still reflect the schema and all
+        of the documents which it references, so that the loader may be reused.
+        """
+        return True
+
+    def get_schema_fingerprint(self) -> str:
+        """
+        Get a digest which changes whenever the schema in use changes, including any
+        documents which it references.
+        """
+        raise NotImplementedError
+
     def get_validator(
         self,
         path: pathlib.Path | str,
@@ -75,6 +143,11 @@ class SchemaLoaderBase:
 class SchemaLoader(SchemaLoaderBase):
     validator_class: type[jsonschema.protocols.Validator] | None = None
     disable_cache: bool = True
+    recheck_schema: bool = False
+    prefetch_refs: bool = False
+    cache_ttl: float | None = None
+    offline: bool = False
+    validator_snapshots: bool = False
 
     def __init__(
         self,
@@ -83,10 +156,20 @@ class SchemaLoader(SchemaLoaderBase):
         base_uri: str | None = None,
         validator_class: type[jsonschema.protocols.Validator] | None = None,
         disable_cache: bool = True,
+        recheck_schema: bool = False,
+        prefetch_refs: bool = False,
+        cache_ttl: float | None = None,
+        offline: bool = False,
+        validator_snapshots: bool = False,
     ) -> None:
         # record input parameters (these are not to be modified)
         self.schemafile = schemafile
         self.disable_cache = disable_cache
+        self.recheck_schema = recheck_schema
+        self.prefetch_refs = prefetch_refs
+        self.cache_ttl = cache_ttl
+        self.offline = offline
+        self.validator_snapshots = validator_snapshots
         self.base_uri = base_uri
         self.validator_class = validator_class
 
@@ -97,6 +180,7 @@ class SchemaLoader(SchemaLoaderBase):
 
         # setup a parser collection
         self._parsers = ParserSet()
+        self._loaded_documents = _LoadedDocuments()
 
         # setup a schema reader lazily, when needed
         self._reader: (
@@ -119,7 +203,12 @@ class SchemaLoader(SchemaLoaderBase):
             return LocalSchemaReader(self.schemafile)
 
         if self.url_info.scheme in ("http", "https"):
-            return HttpSchemaReader(self.schemafile, self.disable_cache)
+            return HttpSchemaReader(
+                self.schemafile,
+                self.disable_cache,
+                cache_ttl=self.cache_ttl,
+                offline=self.offline,
+            )
         else:
             raise UnsupportedUrlScheme(
                 "check-jsonschema only supports http, https, and local files. "
@@ -129,12 +218,107 @@ class SchemaLoader(SchemaLoaderBase):
     def get_schema_retrieval_uri(self) -> str | None:
         return self.reader.get_retrieval_uri()
 
+    def is_current(self) -> bool:
+        # a schema from stdin cannot be read again to see whether it has changed
+        if isinstance(self._reader, StdinSchemaReader):
+            return False
+        return self._loaded_documents.are_current(
+            cache_ttl=self.cache_ttl, offline=self.offline
+        )
+
     def get_schema(self) -> dict[str, t.Any]:
+        retrieval_uri = self.get_schema_retrieval_uri()
+        if retrieval_uri is not None:
+            self._loaded_documents.add(retrieval_uri)
         data = self.reader.read_schema()
         if self.base_uri is not None:
             data["$id"] = self.base_uri
         return data
 
+    @functools.lru_cache
+    def get_schema_fingerprint(self) -> str:
+        retrieval_uri = self.get_schema_retrieval_uri()
+        schema = self.get_schema()
+
+        id_attribute = schema.get("$id")
+        if not isinstance(id_attribute, str):
+            id_attribute = None
+        base_uri = id_attribute if id_attribute is not None else retrieval_uri
+        retrieve = create_retrieve_callable(
+            self._parsers,
+            retrieval_uri,
+            id_attribute,
+            self.disable_cache,
+            cache_ttl=self.cache_ttl,
+            offline=self.offline,
+            on_retrieve=self._loaded_documents.add,
+        )
+        referenced_documents = collect_referenced_documents(retrieve, schema, base_uri)
+
+        validator_class_name = None
+        if self.validator_class is not None:
+            validator_class_name = (
+                f"{self.validator_class.__module__}:{self.validator_class.__qualname__}"
+            )
+        return _fingerprint(
+            retrieval_uri, schema, referenced_documents, validator_class_name
+        )
+
+    def _read_schema_source(self) -> bytes | None:
+        """
+        Read the schema without parsing it, or get None if it cannot be reread.
+        """
+        reader = self.reader
+        if isinstance(reader, StdinSchemaReader):
+            return None
+        return reader.read_schema_bytes()
+
+    def _get_snapshot_key(self) -> str | None:
+        if not self.validator_snapshots:
+            return None
+        try:
+            schema_source = self._read_schema_source()
+        # let the usual schema loading report the error
+        except OSError:
+            return None
+        if schema_source is None:
+            return None
+
+        validator_class_name = None
+        if self.validator_class is not None:
+            validator_class_name = (
+                f"{self.validator_class.__module__}:{self.validator_class.__qualname__}"
+            )
+        return ValidatorSnapshotCache().make_key(
+            schema_source,
+            self.get_schema_retrieval_uri(),
+            self.base_uri,
+            validator_class_name,
+        )
+
+    def _collect_resources(
+        self, retrieval_uri: str | None, schema: dict[str, t.Any]
+    ) -> dict[str, t.Any]:
+        id_attribute = schema.get("$id")
+        if not isinstance(id_attribute, str):
+            id_attribute = None
+        retrieve = create_retrieve_callable(
+            self._parsers,
+            retrieval_uri,
+            id_attribute,
+            self.disable_cache,
+            cache_ttl=self.cache_ttl,
+            offline=self.offline,
+            on_retrieve=self._loaded_documents.add,
+        )
+        documents = collect_referenced_documents(
+            retrieve,
+            schema,
+            id_attribute if id_attribute is not None else retrieval_uri,
+        )
+        # documents which could not be retrieved are left for validation to report
+        return {uri: doc for uri, doc in documents.items() if doc is not None}
+
     def get_validator(
         self,
         path: pathlib.Path | str,
@@ -153,7 +337,32 @@ class SchemaLoader(SchemaLoaderBase):
         fill_defaults: bool,
     ) -> jsonschema.protocols.Validator:
         retrieval_uri = self.get_schema_retrieval_uri()
-        schema = self.get_schema()
+        # the schema is recorded before it is read, even from a snapshot
+        if retrieval_uri is not None:
+            self._loaded_documents.add(retrieval_uri)
+
+        # a snapshot from an earlier run provides the schema and all of its
+        # references, without parsing or retrieving them
+        snapshot_key = self._get_snapshot_key()
+        snapshot = None
+        if snapshot_key is not None:
+            snapshot = ValidatorSnapshotCache().get(snapshot_key)
+            if snapshot is not None and not snapshot.is_current(
+                cache_ttl=self.cache_ttl, offline=self.offline
+            ):
+                snapshot = None
+
+        if snapshot is not None:
+            schema = snapshot.schema
+            resources: dict[str, t.Any] | None = snapshot.resources
+        else:
+            schema = self.get_schema()
+            # retrieve all references now, so that they can be stored
+            resources = (
+                self._collect_resources(retrieval_uri, schema)
+                if snapshot_key is not None
+                else None
+            )
         schema_dialect = _dialect_of_schema(schema)
 
         # format checker (which may be None)
@@ -162,14 +371,37 @@ class SchemaLoader(SchemaLoaderBase):
         # reference resolution
         # with support for YAML, TOML, and other formats from the parsers
         reference_registry = make_reference_registry(
-            self._parsers, retrieval_uri, schema, self.disable_cache
+            self._parsers,
+            retrieval_uri,
+            schema,
+            self.disable_cache,
+            prefetch=self.prefetch_refs,
+            cache_ttl=self.cache_ttl,
+            offline=self.offline,
+            preloaded=resources,
+            on_retrieve=self._loaded_documents.add,
         )
 
+        verified_regex_variants = (
+            set(snapshot.verified_regex_variants) if snapshot is not None else set()
+        )
         if self.validator_class is None:
             # get the correct validator class and check the schema under its metaschema
             validator_cls = jsonschema.validators.validator_for(schema)
 
-            _check_schema(validator_cls, schema, regex_impl=regex_impl)
+            # unless asked to recheck, skip schemas which passed in an earlier run
+            if (
+                self.recheck_schema
+                or regex_impl.variant.value not in verified_regex_variants
+            ):
+                verified_cache = None if self.recheck_schema else VerifiedSchemaCache()
+                _check_schema(
+                    validator_cls,
+                    schema,
+                    regex_impl=regex_impl,
+                    verified_cache=verified_cache,
+                )
+                verified_regex_variants.add(regex_impl.variant.value)
         else:
             # for a user-provided validator class, don't check_schema
             # on the grounds that it might *not* be valid but the user wants to use
@@ -180,6 +412,21 @@ class SchemaLoader(SchemaLoaderBase):
             # we *hope* that it does, but we can't be fully sure
             validator_cls = self.validator_class
 
+        if snapshot_key is not None and (
+            snapshot is None
+            or verified_regex_variants != snapshot.verified_regex_variants
+        ):
+            assert resources is not None
+            ValidatorSnapshotCache().put(
+                snapshot_key,
+                ValidatorSnapshot(
+                    schema,
+                    resources,
+                    verified_regex_variants=verified_regex_variants,
+                    created_at=snapshot.created_at if snapshot is not None else None,
+                ),
+            )
+
         # extend the validator class with default-filling behavior if appropriate
         if fill_defaults:
             validator_cls = _extend_with_default(validator_cls)
@@ -187,6 +434,12 @@ class SchemaLoader(SchemaLoaderBase):
         # set the regex variant for 'pattern' keywords
         validator_cls = _extend_with_pattern_implementation(validator_cls, regex_impl)
 
+        # only build the errors of 'anyOf' and 'oneOf' subschemas which are reported
+        # defaults are filled as subschemas are checked, so when filling defaults,
+        # every subschema must still be checked in full
+        if not fill_defaults:
+            validator_cls = extend_with_lazy_keywords(validator_cls)
+
         # now that we know it's safe to try to create the validator instance, do it
         #
         # TODO: remove type ignore
@@ -205,10 +458,26 @@ def _check_schema(
     schema: dict[str, t.Any],
     *,
     regex_impl: RegexImplementation,
+    verified_cache: VerifiedSchemaCache | None = None,
 ) -> None:
     """A variant definition of Validator.check_schema which uses the regex
-    implementation and format checker specified."""
-    # construct the metaschema validator class (with customized regex impl)
+    implementation and format checker specified.
+
+    If a cache of verified schemas is given, a schema found there is not checked
+    again, and a schema which passes is added to it."""
+    # construct a specialized format checker (customized regex impl)
+    metaschema_dialect = _dialect_of_schema(validator_cls.META_SCHEMA)
+    format_checker = format_checker_for_regex_impl(regex_impl, metaschema_dialect)
+
+    cache_key = None
+    if verified_cache is not None:
+        cache_key = verified_cache.make_key(
+            validator_cls, schema, regex_impl, format_checker
+        )
+        if cache_key in verified_cache:
+            return
+
+    # construct the metaschema validator class (again, customized regex impl)
     schema_validator_cls = jsonschema.validators.validator_for(
         validator_cls.META_SCHEMA, default=validator_cls
     )
@@ -216,10 +485,6 @@ def _check_schema(
         schema_validator_cls, regex_impl
     )
 
-    # construct a specialized format checker (again, customized regex impl)
-    metaschema_dialect = _dialect_of_schema(validator_cls.META_SCHEMA)
-    format_checker = format_checker_for_regex_impl(regex_impl, metaschema_dialect)
-
     # now, construct and apply the actual validator
     schema_validator = schema_validator_cls(
         validator_cls.META_SCHEMA,
@@ -229,6 +494,10 @@ def _check_schema(
     for error in schema_validator.iter_errors(schema):
         raise jsonschema.exceptions.SchemaError.create_from(error)
 
+    if cache_key is not None:
+        assert verified_cache is not None
+        verified_cache.add(cache_key)
+
 
 def _dialect_of_schema(schema: dict[str, t.Any] | bool) -> str | None:
     if not isinstance(schema, dict):
@@ -241,14 +510,37 @@ def _dialect_of_schema(schema: dict[str, t.Any] | bool) -> str | None:
 
 
 class BuiltinSchemaLoader(SchemaLoader):
-    def __init__(self, schema_name: str, *, base_uri: str | None = None) -> None:
+    def __init__(
+        self,
+        schema_name: str,
+        *,
+        base_uri: str | None = None,
+        recheck_schema: bool = False,
+        prefetch_refs: bool = False,
+        offline: bool = False,
+        validator_snapshots: bool = False,
+    ) -> None:
         self.schema_name = schema_name
         self.base_uri = base_uri
+        self.recheck_schema = recheck_schema
+        self.prefetch_refs = prefetch_refs
+        self.offline = offline
+        self.validator_snapshots = validator_snapshots
         self._parsers = ParserSet()
+        self._loaded_documents = _LoadedDocuments()
 
     def get_schema_retrieval_uri(self) -> str | None:
         return None
 
+    def is_current(self) -> bool:
+        # the builtin schema itself never changes, but its references may
+        return self._loaded_documents.are_current(
+            cache_ttl=self.cache_ttl, offline=self.offline
+        )
+
+    def _read_schema_source(self) -> bytes | None:
+        return get_builtin_schema_source(self.schema_name)
+
     def get_schema(self) -> dict[str, t.Any]:
         data = get_builtin_schema(self.schema_name)
         if self.base_uri is not None:
@@ -264,6 +556,11 @@ class MetaSchemaLoader(SchemaLoaderBase):
                 "This combination is not supported."
             )
 
+    def get_schema_fingerprint(self) -> str:
+        # the metaschema is chosen by each instance, so it is covered by the
+        # content of the instance; the metaschemas themselves ship with 'jsonschema'
+        return _fingerprint("metaschema", importlib.metadata.version("jsonschema"))
+
     def get_validator(
         self,
         path: pathlib.Path | str,
@@ -273,8 +570,21 @@ class MetaSchemaLoader(SchemaLoaderBase):
         fill_defaults: bool,
     ) -> jsonschema.protocols.Validator:
         schema_validator = jsonschema.validators.validator_for(instance_doc)
-        meta_validator_class = jsonschema.validators.validator_for(
-            schema_validator.META_SCHEMA, default=schema_validator
+        return self._get_metaschema_validator(schema_validator, format_opts)
+
+    # metaschema validators are built once per dialect and reused for all of the
+    # instances which use that dialect
+    # in parallel runs, each worker process builds its own
+    @functools.lru_cache
+    def _get_metaschema_validator(
+        self,
+        schema_validator: type[jsonschema.protocols.Validator],
+        format_opts: FormatOptions,
+    ) -> jsonschema.protocols.Validator:
+        meta_validator_class = extend_with_lazy_keywords(
+            jsonschema.validators.validator_for(
+                schema_validator.META_SCHEMA, default=schema_validator
+            )
         )
 
         # format checker (which may be None)
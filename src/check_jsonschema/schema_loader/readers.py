@@ -43,6 +43,9 @@ class LocalSchemaReader:
     def get_retrieval_uri(self) -> str | None:
         return self.path.as_uri()
 
+    def read_schema_bytes(self) -> bytes:
+        return self.path.read_bytes()
+
     def _read_impl(self) -> t.Any:
         return self.parsers.parse_file(self.path, default_filetype="json")
 
@@ -74,12 +77,16 @@ class HttpSchemaReader:
         self,
         url: str,
         disable_cache: bool,
+        *,
+        cache_ttl: float | None = None,
+        offline: bool = False,
     ) -> None:
         self.url = url
         self.parsers = ParserSet()
-        self.downloader = CacheDownloader("schemas", disable_cache=disable_cache).bind(
-            url, validation_callback=self._parse
-        )
+        self.downloader = CacheDownloader(
+            "schemas", disable_cache=disable_cache, cache_ttl=cache_ttl, offline=offline
+        ).bind(url, validation_callback=self._parse)
+        self._schema_bytes: bytes | None = None
         self._parsed_schema: dict | _UnsetType = _UNSET
 
     def _parse(self, schema_bytes: bytes) -> t.Any:
@@ -90,9 +97,14 @@ class HttpSchemaReader:
     def get_retrieval_uri(self) -> str | None:
         return self.url
 
+    def read_schema_bytes(self) -> bytes:
+        if self._schema_bytes is None:
+            with self.downloader.open() as fp:
+                self._schema_bytes = fp.read()
+        return self._schema_bytes
+
     def _read_impl(self) -> t.Any:
-        with self.downloader.open() as fp:
-            return self._parse(fp.read())
+        return self._parse(self.read_schema_bytes())
 
     def read_schema(self) -> dict:
         if self._parsed_schema is _UNSET:
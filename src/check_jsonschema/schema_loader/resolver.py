@@ -1,18 +1,47 @@
 from __future__ import annotations
 
+import concurrent.futures
 import typing as t
 import urllib.parse
 
 import referencing
-from referencing.jsonschema import DRAFT202012, Schema
+from referencing.jsonschema import DRAFT202012, Schema, specification_with
 
 from ..cachedownloader import CacheDownloader
 from ..parsers import ParserSet
 from ..utils import filename2path
 
+# the number of referenced documents which are retrieved at the same time
+_RETRIEVAL_MAX_WORKERS = 8
+
+# keywords whose values are instance data rather than schemas, and so can hold a
+# '$ref' which is not a reference
+_DATA_KEYWORDS = frozenset({"const", "default", "enum", "examples"})
+# keywords whose values map names to schemas, which may use any name, such as a
+# property named 'default'
+_SCHEMA_MAP_KEYWORDS = frozenset(
+    {
+        "$defs",
+        "definitions",
+        "dependencies",
+        "dependentSchemas",
+        "patternProperties",
+        "properties",
+    }
+)
+
 
 def make_reference_registry(
-    parsers: ParserSet, retrieval_uri: str | None, schema: dict, disable_cache: bool
+    parsers: ParserSet,
+    retrieval_uri: str | None,
+    schema: dict,
+    disable_cache: bool,
+    prefetch: bool = False,
+    *,
+    cache_ttl: float | None = None,
+    offline: bool = False,
+    preloaded: dict[str, t.Any] | None = None,
+    on_retrieve: t.Callable[[str], None] | None = None,
 ) -> referencing.Registry:
     id_attribute_: t.Any = schema.get("$id")
     if isinstance(id_attribute_, str):
@@ -23,12 +52,30 @@ def make_reference_registry(
     schema_resource = referencing.Resource.from_contents(
         schema, default_specification=DRAFT202012
     )
+    retrieve = create_retrieve_callable(
+        parsers,
+        retrieval_uri,
+        id_attribute,
+        disable_cache,
+        cache_ttl=cache_ttl,
+        offline=offline,
+        preloaded=preloaded,
+        on_retrieve=on_retrieve,
+    )
+    if prefetch:
+        # retrieve every referenced document now, concurrently, rather than one at a
+        # time as validation reaches them
+        # the retrieve callable keeps the results for validation to use
+        collect_referenced_documents(
+            retrieve,
+            schema,
+            id_attribute if id_attribute is not None else retrieval_uri,
+        )
+
     # mypy does not recognize that Registry is an `attrs` class and has `retrieve` as an
     # argument to its implicit initializer
     registry: referencing.Registry = referencing.Registry(  # type: ignore[call-arg]
-        retrieve=create_retrieve_callable(
-            parsers, retrieval_uri, id_attribute, disable_cache
-        )
+        retrieve=retrieve
     )
 
     if retrieval_uri is not None:
@@ -44,13 +91,32 @@ def create_retrieve_callable(
     retrieval_uri: str | None,
     id_attribute: str | None,
     disable_cache: bool,
+    *,
+    cache_ttl: float | None = None,
+    offline: bool = False,
+    preloaded: dict[str, t.Any] | None = None,
+    on_retrieve: t.Callable[[str], None] | None = None,
 ) -> t.Callable[[str], referencing.Resource[Schema]]:
+    """
+    Create a callable which retrieves referenced documents by URI.
+
+    'preloaded' maps absolute URIs to the contents of documents which have already
+    been retrieved, and which are used without retrieving them again.
+    'on_retrieve' is called with the absolute URI of each document which is used,
+    just before it is first read.
+    """
     base_uri = id_attribute
     if base_uri is None:
         base_uri = retrieval_uri
 
     cache = ResourceCache()
-    downloader = CacheDownloader("refs", disable_cache=disable_cache)
+    for uri, contents in (preloaded or {}).items():
+        cache[uri] = contents
+        if on_retrieve is not None:
+            on_retrieve(uri)
+    downloader = CacheDownloader(
+        "refs", disable_cache=disable_cache, cache_ttl=cache_ttl, offline=offline
+    )
 
     def get_local_file(uri: str) -> t.Any:
         path = filename2path(uri)
@@ -65,6 +131,8 @@ def create_retrieve_callable(
 
         if full_uri in cache:
             return cache[full_uri]
+        if on_retrieve is not None:
+            on_retrieve(full_uri)
 
         full_uri_scheme = urllib.parse.urlsplit(full_uri).scheme
         if full_uri_scheme in ("http", "https"):
@@ -88,6 +156,111 @@ def create_retrieve_callable(
     return retrieve_reference
 
 
+def _resolve_uri(base_uri: str | None, uri: str) -> str:
+    if base_uri is not None:
+        uri = urllib.parse.urljoin(base_uri, uri)
+    return urllib.parse.urldefrag(uri)[0]
+
+
+def iter_ref_uris(document: t.Any, base_uri: str | None) -> t.Iterator[str]:
+    """
+    Find the URIs of all documents referred to by `$ref`s in a schema document.
+
+    URIs are resolved against the base URI in effect where each `$ref` appears, as
+    changed by any embedded `$id`s, and fragments are removed. References to the
+    document itself, or to resources embedded in it, are not included.
+    The values of keywords which hold instance data, such as `examples`, are not
+    searched.
+    """
+    dialect_id = document.get("$schema") if isinstance(document, dict) else None
+    specification = (
+        specification_with(dialect_id, default=DRAFT202012)
+        if isinstance(dialect_id, str)
+        else DRAFT202012
+    )
+    embedded_uris = set()
+    if base_uri is not None:
+        embedded_uris.add(_resolve_uri(None, base_uri))
+    ref_uris: dict[str, None] = {}
+
+    stack: list[tuple[t.Any, str | None]] = [(document, base_uri)]
+    while stack:
+        node, node_base = stack.pop()
+        if isinstance(node, dict):
+            id_attribute = specification.id_of(node)
+            if isinstance(id_attribute, str):
+                node_base = _resolve_uri(node_base, id_attribute)
+                embedded_uris.add(node_base)
+            ref = node.get("$ref")
+            if isinstance(ref, str):
+                ref_uri = _resolve_uri(node_base, ref)
+                if ref_uri:
+                    ref_uris[ref_uri] = None
+            for keyword, value in node.items():
+                if keyword in _DATA_KEYWORDS:
+                    continue
+                if keyword in _SCHEMA_MAP_KEYWORDS and isinstance(value, dict):
+                    stack.extend((subschema, node_base) for subschema in value.values())
+                else:
+                    stack.append((value, node_base))
+        elif isinstance(node, list):
+            stack.extend((item, node_base) for item in node)
+
+    for ref_uri in ref_uris:
+        if ref_uri not in embedded_uris:
+            yield ref_uri
+
+
+def collect_referenced_documents(
+    retrieve: t.Callable[[str], referencing.Resource[Schema]],
+    schema: dict,
+    base_uri: str | None,
+    *,
+    max_workers: int = _RETRIEVAL_MAX_WORKERS,
+) -> dict[str, t.Any]:
+    """
+    Retrieve all documents which are transitively referenced by a schema.
+
+    Documents are retrieved concurrently, in rounds: all of the references found in
+    one round of documents are retrieved together, and then searched for further
+    references.
+
+    The result maps URIs to document contents, or to `None` for any document which
+    could not be retrieved. Failures are left for validation to report, if the
+    reference is actually used.
+    """
+
+    def try_retrieve(uri: str) -> t.Any:
+        try:
+            return retrieve(uri).contents
+        except Exception:
+            return None
+
+    documents: dict[str, t.Any] = {}
+    pending: list[tuple[t.Any, str | None]] = [(schema, base_uri)]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while pending:
+            # use a dict to dedupe while keeping the order of discovery
+            new_uris: dict[str, None] = {}
+            for document, document_base in pending:
+                for uri in iter_ref_uris(document, document_base):
+                    if uri not in documents:
+                        new_uris[uri] = None
+
+            pending = []
+            for uri, contents in zip(new_uris, pool.map(try_retrieve, new_uris)):
+                documents[uri] = contents
+                if contents is None:
+                    continue
+                id_attribute = (
+                    contents.get("$id") if isinstance(contents, dict) else None
+                )
+                pending.append(
+                    (contents, id_attribute if isinstance(id_attribute, str) else uri)
+                )
+    return documents
+
+
 class ResourceCache:
     def __init__(self) -> None:
         self._cache: t.Dict[str, referencing.Resource[Schema]] = {}
@@ -0,0 +1,174 @@
+"""
+A persistent cache of everything needed to build a validator for a schema.
+
+A snapshot holds the parsed schema, the contents of every document it references,
+and the regex variants under which the schema passed its metaschema check. With a
+snapshot, a validator is built without parsing the schema, retrieving any
+references, or checking the schema.
+
+Snapshots are keyed by a digest of the raw schema and the options which change how
+it is loaded. A snapshot which includes local files is only used while those files
+are unchanged. A snapshot which includes remote documents is only used when those
+documents could be used from the download cache without a request: when offline, or
+within the cache TTL.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.metadata
+import os
+import time
+import typing as t
+import urllib.parse
+
+from ..cachedownloader import _atomic_write, _resolve_cache_dir, prune_cache_dir
+from ..parsers import json_
+from ..utils import filename2path
+
+# bump this to invalidate all existing snapshots if the stored data changes
+_SNAPSHOT_FORMAT_VERSION = 2
+
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+
+
+def _is_remote(uri: str) -> bool:
+    return urllib.parse.urlsplit(uri).scheme in ("http", "https")
+
+
+def _stat_local_file(uri: str) -> tuple[int, int] | None:
+    try:
+        stat = filename2path(uri).stat()
+    except (OSError, ValueError):
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class ValidatorSnapshot:
+    def __init__(
+        self,
+        schema: dict[str, t.Any],
+        resources: dict[str, t.Any],
+        *,
+        verified_regex_variants: t.Iterable[str] = (),
+        created_at: float | None = None,
+    ) -> None:
+        self.schema = schema
+        # map URIs to the contents of the documents retrieved from them
+        self.resources = resources
+        self.verified_regex_variants = set(verified_regex_variants)
+        self.created_at = time.time() if created_at is None else created_at
+        # record local files as they are now, so that changes to them can be seen
+        self.local_files = {
+            uri: _stat_local_file(uri) for uri in resources if not _is_remote(uri)
+        }
+
+    def to_json(self) -> dict[str, t.Any]:
+        return {
+            "schema": self.schema,
+            "resources": self.resources,
+            "verified_regex_variants": sorted(self.verified_regex_variants),
+            "created_at": self.created_at,
+            "local_files": self.local_files,
+        }
+
+    @classmethod
+    def from_json(cls, data: t.Any) -> ValidatorSnapshot:
+        """
+        Rebuild a snapshot from the data made by 'to_json'.
+
+        Raises a ValueError if the data is not in that form.
+        """
+        try:
+            snapshot = cls(
+                data["schema"],
+                data["resources"],
+                verified_regex_variants=data["verified_regex_variants"],
+                created_at=float(data["created_at"]),
+            )
+            # the local files are as they were when the snapshot was made, not as
+            # they are now
+            snapshot.local_files = {
+                uri: None if stamp is None else (int(stamp[0]), int(stamp[1]))
+                for uri, stamp in data["local_files"].items()
+            }
+        except (LookupError, TypeError, AttributeError) as e:
+            raise ValueError("malformed snapshot") from e
+        if not isinstance(snapshot.schema, dict) or not isinstance(
+            snapshot.resources, dict
+        ):
+            raise ValueError("malformed snapshot")
+        return snapshot
+
+    def is_current(self, *, cache_ttl: float | None, offline: bool) -> bool:
+        for uri, stamp in self.local_files.items():
+            if stamp is None or _stat_local_file(uri) != stamp:
+                return False
+        if offline or not any(_is_remote(uri) for uri in self.resources):
+            return True
+        return cache_ttl is not None and time.time() - self.created_at < cache_ttl
+
+
+class ValidatorSnapshotCache:
+    def __init__(
+        self,
+        cache_dir: str = "validator-snapshots",
+        *,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ) -> None:
+        self._cache_dir = _resolve_cache_dir(cache_dir)
+        self._max_size = max_size
+
+    def make_key(self, schema_source: bytes, *parts: str | None) -> str:
+        hasher = hashlib.sha256()
+        for part in (
+            str(_SNAPSHOT_FORMAT_VERSION),
+            importlib.metadata.version("jsonschema"),
+            *parts,
+        ):
+            hasher.update(b"-" if part is None else b"+" + part.encode())
+            hasher.update(b"\0")
+        hasher.update(schema_source)
+        return hasher.hexdigest()
+
+    def _snapshot_path(self, key: str) -> str:
+        assert self._cache_dir is not None
+        return os.path.join(self._cache_dir, key + ".json")
+
+    def get(self, key: str) -> ValidatorSnapshot | None:
+        if self._cache_dir is None:
+            return None
+        path = self._snapshot_path(key)
+        try:
+            with open(path, "rb") as fp:
+                data = json_.loads(fp.read())
+            # mark the snapshot as recently used, for eviction
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        # a corrupt or incompatible snapshot is a miss, and will be overwritten
+        except (OSError, ValueError):
+            return None
+        try:
+            return ValidatorSnapshot.from_json(data)
+        except ValueError:
+            return None
+
+    def put(self, key: str, snapshot: ValidatorSnapshot) -> None:
+        if self._cache_dir is None:
+            return
+        try:
+            data = json_.dumps(snapshot.to_json())
+        # schemas parsed from YAML may hold data which JSON cannot store
+        # in that case, simply skip storing the snapshot
+        except (TypeError, ValueError):
+            return
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            _atomic_write(self._snapshot_path(key), data)
+        # failing to write a snapshot only means that it is rebuilt next time
+        except OSError:
+            return
+        prune_cache_dir(
+            self._cache_dir, self._max_size, keep=(self._snapshot_path(key),)
+        )
@@ -0,0 +1,94 @@
+"""
+A persistent record of schemas which have passed their metaschema check.
+
+Checking a schema under its metaschema can take much longer than validating small
+instance files, and most schemas do not change between runs. Each schema which
+passes the check is recorded under the user cache dir, keyed by a digest of the
+schema, its dialect, the regex variant used for the check, and the formats which
+could be checked. Failures are never recorded, so an invalid schema is always
+reported.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.metadata
+import json
+import os
+import time
+import typing as t
+
+import jsonschema
+
+from ..cachedownloader import _atomic_write, _resolve_cache_dir, prune_cache_dir
+from ..regex_variants import RegexImplementation
+
+# bump this to invalidate all existing records if the meaning of a key changes
+_RECORD_FORMAT_VERSION = 2
+
+# each record holds only the time of its check, so this keeps a few thousand
+DEFAULT_MAX_SIZE = 64 * 1024
+
+
+class VerifiedSchemaCache:
+    def __init__(
+        self,
+        cache_dir: str = "verified-schemas",
+        *,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ) -> None:
+        self._cache_dir = _resolve_cache_dir(cache_dir)
+        self._max_size = max_size
+
+    def make_key(
+        self,
+        validator_cls: type[jsonschema.protocols.Validator],
+        schema: dict[str, t.Any],
+        regex_impl: RegexImplementation,
+        format_checker: jsonschema.FormatChecker,
+    ) -> str:
+        # the dialect is identified by its metaschema, and the metaschemas ship
+        # with 'jsonschema', so its version is part of the key
+        # the formats which can be checked depend on the optional packages which
+        # are installed, so a schema is checked again when they change
+        hasher = hashlib.sha256()
+        for part in (
+            str(_RECORD_FORMAT_VERSION),
+            importlib.metadata.version("jsonschema"),
+            json.dumps(validator_cls.META_SCHEMA, sort_keys=True, default=str),
+            regex_impl.variant.value,
+            ",".join(sorted(format_checker.checkers)),
+        ):
+            hasher.update(part.encode())
+            hasher.update(b"\0")
+        hasher.update(
+            json.dumps(
+                schema, sort_keys=True, separators=(",", ":"), default=str
+            ).encode()
+        )
+        return hasher.hexdigest()
+
+    def _record_path(self, key: str) -> str:
+        assert self._cache_dir is not None
+        return os.path.join(self._cache_dir, key)
+
+    def __contains__(self, key: str) -> bool:
+        if self._cache_dir is None:
+            return False
+        try:
+            # mark the record as recently used, for eviction
+            os.utime(self._record_path(key))
+        except OSError:
+            return False
+        return True
+
+    def add(self, key: str) -> None:
+        if self._cache_dir is None:
+            return
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            _atomic_write(self._record_path(key), str(time.time()).encode())
+        # failing to write a record only means that the check is repeated next time
+        except OSError:
+            return
+        prune_cache_dir(self._cache_dir, self._max_size, keep=(self._record_path(key),))
@@ -1,3 +1,4 @@
+import json
 import textwrap
 
 import pytest
@@ -39,3 +40,19 @@ def run_line_simple(run_line):
         assert res.exit_code == 0, _render_result(res)
 
     return func
+
+
+@pytest.fixture
+def schema():
+    # override or parametrize this fixture to check against a different schema
+    return {
+        "$schema": "http://json-schema.org/draft-07/schema",
+        "properties": {"title": {"type": "string"}},
+    }
+
+
+@pytest.fixture
+def schemafile(tmp_path, schema):
+    path = tmp_path / "schema.json"
+    path.write_text(json.dumps(schema))
+    return str(path)
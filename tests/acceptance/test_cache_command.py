@@ -0,0 +1,178 @@
+import json
+import os
+import time
+
+import pytest
+import responses
+
+SCHEMA_URL = "https://example.com/schemas/main.json"
+OTHER_SCHEMA_URL = "https://example.com/schemas/other.json"
+
+
+@pytest.fixture
+def schemas_cache_dir(cache_dir):
+    return cache_dir / "check_jsonschema" / "schemas"
+
+
+def _warm(run_line, *urls):
+    for url in urls:
+        responses.add("GET", url, json={"type": "object"}, headers={"ETag": '"v1"'})
+    return run_line(["check-jsonschema", "cache", "warm", *urls])
+
+
+def test_cache_warm_then_list(run_line):
+    result = _warm(run_line, SCHEMA_URL, OTHER_SCHEMA_URL)
+    assert result.exit_code == 0, result.stderr
+    assert f"cached {SCHEMA_URL}" in result.stdout
+
+    result = run_line(["check-jsonschema", "cache", "list", "-o", "json"])
+    assert result.exit_code == 0, result.stderr
+    entries = json.loads(result.stdout)
+    assert sorted(e["url"] for e in entries) == [SCHEMA_URL, OTHER_SCHEMA_URL]
+    assert {e["cache"] for e in entries} == {"schemas"}
+    assert {e["etag"] for e in entries} == {'"v1"'}
+
+    result = run_line(["check-jsonschema", "cache", "list"])
+    assert result.exit_code == 0, result.stderr
+    assert SCHEMA_URL in result.stdout
+    assert "2 cached files" in result.stdout
+
+
+def test_cache_warm_reports_failures(run_line):
+    responses.add("GET", SCHEMA_URL, body="{", status=200)
+    result = run_line(["check-jsonschema", "cache", "warm", SCHEMA_URL])
+    assert result.exit_code == 1
+    assert f"failed to cache {SCHEMA_URL}" in result.stderr
+
+
+@pytest.mark.parametrize("args", (["schema.json"], []))
+def test_cache_warm_rejects_bad_arguments(run_line, args):
+    result = run_line(["check-jsonschema", "cache", "warm", *args])
+    assert result.exit_code == 2
+
+
+def test_cache_warm_downloads_refs_for_offline_use(run_line, tmp_path):
+    responses.add(
+        "GET",
+        SCHEMA_URL,
+        json={
+            "$schema": "http://json-schema.org/draft-07/schema",
+            "properties": {"title": {"$ref": "./title.json"}},
+        },
+    )
+    responses.add(
+        "GET",
+        "https://example.com/schemas/title.json",
+        json={"$ref": "https://example.org/string.json"},
+    )
+    responses.add("GET", "https://example.org/string.json", json={"type": "string"})
+
+    result = run_line(["check-jsonschema", "cache", "warm", SCHEMA_URL])
+    assert result.exit_code == 0, result.stderr
+    assert len(responses.calls) == 3
+
+    # with no network, validation uses only the cached schema and refs
+    responses.reset()
+    doc = tmp_path / "instance.json"
+    for title, expect_exit_code in (("doc one", 0), (2, 1)):
+        doc.write_text(json.dumps({"title": title}))
+        result = run_line(
+            ["check-jsonschema", "--offline", "--schemafile", SCHEMA_URL, str(doc)]
+        )
+        assert result.exit_code == expect_exit_code, result.stdout + result.stderr
+    assert len(responses.calls) == 0
+
+
+def test_cache_warm_reports_failed_refs(run_line):
+    responses.add("GET", SCHEMA_URL, json={"$ref": "./missing.json"})
+    responses.add("GET", "https://example.com/schemas/missing.json", status=404)
+
+    result = run_line(["check-jsonschema", "cache", "warm", SCHEMA_URL])
+    assert result.exit_code == 1
+    assert (
+        "failed to cache https://example.com/schemas/missing.json, "
+        f"used by {SCHEMA_URL}"
+    ) in result.stderr
+
+
+def test_cache_warm_catalog(run_line, monkeypatch):
+    monkeypatch.setattr(
+        "check_jsonschema.cli.cache_command.SCHEMA_CATALOG",
+        {"main": {"url": SCHEMA_URL}, "other": {"url": OTHER_SCHEMA_URL}},
+    )
+    responses.add("GET", SCHEMA_URL, json={"type": "object"})
+    responses.add("GET", OTHER_SCHEMA_URL, json={"type": "object"})
+
+    result = run_line(
+        ["check-jsonschema", "cache", "warm", "--catalog", "--jobs", "2", SCHEMA_URL]
+    )
+    assert result.exit_code == 0, result.stderr
+    # each schema is downloaded once, and reported in order
+    assert result.stdout.splitlines() == [
+        f"cached {SCHEMA_URL}",
+        f"cached {OTHER_SCHEMA_URL}",
+    ]
+    assert len(responses.calls) == 2
+
+
+def test_cache_prune_evicts_least_recently_used(run_line, schemas_cache_dir):
+    _warm(run_line, SCHEMA_URL, OTHER_SCHEMA_URL)
+
+    # mark the first schema as used long ago
+    for name in os.listdir(schemas_cache_dir):
+        path = schemas_cache_dir / name
+        if name.endswith(".meta.json") and SCHEMA_URL in path.read_text():
+            old = time.time() - 3600
+            os.utime(path, (old, old))
+
+    entry_sizes = [
+        (schemas_cache_dir / name).stat().st_size
+        for name in os.listdir(schemas_cache_dir)
+    ]
+    max_size = sum(entry_sizes) - 1
+    result = run_line(
+        ["check-jsonschema", "cache", "prune", "--max-size", str(max_size)]
+    )
+    assert result.exit_code == 0, result.stderr
+    assert "removed 1 cached files" in result.stdout
+
+    result = run_line(["check-jsonschema", "cache", "list", "-o", "json"])
+    assert [e["url"] for e in json.loads(result.stdout)] == [OTHER_SCHEMA_URL]
+
+
+def test_cache_clear(run_line, schemas_cache_dir):
+    _warm(run_line, SCHEMA_URL)
+    assert os.listdir(schemas_cache_dir)
+
+    result = run_line(["check-jsonschema", "cache", "clear"])
+    assert result.exit_code == 0, result.stderr
+    assert "removed 1 cached files" in result.stdout
+    assert os.listdir(schemas_cache_dir) == []
+
+
+def test_cache_clear_all(run_line, cache_dir):
+    _warm(run_line, SCHEMA_URL)
+
+    result = run_line(["check-jsonschema", "cache", "clear", "--all"])
+    assert result.exit_code == 0, result.stderr
+    assert not (cache_dir / "check_jsonschema").exists()
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["--schemafile", "schema.json", "cache"],
+        ["--schemafile", "schema.json", "--", "cache"],
+        ["--schemafile", "schema.json", "./cache"],
+    ],
+)
+def test_instance_named_like_a_subcommand_is_checked(
+    run_line, tmp_path, monkeypatch, args
+):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "schema.json").write_text(json.dumps({"type": "string"}))
+    (tmp_path / "cache").write_text("1")
+
+    result = run_line(["check-jsonschema", *args])
+    assert result.exit_code == 1
+    assert "1 is not of type 'string'" in result.stdout
@@ -0,0 +1,107 @@
+import json
+
+import pytest
+
+SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema",
+    "properties": {"title": {"type": "string"}},
+}
+
+
+@pytest.fixture
+def results_cache_dir(cache_dir):
+    return cache_dir / "check_jsonschema" / "results"
+
+
+def test_results_are_cached_and_reused(run_line, tmp_path, results_cache_dir):
+    schema = tmp_path / "schema.json"
+    schema.write_text(json.dumps(SCHEMA))
+    good = tmp_path / "good.json"
+    good.write_text('{"title": "ok"}')
+    bad = tmp_path / "bad.json"
+    bad.write_text('{"title": 1}')
+
+    cmd = ["check-jsonschema", "--result-cache", "--schemafile", str(schema)]
+    first = run_line(cmd + [str(good), str(bad)])
+    assert first.exit_code == 1
+    assert len(list(results_cache_dir.iterdir())) == 2
+
+    second = run_line(cmd + [str(good), str(bad)])
+    assert second.exit_code == 1
+    assert second.stdout == first.stdout
+    assert len(list(results_cache_dir.iterdir())) == 2
+
+
+def test_schema_change_invalidates_results(run_line, tmp_path, results_cache_dir):
+    schema = tmp_path / "schema.json"
+    schema.write_text(json.dumps(SCHEMA))
+    doc = tmp_path / "doc.json"
+    doc.write_text('{"title": 1}')
+
+    cmd = ["check-jsonschema", "--result-cache", "--schemafile", str(schema), str(doc)]
+    assert run_line(cmd).exit_code == 1
+
+    schema.write_text(json.dumps({"properties": {"title": {"type": "integer"}}}))
+    assert run_line(cmd).exit_code == 0
+    assert len(list(results_cache_dir.iterdir())) == 2
+
+
+def test_referenced_schema_change_invalidates_results(
+    run_line, tmp_path, results_cache_dir
+):
+    ref_schema = tmp_path / "title.json"
+    ref_schema.write_text(json.dumps({"type": "string"}))
+    schema = tmp_path / "schema.json"
+    schema.write_text(json.dumps({"properties": {"title": {"$ref": "./title.json"}}}))
+    doc = tmp_path / "doc.json"
+    doc.write_text('{"title": 1}')
+
+    cmd = ["check-jsonschema", "--result-cache", "--schemafile", str(schema), str(doc)]
+    assert run_line(cmd).exit_code == 1
+
+    ref_schema.write_text(json.dumps({"type": "integer"}))
+    assert run_line(cmd).exit_code == 0
+
+
+def test_change_of_ref_under_embedded_id_invalidates_results(
+    run_line, tmp_path, results_cache_dir
+):
+    (tmp_path / "sub").mkdir()
+    leaf = tmp_path / "sub" / "leaf.json"
+    leaf.write_text(json.dumps({"type": "string"}))
+    schema = tmp_path / "schema.json"
+    schema.write_text(
+        json.dumps(
+            {
+                "$ref": "#/$defs/s",
+                "$defs": {
+                    "s": {
+                        "$id": (tmp_path / "sub" / "x.json").as_uri(),
+                        "$ref": "leaf.json",
+                    }
+                },
+            }
+        )
+    )
+    doc = tmp_path / "doc.json"
+    doc.write_text("1")
+
+    cmd = ["check-jsonschema", "--result-cache", "--schemafile", str(schema), str(doc)]
+    assert run_line(cmd).exit_code == 1
+
+    leaf.write_text(json.dumps({"type": "integer"}))
+    assert run_line(cmd).exit_code == 0
+
+
+def test_parse_errors_are_not_cached(run_line, tmp_path, results_cache_dir):
+    schema = tmp_path / "schema.json"
+    schema.write_text(json.dumps(SCHEMA))
+    doc = tmp_path / "doc.json"
+    doc.write_text("{")
+
+    res = run_line(
+        ["check-jsonschema", "--result-cache", "--schemafile", str(schema), str(doc)]
+    )
+    assert res.exit_code == 1
+    assert "Failed to parse" in res.stdout
+    assert not results_cache_dir.exists() or not list(results_cache_dir.iterdir())
@@ -0,0 +1,132 @@
+import json
+
+import pytest
+
+
+@pytest.fixture
+def schema():
+    return {
+        "$schema": "http://json-schema.org/draft-07/schema",
+        "properties": {
+            "a": {"type": "string"},
+            "b": {"type": "string"},
+            "c": {"type": "string"},
+        },
+    }
+
+
+@pytest.fixture
+def instance_files(tmp_path):
+    paths = []
+    for name, doc in (
+        ("good1.json", {"a": "x"}),
+        ("bad1.json", {"a": 1, "b": 2, "c": 3}),
+        ("good2.json", {"b": "y"}),
+        ("bad2.json", {"a": 1}),
+    ):
+        path = tmp_path / name
+        path.write_text(json.dumps(doc))
+        paths.append(str(path))
+    return paths
+
+
+def _run(run_line, schemafile, instance_files, *args):
+    return run_line(
+        ["check-jsonschema", "-o", "json", "--schemafile", schemafile, *args]
+        + instance_files
+    )
+
+
+def _error_files(result):
+    return [err["filename"].rsplit("/", 1)[-1] for err in result["errors"]]
+
+
+def test_no_limits_reports_everything(run_line, schemafile, instance_files):
+    res = _run(run_line, schemafile, instance_files)
+    assert res.exit_code == 1
+    result = json.loads(res.stdout)
+    assert _error_files(result) == ["bad1.json"] * 3 + ["bad2.json"]
+    assert "truncated" not in result
+
+
+def test_fail_fast(run_line, schemafile, instance_files):
+    res = _run(run_line, schemafile, instance_files, "--fail-fast")
+    assert res.exit_code == 1
+    result = json.loads(res.stdout)
+    assert _error_files(result) == ["bad1.json"] * 3
+    assert result["truncated"] == ["stopped after the first failing file (--fail-fast)"]
+
+
+def test_fail_fast_on_the_last_file_is_not_truncated(
+    run_line, schemafile, instance_files
+):
+    res = _run(run_line, schemafile, instance_files[-1:], "--fail-fast")
+    assert res.exit_code == 1
+    assert "truncated" not in json.loads(res.stdout)
+
+
+def test_max_errors(run_line, schemafile, instance_files):
+    res = _run(run_line, schemafile, instance_files, "--max-errors", "2")
+    assert res.exit_code == 1
+    result = json.loads(res.stdout)
+    assert _error_files(result) == ["bad1.json"] * 2
+    assert result["truncated"] == ["stopped after 2 errors (--max-errors)"]
+
+
+def test_max_errors_not_reached(run_line, schemafile, instance_files):
+    res = _run(run_line, schemafile, instance_files, "--max-errors", "4")
+    assert res.exit_code == 1
+    result = json.loads(res.stdout)
+    assert len(result["errors"]) == 4
+    assert "truncated" not in result
+
+
+def test_max_errors_per_file(run_line, schemafile, instance_files):
+    res = _run(run_line, schemafile, instance_files, "--max-errors-per-file", "1")
+    assert res.exit_code == 1
+    result = json.loads(res.stdout)
+    assert _error_files(result) == ["bad1.json", "bad2.json"]
+    assert len(result["truncated"]) == 1
+    assert result["truncated"][0].endswith(
+        "bad1.json: stopped after 1 error (--max-errors-per-file)"
+    )
+
+
+def test_text_output_marks_truncation(run_line, schemafile, instance_files):
+    res = run_line(
+        ["check-jsonschema", "--schemafile", schemafile, "--fail-fast"] + instance_files
+    )
+    assert res.exit_code == 1
+    assert "bad1.json::$.a" in res.stdout
+    assert "bad2.json" not in res.stdout
+    assert "Results were truncated" in res.stdout
+    assert "stopped after the first failing file (--fail-fast)" in res.stdout
+
+
+@pytest.mark.parametrize(
+    "limit_args",
+    (["--fail-fast"], ["--max-errors", "2"], ["--max-errors-per-file", "1"]),
+)
+def test_limits_with_parallel_jobs(run_line, schemafile, instance_files, limit_args):
+    serial_res = _run(run_line, schemafile, instance_files, *limit_args)
+    parallel_res = _run(run_line, schemafile, instance_files, "-j", "2", *limit_args)
+    assert parallel_res.exit_code == serial_res.exit_code == 1
+    assert parallel_res.stdout == serial_res.stdout
+
+
+def test_truncated_results_are_not_cached(run_line, schemafile, instance_files):
+    bad1 = instance_files[1:2]
+    limited = _run(
+        run_line, schemafile, bad1, "--result-cache", "--max-errors-per-file", "1"
+    )
+    assert len(json.loads(limited.stdout)["errors"]) == 1
+
+    full = _run(run_line, schemafile, bad1, "--result-cache")
+    assert len(json.loads(full.stdout)["errors"]) == 3
+
+    # a complete cached result is still cut to the limit
+    limited = _run(
+        run_line, schemafile, bad1, "--result-cache", "--max-errors-per-file", "1"
+    )
+    assert len(json.loads(limited.stdout)["errors"]) == 1
+    assert "truncated" in json.loads(limited.stdout)
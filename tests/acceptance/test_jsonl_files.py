@@ -0,0 +1,84 @@
+import json
+
+import pytest
+
+
+@pytest.fixture
+def schema():
+    return {
+        "$schema": "http://json-schema.org/draft-07/schema",
+        "type": "object",
+        "properties": {"name": {"type": "string"}},
+    }
+
+
+def _write_records(path, *lines):
+    path.write_text("\n".join(lines) + "\n")
+    return str(path)
+
+
+def test_jsonl_passing(run_line, schemafile, tmp_path):
+    doc = _write_records(tmp_path / "events.jsonl", '{"name": "a"}', "", "{}")
+    res = run_line(["check-jsonschema", "--schemafile", schemafile, doc])
+    assert res.exit_code == 0, res.stdout
+    assert "ok -- validation done" in res.stdout
+
+
+def test_jsonl_errors_are_reported_by_line(run_line, schemafile, tmp_path):
+    doc = _write_records(
+        tmp_path / "events.ndjson", '{"name": "a"}', '{"name": 1}', "{", '{"name": 2}'
+    )
+    res = run_line(["check-jsonschema", "-o", "json", "--schemafile", schemafile, doc])
+    assert res.exit_code == 1
+    result = json.loads(res.stdout)
+    assert [(e["filename"], e["path"]) for e in result["errors"]] == [
+        (f"{doc}:2", "$.name"),
+        (f"{doc}:4", "$.name"),
+    ]
+    assert [e["filename"] for e in result["parse_errors"]] == [f"{doc}:3"]
+
+
+def test_jsonl_text_output(run_line, schemafile, tmp_path):
+    doc = _write_records(tmp_path / "events.jsonl", '{"name": "a"}', '{"name": 1}')
+    res = run_line(["check-jsonschema", "--schemafile", schemafile, doc])
+    assert res.exit_code == 1
+    assert f"{doc}:2::$.name: 1 is not of type 'string'" in res.stdout
+
+
+@pytest.mark.parametrize("jobs", ("1", "2"))
+def test_jsonl_fail_fast(run_line, schemafile, tmp_path, jobs):
+    doc = _write_records(tmp_path / "events.jsonl", '{"name": 1}', '{"name": 2}')
+    other = _write_records(tmp_path / "other.json", '{"name": 3}')
+    res = run_line(
+        ["check-jsonschema", "-o", "json", "-j", jobs, "--fail-fast"]
+        + ["--schemafile", schemafile, doc, other]
+    )
+    assert res.exit_code == 1
+    result = json.loads(res.stdout)
+    assert [e["filename"] for e in result["errors"]] == [f"{doc}:1"]
+    assert result["truncated"] == ["stopped after the first failing file (--fail-fast)"]
+
+
+def test_jsonl_fail_fast_on_the_last_line_is_not_truncated(
+    run_line, schemafile, tmp_path
+):
+    doc = _write_records(tmp_path / "events.jsonl", '{"name": "a"}', '{"name": 1}')
+    res = run_line(
+        ["check-jsonschema", "-o", "json", "--fail-fast"]
+        + ["--schemafile", schemafile, doc]
+    )
+    assert res.exit_code == 1
+    assert "truncated" not in json.loads(res.stdout)
+
+
+def test_jsonl_ndjson_output(run_line, schemafile, tmp_path):
+    doc = _write_records(tmp_path / "events.jsonl", '{"name": 1}', '{"name": "a"}')
+    res = run_line(
+        ["check-jsonschema", "-o", "ndjson", "-vv", "--schemafile", schemafile, doc]
+    )
+    assert res.exit_code == 1
+    events = [json.loads(line) for line in res.stdout.splitlines()]
+    assert [(e["type"], e.get("filename")) for e in events] == [
+        ("validation_error", f"{doc}:1"),
+        ("summary", None),
+    ]
@@ -0,0 +1,68 @@
+import json
+
+import pytest
+
+
+@pytest.fixture
+def schema():
+    return {
+        "$schema": "http://json-schema.org/draft-07/schema",
+        "type": "object",
+        "required": ["kind"],
+        "properties": {"kind": {"type": "string"}},
+    }
+
+
+@pytest.fixture
+def manifests(tmp_path):
+    path = tmp_path / "manifests.yaml"
+    path.write_text("kind: Service\n---\nkind: 1\n---\nkind: Deployment\n---\n")
+    return str(path)
+
+
+def test_multi_document_yaml_is_rejected_by_default(run_line, schemafile, manifests):
+    res = run_line(["check-jsonschema", "--schemafile", schemafile, manifests])
+    assert res.exit_code == 1
+    assert "Failed to parse" in res.stdout
+
+
+def test_multi_document_yaml_errors_have_document_indexes(
+    run_line, schemafile, manifests
+):
+    res = run_line(
+        ["check-jsonschema", "--multi-document-yaml", "-o", "json"]
+        + ["--schemafile", schemafile, manifests]
+    )
+    assert res.exit_code == 1
+    result = json.loads(res.stdout)
+    assert [(e["filename"], e["path"]) for e in result["errors"]] == [
+        (f"{manifests}[1]", "$.kind")
+    ]
+
+
+@pytest.mark.parametrize("jobs", ("1", "2"))
+def test_multi_document_yaml_passing(run_line, schemafile, tmp_path, jobs):
+    files = []
+    for name in ("a.yaml", "b.yml"):
+        path = tmp_path / name
+        path.write_text("kind: Service\n---\nkind: Deployment\n")
+        files.append(str(path))
+    res = run_line(
+        ["check-jsonschema", "--multi-document-yaml", "-j", jobs, "-vvv"]
+        + ["--schemafile", schemafile, *files]
+    )
+    assert res.exit_code == 0, res.stdout
+    # each file is reported as passing once
+    for path in files:
+        assert res.stdout.count(path) == 1
+
+
+def test_multi_document_yaml_does_not_affect_json(run_line, schemafile, tmp_path):
+    doc = tmp_path / "doc.json"
+    doc.write_text(json.dumps({"kind": 1}))
+    res = run_line(
+        ["check-jsonschema", "--multi-document-yaml", "--schemafile", schemafile]
+        + [str(doc)]
+    )
+    assert res.exit_code == 1
+    assert f"{doc}::$.kind" in res.stdout
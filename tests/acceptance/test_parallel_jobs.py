@@ -0,0 +1,134 @@
+import json
+
+import pytest
+
+SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema",
+    "properties": {
+        "title": {"type": "string"},
+        "value": {"oneOf": [{"type": "string"}, {"type": "integer"}]},
+    },
+    "required": ["title"],
+}
+
+
+@pytest.fixture
+def instance_files(tmp_path):
+    paths = []
+    for i in range(10):
+        path = tmp_path / f"instance{i}.json"
+        path.write_text(json.dumps({"title": f"doc {i}"}))
+        paths.append(str(path))
+    (tmp_path / "instance3.json").write_text('{"title": 1, "value": [1]}')
+    (tmp_path / "instance6.json").write_text("{")
+    (tmp_path / "instance8.yaml").write_text("value: 2\n")
+    paths.append(str(tmp_path / "instance8.yaml"))
+    return paths
+
+
+# tracebacks of parse errors cannot be sent back from worker processes, so only
+# compare output modes which do not show them
+@pytest.mark.parametrize(
+    "outformat, verbosity", [("TEXT", []), ("JSON", []), ("JSON", ["-vv"])]
+)
+def test_parallel_output_matches_serial_output(
+    run_line, tmp_path, instance_files, outformat, verbosity
+):
+    schema = tmp_path / "schema.json"
+    schema.write_text(json.dumps(SCHEMA))
+
+    base_args = ["check-jsonschema", "-o", outformat, "--schemafile", str(schema)]
+    serial_res = run_line(base_args + verbosity + instance_files)
+    parallel_res = run_line(base_args + verbosity + ["--jobs", "3"] + instance_files)
+
+    assert serial_res.exit_code == 1
+    assert parallel_res.exit_code == 1
+    assert parallel_res.stdout == serial_res.stdout
+
+
+def test_parallel_success(run_line, tmp_path, instance_files):
+    schema = tmp_path / "schema.json"
+    schema.write_text(json.dumps(SCHEMA))
+
+    good_files = [f for f in instance_files if f.endswith(("0.json", "1.json"))]
+    res = run_line(
+        ["check-jsonschema", "--schemafile", str(schema), "-j", "2"] + good_files
+    )
+    assert res.exit_code == 0
+    assert "ok -- validation done" in res.stdout
+
+
+def test_parallel_invalid_schema_is_reported(run_line, tmp_path, instance_files):
+    schema = tmp_path / "schema.json"
+    schema.write_text(json.dumps({"type": 5}))
+
+    res = run_line(
+        ["check-jsonschema", "--schemafile", str(schema), "-j", "2"] + instance_files
+    )
+    assert res.exit_code == 1
+    assert "Error: schemafile was not valid" in res.stderr
+    assert "5 is not valid under any of the given schemas" in res.stderr
+
+
+def test_parallel_submits_a_bounded_number_of_files_ahead(
+    run_line, tmp_path, monkeypatch
+):
+    import concurrent.futures
+
+    from check_jsonschema import checker
+    from check_jsonschema.reporter import NdjsonReporter
+
+    schema = tmp_path / "schema.json"
+    schema.write_text(json.dumps(SCHEMA))
+    paths = []
+    for i in range(20):
+        path = tmp_path / f"instance{i}.json"
+        path.write_text(json.dumps({"title": f"doc {i}"}))
+        paths.append(str(path))
+
+    submitted = 0
+    ahead = []
+    real_submit = concurrent.futures.ProcessPoolExecutor.submit
+    real_report = NdjsonReporter.report_file_success
+
+    def counting_submit(self, *args, **kwargs):
+        nonlocal submitted
+        submitted += 1
+        return real_submit(self, *args, **kwargs)
+
+    def recording_report(self, filename):
+        ahead.append(submitted - len(ahead))
+        real_report(self, filename)
+
+    monkeypatch.setattr(
+        concurrent.futures.ProcessPoolExecutor, "submit", counting_submit
+    )
+    monkeypatch.setattr(NdjsonReporter, "report_file_success", recording_report)
+
+    res = run_line(
+        ["check-jsonschema", "-o", "ndjson", "--schemafile", str(schema), "-j", "2"]
+        + paths
+    )
+    assert res.exit_code == 0
+    assert len(ahead) == 20
+    assert max(ahead) <= 2 * checker._FILES_IN_FLIGHT_PER_JOB + 1
+
+
+@pytest.mark.parametrize("limit_args", ([], ["--max-errors", "150"], ["--fail-fast"]))
+def test_parallel_record_files_match_serial_output(
+    run_line, tmp_path, instance_files, limit_args
+):
+    schema = tmp_path / "schema.json"
+    schema.write_text(json.dumps(SCHEMA))
+    # more failing records than are sent back from a worker in one chunk
+    records = tmp_path / "records.jsonl"
+    records.write_text('{"title": 1}\n' * 250)
+    files = [str(records), *instance_files, str(records)]
+
+    base_args = ["check-jsonschema", "-o", "json", "--schemafile", str(schema)]
+    serial_res = run_line(base_args + limit_args + files)
+    parallel_res = run_line(base_args + limit_args + ["--jobs", "2"] + files)
+
+    assert serial_res.exit_code == 1
+    assert parallel_res.exit_code == 1
+    assert parallel_res.stdout == serial_res.stdout
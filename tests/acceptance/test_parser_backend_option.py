@@ -0,0 +1,34 @@
+import json
+
+import pytest
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_check_with_selected_json_backend(run_line, schemafile, tmp_path, jobs):
+    good = tmp_path / "good.json"
+    good.write_text('{"title": "doc"}')
+    bad = tmp_path / "bad.json"
+    bad.write_text('{"title": 1}')
+    malformed = tmp_path / "malformed.json"
+    malformed.write_text('{"title": ')
+
+    res = run_line(
+        ["check-jsonschema", "-o", "json", "--parser-backend", "json=stdlib"]
+        + ["-j", jobs, "--schemafile", schemafile]
+        + [str(good), str(bad), str(malformed)]
+    )
+    assert res.exit_code == 1
+    result = json.loads(res.stdout)
+    assert [e["filename"] for e in result["errors"]] == [str(bad)]
+    assert [e["filename"] for e in result["parse_errors"]] == [str(malformed)]
+
+
+def test_unknown_backend_is_a_usage_error(run_line, schemafile, tmp_path):
+    doc = tmp_path / "doc.json"
+    doc.write_text("{}")
+    res = run_line(
+        ["check-jsonschema", "--parser-backend", "json=nosuchbackend"]
+        + ["--schemafile", schemafile, str(doc)]
+    )
+    assert res.exit_code == 2
+    assert "there is no parser backend 'nosuchbackend' for json" in res.stderr
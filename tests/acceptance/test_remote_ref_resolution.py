@@ -301,3 +301,50 @@ def test_remote_ref_resolution_callout_count_is_scale_free_in_instancefiles(
     assert len(responses.calls) == 2
     assert len([c for c in responses.calls if c.request.url == schema_uri]) == 1
     assert len([c for c in responses.calls if c.request.url == ref_uri]) == 1
+
+
+@pytest.mark.parametrize("check_passes", (True, False))
+def test_prefetch_refs_retrieves_nested_refs_once(run_line, tmp_path, check_passes):
+    schema_uri = "https://example.org/schemas/main.json"
+    main_schema = {
+        "$id": schema_uri,
+        "$schema": "http://json-schema.org/draft-07/schema",
+        "properties": {
+            "title": {"$ref": "./title_schema.json"},
+            "author": {"$ref": "./people/author.json"},
+        },
+    }
+    # refs which are only found by retrieving other refs, relative to their own URIs
+    other_schemas = {
+        "https://example.org/schemas/title_schema.json": {"type": "string"},
+        "https://example.org/schemas/people/author.json": {
+            "properties": {"name": {"$ref": "./name.json"}}
+        },
+        "https://example.org/schemas/people/name.json": {"type": "string"},
+    }
+    responses.add("GET", schema_uri, json=main_schema)
+    for uri, subschema in other_schemas.items():
+        responses.add("GET", uri, json=subschema)
+
+    instance_path = tmp_path / "instance.json"
+    instance_path.write_text(json.dumps({"title": "doc one" if check_passes else 2}))
+
+    result = run_line(
+        [
+            "check-jsonschema",
+            "--prefetch-refs",
+            "--schemafile",
+            schema_uri,
+            str(instance_path),
+        ]
+    )
+    output = f"\nstdout:\n{result.stdout}\n\nstderr:\n{result.stderr}"
+    if check_passes:
+        assert result.exit_code == 0, output
+    else:
+        assert result.exit_code == 1, output
+
+    # every ref was retrieved, including those which validation never reached,
+    # and none were retrieved a second time during validation
+    called_urls = [c.request.url for c in responses.calls]
+    assert sorted(called_urls) == sorted([schema_uri, *other_schemas])
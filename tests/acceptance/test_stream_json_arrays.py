@@ -0,0 +1,84 @@
+import json
+
+import pytest
+
+
+@pytest.fixture
+def schema():
+    return {
+        "$schema": "https://json-schema.org/draft/2020-12/schema",
+        "type": "array",
+        "minItems": 1,
+        "items": {"type": "object", "properties": {"name": {"type": "string"}}},
+    }
+
+
+def _run(run_line, schemafile, *args):
+    return run_line(
+        ["check-jsonschema", "--stream-json-arrays", "-o", "json"]
+        + ["--schemafile", schemafile, *args]
+    )
+
+
+def test_streamed_array_errors(run_line, schemafile, tmp_path):
+    doc = tmp_path / "data.json"
+    doc.write_text(json.dumps([{"name": "a"}, {"name": 1}, {"name": "b"}, {"name": 2}]))
+    res = _run(run_line, schemafile, str(doc))
+    assert res.exit_code == 1
+    result = json.loads(res.stdout)
+    assert [e["path"] for e in result["errors"]] == ["$[1].name", "$[3].name"]
+
+
+def test_streamed_array_root_errors(run_line, schemafile, tmp_path):
+    doc = tmp_path / "data.json"
+    doc.write_text("[]")
+    res = _run(run_line, schemafile, str(doc))
+    assert res.exit_code == 1
+    result = json.loads(res.stdout)
+    assert [(e["path"], e["message"]) for e in result["errors"]] == [
+        ("$", "array of 0 items is too short")
+    ]
+
+
+def test_streamed_array_parse_error(run_line, schemafile, tmp_path):
+    doc = tmp_path / "data.json"
+    doc.write_text('[{"name": 1}, {"name": ')
+    res = _run(run_line, schemafile, str(doc))
+    assert res.exit_code == 1
+    result = json.loads(res.stdout)
+    assert result["errors"] == []
+    assert [e["filename"] for e in result["parse_errors"]] == [str(doc)]
+
+
+def test_non_array_files_are_loaded_whole(run_line, schemafile, tmp_path):
+    doc = tmp_path / "data.json"
+    doc.write_text(json.dumps({"name": 1}))
+    res = _run(run_line, schemafile, str(doc))
+    assert res.exit_code == 1
+    result = json.loads(res.stdout)
+    assert [e["message"] for e in result["errors"]] == [
+        "{'name': 1} is not of type 'array'"
+    ]
+
+
+def test_schemas_which_cannot_be_streamed_validate_whole_files(run_line, tmp_path):
+    schema = tmp_path / "schema.json"
+    schema.write_text(json.dumps({"contains": {"const": 1}}))
+    doc = tmp_path / "data.json"
+    doc.write_text("[2, 3]")
+    res = _run(run_line, str(schema), str(doc))
+    assert res.exit_code == 1
+    result = json.loads(res.stdout)
+    assert [e["message"] for e in result["errors"]] == [
+        "[2, 3] does not contain items matching the given schema"
+    ]
+
+
+def test_stream_json_arrays_with_check_metaschema(run_line, tmp_path):
+    doc = tmp_path / "schema.json"
+    doc.write_text("{}")
+    res = run_line(
+        ["check-jsonschema", "--stream-json-arrays", "--check-metaschema", str(doc)]
+    )
+    assert res.exit_code == 2
+    assert "--stream-json-arrays cannot be used with --check-metaschema" in res.stderr
@@ -0,0 +1,86 @@
+import json
+
+import pytest
+
+
+@pytest.fixture
+def schema():
+    return {
+        "$schema": "http://json-schema.org/draft-07/schema",
+        "properties": {"a": {"type": "string"}, "b": {"type": "string"}},
+    }
+
+
+@pytest.fixture
+def instance_files(tmp_path):
+    paths = []
+    for name, content in (
+        ("good.json", json.dumps({"a": "x"})),
+        ("bad.json", json.dumps({"a": 1, "b": 2})),
+        ("broken.json", "{"),
+    ):
+        path = tmp_path / name
+        path.write_text(content)
+        paths.append(str(path))
+    return paths
+
+
+def _ndjson(run_line, schemafile, instance_files, *args):
+    res = run_line(
+        ["check-jsonschema", "-o", "ndjson", "--schemafile", schemafile, *args]
+        + instance_files
+    )
+    return res.exit_code, [json.loads(line) for line in res.stdout.splitlines()]
+
+
+def test_ndjson_output(run_line, schemafile, instance_files):
+    exit_code, events = _ndjson(run_line, schemafile, instance_files, "-vv")
+    assert exit_code == 1
+    assert [(e["type"], e.get("filename", "").rsplit("/", 1)[-1]) for e in events] == [
+        ("success", "good.json"),
+        ("validation_error", "bad.json"),
+        ("validation_error", "bad.json"),
+        ("parse_error", "broken.json"),
+        ("summary", ""),
+    ]
+    assert events[-1]["num_validation_errors"] == 2
+    assert events[-1]["num_parse_errors"] == 1
+
+
+def test_ndjson_output_on_success(run_line, schemafile, instance_files):
+    exit_code, events = _ndjson(run_line, schemafile, instance_files[:1])
+    assert exit_code == 0
+    assert events == [
+        {
+            "type": "summary",
+            "status": "ok",
+            "num_successes": 1,
+            "num_validation_errors": 0,
+            "num_parse_errors": 0,
+        }
+    ]
+
+
+def test_ndjson_output_with_jobs_and_limits(run_line, schemafile, instance_files):
+    serial = _ndjson(run_line, schemafile, instance_files, "--max-errors", "1")
+    parallel = _ndjson(
+        run_line, schemafile, instance_files, "-j", "2", "--max-errors", "1"
+    )
+    assert serial == parallel
+    exit_code, events = serial
+    assert exit_code == 1
+    assert [e["type"] for e in events] == ["validation_error", "summary"]
+    assert events[-1]["truncated"] == ["stopped after 1 error (--max-errors)"]
+
+
+def test_text_stream_output(run_line, schemafile, instance_files):
+    res = run_line(
+        ["check-jsonschema", "-o", "text-stream", "--schemafile", schemafile]
+        + instance_files
+    )
+    assert res.exit_code == 1
+    assert "bad.json::$.a: 1 is not of type 'string'" in res.stdout
+    assert "broken.json" in res.stdout
+    assert res.stdout.rstrip().endswith(
+        "fail -- validation errors: 2, files which failed to parse: 1"
+    )
@@ -355,3 +355,128 @@ other_thing = 100
         assert "is not a class" in result.stderr
     else:
         raise NotImplementedError
+
+
+@pytest.mark.parametrize(
+    "jobs_arg, expect_jobs",
+    [(None, 1), ("1", 1), ("4", 4), ("auto", None)],
+)
+def test_jobs_option(
+    cli_runner, mock_parse_result, in_tmp_dir, tmp_path, jobs_arg, expect_jobs
+):
+    touch_files(tmp_path, "foo.json")
+    cmd = ["--schemafile", "schema.json", "foo.json"]
+    if jobs_arg is not None:
+        cmd.extend(["--jobs", jobs_arg])
+    result = cli_runner.invoke(cli_main, cmd)
+    assert result.exit_code == 0
+    if expect_jobs is None:
+        assert mock_parse_result.jobs >= 1
+    else:
+        assert mock_parse_result.jobs == expect_jobs
+
+
+@pytest.mark.parametrize("jobs_arg", ["0", "-2", "many"])
+def test_jobs_option_rejects_bad_values(cli_runner, in_tmp_dir, tmp_path, jobs_arg):
+    touch_files(tmp_path, "foo.json")
+    result = cli_runner.invoke(
+        cli_main, ["--schemafile", "schema.json", "foo.json", "--jobs", jobs_arg]
+    )
+    assert result.exit_code == 2
+
+
+def test_jobs_option_rejects_stdin_schema(cli_runner, in_tmp_dir, tmp_path):
+    touch_files(tmp_path, "foo.json")
+    result = cli_runner.invoke(
+        cli_main, ["--schemafile", "-", "foo.json", "--jobs", "2"]
+    )
+    assert result.exit_code == 2
+    assert "--jobs cannot be used" in result.stderr
+
+
+@pytest.mark.parametrize(
+    "ttl_arg, expect_ttl",
+    [
+        (None, None),
+        ("0", 0.0),
+        ("90", 90.0),
+        ("90s", 90.0),
+        ("15m", 900.0),
+        ("1h", 3600.0),
+        ("2d", 172800.0),
+    ],
+)
+def test_cache_ttl_option(
+    cli_runner, mock_parse_result, in_tmp_dir, tmp_path, ttl_arg, expect_ttl
+):
+    touch_files(tmp_path, "foo.json")
+    cmd = ["--schemafile", "schema.json", "foo.json"]
+    if ttl_arg is not None:
+        cmd.extend(["--cache-ttl", ttl_arg])
+    result = cli_runner.invoke(cli_main, cmd)
+    assert result.exit_code == 0
+    assert mock_parse_result.cache_ttl == expect_ttl
+
+
+@pytest.mark.parametrize("ttl_arg", ["-1", "1w", "h", "soon"])
+def test_cache_ttl_option_rejects_bad_values(cli_runner, in_tmp_dir, tmp_path, ttl_arg):
+    touch_files(tmp_path, "foo.json")
+    result = cli_runner.invoke(
+        cli_main, ["--schemafile", "schema.json", "foo.json", "--cache-ttl", ttl_arg]
+    )
+    assert result.exit_code == 2
+
+
+def test_offline_option_rejects_no_cache(cli_runner, in_tmp_dir, tmp_path):
+    touch_files(tmp_path, "foo.json")
+    result = cli_runner.invoke(
+        cli_main,
+        ["--schemafile", "schema.json", "foo.json", "--offline", "--no-cache"],
+    )
+    assert result.exit_code == 2
+    assert "--offline cannot be used with --no-cache" in result.stderr
+
+
+@pytest.mark.parametrize(
+    "backend_args, expect_backends",
+    [
+        ([], {}),
+        (["--parser-backend", "json=stdlib"], {"json": "stdlib"}),
+        (
+            ["--parser-backend", "json=stdlib", "--parser-backend", "toml=default"],
+            {"json": "stdlib", "toml": "default"},
+        ),
+    ],
+)
+def test_parser_backend_option(
+    cli_runner, mock_parse_result, in_tmp_dir, tmp_path, backend_args, expect_backends
+):
+    touch_files(tmp_path, "foo.json")
+    result = cli_runner.invoke(
+        cli_main, ["--schemafile", "schema.json", "foo.json", *backend_args]
+    )
+    assert result.exit_code == 0
+    assert mock_parse_result.parser_backends == expect_backends
+
+
+@pytest.mark.parametrize(
+    "backend_args, expect_message",
+    [
+        (["--parser-backend", "stdlib"], "use 'FILETYPE=NAME'"),
+        (["--parser-backend", "json=nosuchbackend"], "no parser backend"),
+        (["--parser-backend", "yaml=default"], "cannot be selected for 'yaml'"),
+        (
+            ["--parser-backend", "json=stdlib", "--parser-backend", "json=default"],
+            "more than one backend for json",
+        ),
+    ],
+)
+def test_parser_backend_option_rejects_bad_values(
+    cli_runner, in_tmp_dir, tmp_path, backend_args, expect_message
+):
+    touch_files(tmp_path, "foo.json")
+    result = cli_runner.invoke(
+        cli_main, ["--schemafile", "schema.json", "foo.json", *backend_args]
+    )
+    assert result.exit_code == 2
+    assert expect_message in result.stderr
@@ -0,0 +1,73 @@
+import jsonschema
+import pytest
+
+from check_jsonschema.formats import (
+    FormatOptions,
+    format_checker_for_regex_impl,
+    make_format_checker,
+)
+from check_jsonschema.regex_variants import RegexImplementation, RegexVariantName
+
+DEFAULT_REGEX = RegexImplementation(RegexVariantName.default)
+PYTHON_REGEX = RegexImplementation(RegexVariantName.python)
+
+
+def test_format_checkers_are_shared_for_equal_options():
+    checker = make_format_checker(FormatOptions(regex_impl=DEFAULT_REGEX))
+    assert checker is make_format_checker(
+        FormatOptions(regex_impl=RegexImplementation(RegexVariantName.default))
+    )
+    assert checker is not make_format_checker(FormatOptions(regex_impl=PYTHON_REGEX))
+    assert checker is not make_format_checker(
+        FormatOptions(regex_impl=DEFAULT_REGEX, disabled_formats=("uuid",))
+    )
+
+    metaschema_checker = format_checker_for_regex_impl(
+        DEFAULT_REGEX, "http://json-schema.org/draft-07/schema#"
+    )
+    assert metaschema_checker is format_checker_for_regex_impl(
+        DEFAULT_REGEX, "http://json-schema.org/draft-07/schema#"
+    )
+    assert metaschema_checker is not checker
+
+
+def test_disabled_format_checker_is_none():
+    assert (
+        make_format_checker(FormatOptions(regex_impl=DEFAULT_REGEX, enabled=False))
+        is None
+    )
+
+
+def test_disabled_formats_are_not_checked():
+    checker = make_format_checker(
+        FormatOptions(regex_impl=DEFAULT_REGEX, disabled_formats=("regex", "uuid"))
+    )
+    assert checker is not None
+    assert "regex" not in checker.checkers
+    assert "uuid" not in checker.checkers
+    assert checker.conforms("[", "regex")
+    assert not checker.conforms("1-2-3", "date")
+
+
+def test_regex_variant_is_used():
+    # '\Z' is only valid in python regexes
+    python_checker = make_format_checker(FormatOptions(regex_impl=PYTHON_REGEX))
+    default_checker = make_format_checker(FormatOptions(regex_impl=DEFAULT_REGEX))
+    assert python_checker is not None and default_checker is not None
+    assert python_checker.conforms(r"a\Z", "regex")
+    assert not default_checker.conforms(r"a\Z", "regex")
+
+
+def test_shared_format_checkers_cannot_be_modified():
+    checker = make_format_checker(FormatOptions(regex_impl=DEFAULT_REGEX))
+    assert checker is not None
+    with pytest.raises(TypeError):
+        checker.checks("foo")
+    with pytest.raises(TypeError):
+        del checker.checkers["uuid"]
+
+    # the checkers of 'jsonschema' are left as they were
+    assert (
+        jsonschema.Draft202012Validator.FORMAT_CHECKER.checkers["regex"][0]
+        is not DEFAULT_REGEX.check_format
+    )
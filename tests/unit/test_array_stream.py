@@ -0,0 +1,128 @@
+import io
+import json
+
+import jsonschema
+import pytest
+
+from check_jsonschema.array_stream import is_streamable, iter_array_errors
+from check_jsonschema.parsers.json_stream import (
+    StreamDecodeError,
+    iter_array_elements,
+    read_array_start,
+)
+
+ELEMENTS = [
+    1,
+    -2.5e10,
+    12345678901234567890,
+    'a "quoted" string with \u00e9scapes\n' * 5,
+    "☃ snowman",
+    True,
+    None,
+    [],
+    {},
+    {"nested": [{"a": [1, 2, {"b": None}]}, "x" * 100]},
+]
+
+
+@pytest.mark.parametrize("chunk_size", (1, 2, 7, 64, 1 << 16))
+@pytest.mark.parametrize("indent", (None, 2))
+def test_iter_array_elements_across_chunks(chunk_size, indent):
+    data = json.dumps(ELEMENTS, indent=indent, ensure_ascii=False).encode()
+    stream = io.BytesIO(b"\n " + data + b"\n")
+    is_array, prefix = read_array_start(stream)
+    assert is_array
+    elements = iter_array_elements(stream, prefix, chunk_size=chunk_size)
+    assert list(elements) == ELEMENTS
+
+
+@pytest.mark.parametrize("chunk_size", (1, 2, 3))
+def test_iter_array_elements_numbers_cut_at_any_point(chunk_size):
+    numbers = [0.5, 10.25, 1e5, 1.5e-3, -2e10, 3e-7, 100]
+    data = b"[0.5, 10.25, 1e5, 1.5e-3, -2E+10, 3e-07, 100]"
+    # start the buffer with each prefix of the data, so that the first chunk
+    # boundary falls at every position
+    for split in range(len(data) + 1):
+        stream = io.BytesIO(data[split:])
+        elements = iter_array_elements(stream, data[:split], chunk_size=chunk_size)
+        assert list(elements) == numbers
+
+
+@pytest.mark.parametrize("data", (b"", b"  ", b'{"a": 1}', b"1"))
+def test_read_array_start_on_other_documents(data):
+    stream = io.BytesIO(data)
+    assert read_array_start(stream) == (False, data)
+
+
+@pytest.mark.parametrize(
+    "data, message",
+    (
+        (b"[1,]", "Expecting value: char 3"),
+        (b"[1 2]", "Expecting ',' delimiter: char 3"),
+        (b"[1", "Expecting ',' delimiter: char 2"),
+        (b'["abc', "Unterminated string starting at: char 1"),
+        (b"[1] x", "Extra data: char 4"),
+    ),
+)
+def test_iter_array_elements_errors(data, message):
+    with pytest.raises(StreamDecodeError, match=message):
+        list(iter_array_elements(io.BytesIO(data), chunk_size=2))
+
+
+def test_iter_array_elements_does_not_read_past_invalid_data():
+    stream = io.BytesIO(b"[1, nope, " + b"2, " * 100_000 + b"3]")
+    with pytest.raises(StreamDecodeError):
+        list(iter_array_elements(stream, chunk_size=64))
+    assert stream.tell() < 1024
+
+
+@pytest.mark.parametrize(
+    "schema, expect",
+    (
+        (True, True),
+        (False, False),
+        ({"items": {"type": "string"}}, True),
+        ({"type": ["array", "null"], "minItems": 1, "$defs": {}}, True),
+        ({"type": "object"}, False),
+        ({"items": [{"type": "string"}]}, False),
+        ({"items": {}, "contains": {"type": "string"}}, False),
+        ({"$ref": "#/$defs/x", "$defs": {"x": {}}}, False),
+    ),
+)
+def test_is_streamable(schema, expect):
+    assert is_streamable(schema) is expect
+
+
+def _errors(schema, instance):
+    validator = jsonschema.Draft202012Validator(schema)
+    return [
+        (e.json_path, e.validator, e.message)
+        for e in iter_array_errors(validator, iter(instance))
+    ]
+
+
+def test_element_errors_match_whole_validation():
+    schema = {
+        "items": {
+            "type": "object",
+            "properties": {"a": {"type": "string"}},
+            "required": ["a"],
+        }
+    }
+    instance = [{"a": "x"}, {"a": 1}, {}, {"a": "y"}]
+    validator = jsonschema.Draft202012Validator(schema)
+    assert _errors(schema, instance) == [
+        (e.json_path, e.validator, e.message) for e in validator.iter_errors(instance)
+    ]
+
+
+def test_root_keywords():
+    schema = {"minItems": 3, "maxItems": 1, "uniqueItems": True}
+    assert _errors(schema, [1, True, 1.0, {"a": 1.0}, {"a": 1}, 2]) == [
+        ("$", "uniqueItems", "array has non-unique elements, at indexes 0 and 2"),
+        ("$", "maxItems", "array of 6 items is too long"),
+    ]
+    assert _errors(schema, [[1], [True]]) == [
+        ("$", "minItems", "array of 2 items is too short"),
+        ("$", "maxItems", "array of 2 items is too long"),
+    ]
@@ -0,0 +1,9 @@
+import pytest
+
+from check_jsonschema import builtin_schemas
+from check_jsonschema.builtin_schemas import get_builtin_schema
+
+
+def test_no_such_builtin_schema():
+    with pytest.raises(builtin_schemas.NoSuchSchemaError):
+        get_builtin_schema("vendor.no-such-schema")
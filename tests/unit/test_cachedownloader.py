@@ -1,6 +1,8 @@
+import concurrent.futures
 import json
 import os
 import platform
+import threading
 import time
 
 import pytest
@@ -12,6 +14,8 @@ from check_jsonschema.cachedownloader import (
     FailedDownloadError,
     _cache_hit,
     _lastmod_from_response,
+    get_http_session,
+    prune_cache_dir,
     url_to_cache_filename,
 )
 
@@ -381,3 +385,261 @@ def test_lastmod_from_header_uses_gmtime(request, monkeypatch, default_response)
     # assert that they all match
     assert gmt_parsed_time == utc_parsed_time
     assert gmt_parsed_time == est_parsed_time
+
+
+def test_downloads_on_one_thread_share_one_session(default_response, monkeypatch):
+    sessions = []
+    real_get = requests.Session.get
+
+    def spy_get(self, *args, **kwargs):
+        sessions.append(self)
+        return real_get(self, *args, **kwargs)
+
+    monkeypatch.setattr(requests.Session, "get", spy_get)
+
+    for cache_dir in ("schemas", "refs"):
+        cd = CacheDownloader(cache_dir, disable_cache=True).bind(DEFAULT_RESPONSE_URL)
+        with cd.open() as fp:
+            assert fp.read() == b"{}"
+
+    assert len(sessions) == 2
+    assert sessions[0] is sessions[1] is get_http_session()
+
+
+def test_each_thread_has_its_own_session():
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+        barrier = threading.Barrier(2)
+
+        def get_session():
+            # hold both threads open, so that they are distinct
+            barrier.wait()
+            return get_http_session()
+
+        thread_sessions = list(pool.map(lambda _: get_session(), range(2)))
+    assert thread_sessions[0] is not thread_sessions[1]
+    assert get_http_session() not in thread_sessions
+
+
+@pytest.mark.parametrize("disable_cache", (True, False))
+def test_responses_are_closed(
+    default_response, get_download_cache_loc, monkeypatch, disable_cache
+):
+    closed = []
+    real_close = requests.Response.close
+
+    def spy_close(self):
+        closed.append(self)
+        return real_close(self)
+
+    monkeypatch.setattr(requests.Response, "close", spy_close)
+    cd = CacheDownloader("downloads", disable_cache=disable_cache).bind(
+        DEFAULT_RESPONSE_URL
+    )
+    with cd.open() as fp:
+        assert fp.read() == b"{}"
+    assert len(closed) == 1
+
+
+def test_cachedownloader_stores_validators_next_to_cached_file(
+    get_download_cache_loc,
+):
+    responses.add(
+        "GET",
+        DEFAULT_RESPONSE_URL,
+        headers={"Last-Modified": DEFAULT_LASTMOD, "ETag": '"abc"'},
+        json={},
+    )
+    cd = CacheDownloader("downloads").bind(DEFAULT_RESPONSE_URL)
+    with cd.open() as fp:
+        assert fp.read() == b"{}"
+
+    f = get_download_cache_loc(DEFAULT_RESPONSE_URL)
+    metadata = json.loads((f.parent / (f.name + ".meta.json")).read_text())
+    assert metadata["url"] == DEFAULT_RESPONSE_URL
+    assert metadata["etag"] == '"abc"'
+    assert metadata["last_modified"] == DEFAULT_LASTMOD
+    assert isinstance(metadata["fetched_at"], float)
+
+
+def test_cachedownloader_revalidates_with_conditional_request(
+    get_download_cache_loc,
+):
+    responses.add(
+        "GET",
+        DEFAULT_RESPONSE_URL,
+        headers={"Last-Modified": DEFAULT_LASTMOD, "ETag": '"abc"'},
+        json={"version": 1},
+    )
+    # the second response has no body, so a cache hit must not read one
+    responses.add("GET", DEFAULT_RESPONSE_URL, status=304)
+
+    validator_ran = False
+
+    def validate(data):
+        nonlocal validator_ran
+        validator_ran = True
+        json.loads(data)
+
+    for _ in range(2):
+        validator_ran = False
+        cd = CacheDownloader("downloads").bind(
+            DEFAULT_RESPONSE_URL, validation_callback=validate
+        )
+        with cd.open() as fp:
+            assert json.load(fp) == {"version": 1}
+
+    assert validator_ran is False
+    assert "If-None-Match" not in responses.calls[0].request.headers
+    revalidation_headers = responses.calls[1].request.headers
+    assert revalidation_headers["If-None-Match"] == '"abc"'
+    assert revalidation_headers["If-Modified-Since"] == DEFAULT_LASTMOD
+
+
+def test_cachedownloader_revalidates_files_without_metadata_by_mtime(
+    inject_cached_download,
+):
+    inject_cached_download(DEFAULT_RESPONSE_URL, b'{"cached": true}')
+    responses.add("GET", DEFAULT_RESPONSE_URL, status=304)
+
+    cd = CacheDownloader("downloads").bind(DEFAULT_RESPONSE_URL)
+    with cd.open() as fp:
+        assert json.load(fp) == {"cached": True}
+
+    assert "If-Modified-Since" in responses.calls[0].request.headers
+    assert "If-None-Match" not in responses.calls[0].request.headers
+
+
+def test_cachedownloader_hit_on_matching_etag(get_download_cache_loc):
+    # the server ignores conditional requests and sends the body with the same ETag
+    # and a Last-Modified time which is newer than the cached file
+    for _ in range(2):
+        responses.add(
+            "GET",
+            DEFAULT_RESPONSE_URL,
+            headers={"Last-Modified": "Sun, 01 Jan 2090 00:00:01 GMT", "ETag": '"a"'},
+            json={"version": 1},
+        )
+
+    cd = CacheDownloader("downloads").bind(DEFAULT_RESPONSE_URL)
+    with cd.open() as fp:
+        assert json.load(fp) == {"version": 1}
+
+    f = get_download_cache_loc(DEFAULT_RESPONSE_URL)
+    mtime = f.stat().st_mtime_ns
+    with cd.open() as fp:
+        assert json.load(fp) == {"version": 1}
+    assert f.stat().st_mtime_ns == mtime
+
+
+def test_cachedownloader_miss_on_changed_etag(get_download_cache_loc):
+    # like raw.githubusercontent.com, the server sends no Last-Modified header
+    responses.add("GET", DEFAULT_RESPONSE_URL, headers={"ETag": '"a"'}, json={"v": 1})
+    responses.add("GET", DEFAULT_RESPONSE_URL, headers={"ETag": '"b"'}, json={"v": 2})
+    responses.add("GET", DEFAULT_RESPONSE_URL, status=304)
+
+    cd = CacheDownloader("downloads").bind(DEFAULT_RESPONSE_URL)
+    for expect in (1, 2, 2):
+        with cd.open() as fp:
+            assert json.load(fp) == {"v": expect}
+
+    assert responses.calls[1].request.headers["If-None-Match"] == '"a"'
+    assert responses.calls[2].request.headers["If-None-Match"] == '"b"'
+
+
+def test_cachedownloader_keeps_validators_on_hit_by_mtime(get_download_cache_loc):
+    responses.add(
+        "GET",
+        DEFAULT_RESPONSE_URL,
+        headers={"Last-Modified": DEFAULT_LASTMOD},
+        json={"v": 1},
+    )
+    # the server ignores the conditional request, and the body is not read on a
+    # hit, so its new ETag must not be recorded for the cached file
+    responses.add(
+        "GET",
+        DEFAULT_RESPONSE_URL,
+        headers={"Last-Modified": DEFAULT_LASTMOD, "ETag": '"b"'},
+        json={"v": 2},
+    )
+
+    cd = CacheDownloader("downloads").bind(DEFAULT_RESPONSE_URL)
+    for _ in range(2):
+        with cd.open() as fp:
+            assert json.load(fp) == {"v": 1}
+
+    f = get_download_cache_loc(DEFAULT_RESPONSE_URL)
+    metadata = json.loads((f.parent / (f.name + ".meta.json")).read_text())
+    assert "etag" not in metadata
+
+
+@pytest.mark.parametrize("fetched_ago, expect_request", ((10, False), (7200, True)))
+def test_cachedownloader_skips_request_within_ttl(
+    get_download_cache_loc, fetched_ago, expect_request
+):
+    add_default_response()
+    add_default_response()
+    cd = CacheDownloader("downloads", cache_ttl=3600).bind(DEFAULT_RESPONSE_URL)
+    with cd.open() as fp:
+        assert fp.read() == b"{}"
+    assert len(responses.calls) == 1
+
+    # pretend that the file was fetched some time ago
+    f = get_download_cache_loc(DEFAULT_RESPONSE_URL)
+    metadata_file = f.parent / (f.name + ".meta.json")
+    metadata = json.loads(metadata_file.read_text())
+    metadata["fetched_at"] = time.time() - fetched_ago
+    metadata_file.write_text(json.dumps(metadata))
+
+    with cd.open() as fp:
+        assert fp.read() == b"{}"
+    assert len(responses.calls) == (2 if expect_request else 1)
+
+
+def test_cachedownloader_ttl_uses_mtime_without_metadata(inject_cached_download):
+    inject_cached_download(DEFAULT_RESPONSE_URL, b'{"cached": true}')
+    cd = CacheDownloader("downloads", cache_ttl=3600).bind(DEFAULT_RESPONSE_URL)
+    with cd.open() as fp:
+        assert json.load(fp) == {"cached": True}
+    assert len(responses.calls) == 0
+
+
+def test_cachedownloader_offline_uses_cache(inject_cached_download):
+    inject_cached_download(DEFAULT_RESPONSE_URL, b'{"cached": true}')
+    cd = CacheDownloader("downloads", offline=True).bind(DEFAULT_RESPONSE_URL)
+    with cd.open() as fp:
+        assert json.load(fp) == {"cached": True}
+    assert len(responses.calls) == 0
+
+
+def test_cachedownloader_offline_fails_on_miss(default_response):
+    cd = CacheDownloader("downloads", offline=True).bind(DEFAULT_RESPONSE_URL)
+    with pytest.raises(FailedDownloadError, match="offline"):
+        with cd.open():
+            pass
+    assert len(responses.calls) == 0
+
+
+def test_cachedownloader_evicts_least_recently_used_files(get_download_cache_loc):
+    other_url = "https://example.com/schema2.json"
+    add_default_response()
+    responses.add("GET", other_url, json={"other": True})
+
+    # allow only one file (and its metadata) in the cache
+    cd = CacheDownloader("downloads", max_size=150)
+    with cd.bind(DEFAULT_RESPONSE_URL).open() as fp:
+        assert fp.read() == b"{}"
+    with cd.bind(other_url).open() as fp:
+        assert json.load(fp) == {"other": True}
+
+    # the newly downloaded file is kept, and the older one is evicted
+    assert get_download_cache_loc(other_url).exists()
+    assert not get_download_cache_loc(DEFAULT_RESPONSE_URL).exists()
+
+
+def test_prune_cache_dir_removes_orphaned_metadata(tmp_path):
+    (tmp_path / "abc.json").write_text("{}")
+    (tmp_path / "abc.json.meta.json").write_text("{}")
+    (tmp_path / "gone.json.meta.json").write_text("{}")
+
+    assert prune_cache_dir(str(tmp_path), 1024) == []
+    assert sorted(os.listdir(tmp_path)) == ["abc.json", "abc.json.meta.json"]
@@ -0,0 +1,164 @@
+import json
+import os
+import socket
+import tempfile
+import threading
+
+import pytest
+import responses
+
+from check_jsonschema.cli.loader_cache import SchemaLoaderCache
+from check_jsonschema.daemon import client
+from check_jsonschema.daemon.server import run_check
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="requires Unix socket support"
+)
+
+SCHEMA = {"properties": {"title": {"type": "string"}}}
+
+
+@pytest.fixture
+def schema_and_instances(tmp_path):
+    (tmp_path / "schema.json").write_text(json.dumps(SCHEMA))
+    (tmp_path / "good.json").write_text('{"title": "ok"}')
+    (tmp_path / "bad.json").write_text('{"title": 1}')
+    return tmp_path
+
+
+@pytest.fixture
+def socket_path():
+    # socket paths are limited in length, so avoid long pytest tmp paths
+    with tempfile.TemporaryDirectory() as d:
+        yield os.path.join(d, "cj.sock")
+
+
+def test_run_check_reuses_schema_loaders(schema_and_instances):
+    loader_cache = SchemaLoaderCache()
+    argv = ["--schemafile", "schema.json", "good.json"]
+    cwd = str(schema_and_instances)
+
+    response = run_check(argv, cwd, loader_cache)
+    assert response["exit_code"] == 0
+    assert "ok -- validation done" in response["stdout"]
+
+    response = run_check(["--schemafile", "schema.json", "bad.json"], cwd, loader_cache)
+    assert response["exit_code"] == 1
+    assert "bad.json::$.title: 1 is not of type 'string'" in response["stdout"]
+    assert len(loader_cache) == 1
+
+
+def test_run_check_reloads_changed_schema(schema_and_instances):
+    loader_cache = SchemaLoaderCache()
+    argv = ["--schemafile", "schema.json", "bad.json"]
+    cwd = str(schema_and_instances)
+    assert run_check(argv, cwd, loader_cache)["exit_code"] == 1
+
+    schema_file = schema_and_instances / "schema.json"
+    schema_file.write_text(json.dumps({"properties": {"title": {"type": "integer"}}}))
+    stat = schema_file.stat()
+    os.utime(schema_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert run_check(argv, cwd, loader_cache)["exit_code"] == 0
+    # the loader for the old schema is replaced, rather than kept alongside
+    assert len(loader_cache) == 1
+
+
+def _touch_later(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_run_check_reloads_changed_local_ref(tmp_path):
+    (tmp_path / "schema.json").write_text(
+        json.dumps({"properties": {"title": {"$ref": "./sub.json"}}})
+    )
+    sub_schema = tmp_path / "sub.json"
+    sub_schema.write_text(json.dumps({"type": "integer"}))
+    (tmp_path / "doc.json").write_text('{"title": "text"}')
+    loader_cache = SchemaLoaderCache()
+    argv = ["--schemafile", "schema.json", "doc.json"]
+
+    response = run_check(argv, str(tmp_path), loader_cache)
+    assert response["exit_code"] == 1
+    assert "is not of type 'integer'" in response["stdout"]
+
+    sub_schema.write_text(json.dumps({"type": "string"}))
+    _touch_later(sub_schema)
+    assert run_check(argv, str(tmp_path), loader_cache)["exit_code"] == 0
+    assert len(loader_cache) == 1
+
+
+@pytest.mark.parametrize(
+    "ttl_args, expect_reuse", (([], False), (["--cache-ttl", "1h"], True))
+)
+def test_run_check_reuses_remote_schemas_within_ttl(
+    schema_and_instances, ttl_args, expect_reuse
+):
+    schema_url = "https://example.org/schema.json"
+    responses.add("GET", schema_url, json=SCHEMA)
+    loader_cache = SchemaLoaderCache()
+    argv = ["--schemafile", schema_url, *ttl_args, "good.json"]
+
+    assert run_check(argv, str(schema_and_instances), loader_cache)["exit_code"] == 0
+    (first_loader,) = loader_cache._loaders.values()
+    assert run_check(argv, str(schema_and_instances), loader_cache)["exit_code"] == 0
+    (second_loader,) = loader_cache._loaders.values()
+    assert (first_loader is second_loader) == expect_reuse
+
+
+def test_loader_cache_drops_least_recently_used_loaders(schema_and_instances):
+    loader_cache = SchemaLoaderCache(max_size=2)
+    cwd = str(schema_and_instances)
+    for name in ("a", "b", "c"):
+        (schema_and_instances / f"{name}.json").write_text(json.dumps(SCHEMA))
+    for name in ("a", "b", "a", "c"):
+        run_check(["--schemafile", f"{name}.json", "good.json"], cwd, loader_cache)
+    assert len(loader_cache) == 2
+    assert [key[1].rsplit(os.sep, 1)[-1] for key in loader_cache._loaders] == [
+        "a.json",
+        "c.json",
+    ]
+
+
+def test_run_check_reports_usage_errors(schema_and_instances):
+    response = run_check(["--bogus"], str(schema_and_instances), SchemaLoaderCache())
+    assert response["exit_code"] == 2
+    assert "No such option: --bogus" in response["stderr"]
+
+
+def test_client_server_round_trip(schema_and_instances, socket_path):
+    from check_jsonschema.daemon.server import CheckServer
+
+    with CheckServer(socket_path) as server:
+        thread = threading.Thread(target=server.handle_request)
+        thread.start()
+        response = client.request_check(
+            socket_path,
+            ["--schemafile", "schema.json", "bad.json"],
+            str(schema_and_instances),
+        )
+        thread.join()
+    assert response["exit_code"] == 1
+    assert "bad.json::$.title" in response["stdout"]
+    assert not os.path.exists(socket_path)
+
+
+def test_client_runs_locally_without_server(
+    schema_and_instances, socket_path, capsys, monkeypatch
+):
+    monkeypatch.chdir(schema_and_instances)
+    with pytest.raises(SystemExit) as excinfo:
+        client.main(
+            ["--socket", socket_path, "--schemafile", "schema.json", "good.json"]
+        )
+    assert excinfo.value.code == 0
+    assert "ok -- validation done" in capsys.readouterr().out
+
+
+def test_serve_subcommand_dispatch(cli_runner):
+    from check_jsonschema import main as cli_main
+
+    result = cli_runner.invoke(cli_main, ["serve", "--help"])
+    assert result.exit_code == 0
+    assert "--socket" in result.stdout
@@ -287,3 +287,72 @@ def test_instanceloader_mixed_filetypes(tmp_path, filetypes, open_wide):
             assert value == {"c": 1}
         elif filetype == "toml":
             assert value == {"foo": {"name": "value"}}
+
+
+@pytest.mark.parametrize("filename", ("foo.jsonl", "foo.ndjson"))
+def test_instanceloader_jsonl_records(tmp_path, filename, open_wide):
+    f = tmp_path / filename
+    f.write_bytes(b'{"a": 1}\n\n  \n[2]\n{bad\n"last"')
+    loader = InstanceLoader(open_wide(f))
+    (file,) = loader.files
+    assert loader.is_record_file(file)
+
+    records = list(loader.iter_records(file))
+    assert [(name, more) for name, _, more in records] == [
+        (f"{f}:1", True),
+        (f"{f}:4", True),
+        (f"{f}:5", True),
+        (f"{f}:6", False),
+    ]
+    assert records[0][1] == {"a": 1}
+    assert records[1][1] == [2]
+    assert isinstance(records[2][1], FailedFileLoadError)
+    assert str(records[2][1]) == f"Failed to parse {f}:5"
+    assert records[3][1] == "last"
+
+
+def test_instanceloader_jsonl_force_filetype(tmp_path, open_wide):
+    f = tmp_path / "foo.json"
+    f.write_text('{"a": 1}\n{"b": 2}\n')
+    loader = InstanceLoader(open_wide(f), force_filetype="jsonl")
+    (file,) = loader.files
+    assert loader.is_record_file(file)
+    assert [data for _, data, _ in loader.iter_records(file)] == [{"a": 1}, {"b": 2}]
+    assert not InstanceLoader(open_wide(f)).is_record_file(file)
+
+
+def test_instanceloader_multi_document_yaml(tmp_path, open_wide):
+    f = tmp_path / "foo.yaml"
+    f.write_text("a: 1\n---\n---\nb: [2]\n---\nc: {d: e}\n---\n")
+    loader = InstanceLoader(open_wide(f), multi_document_yaml=True)
+    (file,) = loader.files
+    assert loader.is_record_file(file)
+    # the empty documents are skipped, but still counted in the indexes
+    assert list(loader.iter_records(file)) == [
+        (f"{f}[0]", {"a": 1}, True),
+        (f"{f}[2]", {"b": [2]}, True),
+        (f"{f}[3]", {"c": {"d": "e"}}, False),
+    ]
+
+
+def test_instanceloader_multi_document_yaml_stops_at_parse_error(tmp_path, open_wide):
+    f = tmp_path / "foo.yaml"
+    f.write_text("a: 1\n---\nb: [\n---\nc: 3\n")
+    loader = InstanceLoader(open_wide(f), multi_document_yaml=True)
+    (file,) = loader.files
+    records = list(loader.iter_records(file))
+    assert [(name, more) for name, _, more in records] == [
+        (f"{f}[0]", True),
+        (f"{f}[1]", False),
+    ]
+    assert isinstance(records[1][1], FailedFileLoadError)
+    assert str(records[1][1]) == f"Failed to parse {f}[1]"
+
+
+def test_instanceloader_yaml_is_one_document_by_default(tmp_path, open_wide):
+    f = tmp_path / "foo.yaml"
+    f.write_text("a: 1\n---\nb: 2\n")
+    loader = InstanceLoader(open_wide(f))
+    assert not loader.is_record_file(loader.files[0])
+    ((_, data),) = loader.iter_files()
+    assert isinstance(data, FailedFileLoadError)
@@ -0,0 +1,66 @@
+import io
+import mmap
+
+import pytest
+
+from check_jsonschema.parsers import json_
+
+requires_orjson = pytest.mark.skipif(
+    not json_.has_orjson, reason="memory maps are only used with orjson"
+)
+
+
+@pytest.fixture
+def map_all_files(monkeypatch):
+    monkeypatch.setattr(json_, "MMAP_MIN_SIZE", 0)
+    mapped = []
+    real_mmap = mmap.mmap
+
+    def recording_mmap(*args, **kwargs):
+        mapped.append(args)
+        return real_mmap(*args, **kwargs)
+
+    monkeypatch.setattr(mmap, "mmap", recording_mmap)
+    return mapped
+
+
+@requires_orjson
+def test_large_files_are_parsed_from_a_memory_map(tmp_path, map_all_files):
+    path = tmp_path / "foo.json"
+    path.write_text('{"a": [1, 2, "\\u00e9"]}')
+    with open(path, "rb") as fp:
+        assert json_.load(fp) == {"a": [1, 2, "é"]}
+    assert len(map_all_files) == 1
+
+
+@requires_orjson
+def test_memory_mapped_parse_errors(tmp_path, map_all_files):
+    path = tmp_path / "foo.json"
+    path.write_text('{"a": ')
+    with open(path, "rb") as fp:
+        with pytest.raises(json_.JSONDecodeError):
+            json_.load(fp)
+    assert len(map_all_files) == 1
+
+
+def test_small_files_are_read(tmp_path, monkeypatch):
+    monkeypatch.setattr(mmap, "mmap", None)
+    path = tmp_path / "foo.json"
+    path.write_text("[1]")
+    with open(path, "rb") as fp:
+        assert json_.load(fp) == [1]
+
+
+@pytest.mark.parametrize("content", (b"", b"[1]"))
+def test_streams_which_cannot_be_mapped_are_read(tmp_path, map_all_files, content):
+    # in-memory streams, empty files, and streams which have been read from are
+    # all read rather than mapped
+    assert json_.load(io.BytesIO(b"[1]")) == [1]
+
+    path = tmp_path / "foo.json"
+    path.write_bytes(content)
+    with open(path, "rb") as fp:
+        fp.read(1)
+        with pytest.raises(json_.JSONDecodeError):
+            json_.load(fp)
+    assert map_all_files == []
@@ -0,0 +1,95 @@
+import jsonschema
+import pytest
+
+from check_jsonschema.schema_loader.lazy_keywords import extend_with_lazy_keywords
+
+SCHEMA = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "properties": {
+        "a": {
+            "anyOf": [
+                {"type": "string", "minLength": 3, "pattern": "^x"},
+                {"type": "integer", "minimum": 10},
+                {
+                    "type": "object",
+                    "properties": {
+                        "b": {"oneOf": [{"type": "string"}, {"minLength": 1}]},
+                    },
+                    "required": ["b", "c"],
+                },
+            ]
+        },
+        "d": {"oneOf": [{"type": "integer"}, {"type": "number"}, {"const": 1.5}]},
+    },
+}
+
+
+def _describe(errors):
+    return [
+        (
+            e.message,
+            list(e.absolute_path),
+            list(e.schema_path),
+            _describe(sorted(e.context, key=lambda e: list(e.schema_path))),
+        )
+        for e in errors
+    ]
+
+
+@pytest.mark.parametrize(
+    "instance",
+    (
+        {"a": "xyz", "d": 1},
+        {"a": 11, "d": 2.5},
+        {"a": {"b": "q", "c": 0}},
+        {"a": "y"},
+        {"a": 1, "d": 1.5},
+        {"a": {"b": "q"}, "d": "x"},
+        {"a": {"b": 1}, "d": 2},
+        {"a": []},
+    ),
+)
+def test_lazy_keywords_report_the_same_errors(instance):
+    builtin_validator = jsonschema.Draft202012Validator(SCHEMA)
+    lazy_validator = extend_with_lazy_keywords(jsonschema.Draft202012Validator)(SCHEMA)
+
+    assert _describe(lazy_validator.iter_errors(instance)) == _describe(
+        builtin_validator.iter_errors(instance)
+    )
+    best_match = jsonschema.exceptions.best_match
+    builtin_best = best_match(builtin_validator.iter_errors(instance))
+    lazy_best = best_match(lazy_validator.iter_errors(instance))
+    assert (lazy_best and lazy_best.message) == (builtin_best and builtin_best.message)
+
+
+def test_failing_subschemas_stop_at_their_first_error():
+    checked = []
+
+    def record(validator, value, instance, schema):
+        checked.append(value)
+        return iter(())
+
+    validator_cls = jsonschema.validators.extend(
+        jsonschema.Draft202012Validator, {"x-record": record}
+    )
+    schema = {
+        "anyOf": [
+            {"allOf": [{"type": "string"}, {"x-record": "first"}]},
+            {"x-record": "second"},
+        ]
+    }
+    extend_with_lazy_keywords(validator_cls)(schema).validate(1)
+    assert checked == ["second"]
+
+
+def test_custom_keyword_implementations_are_kept():
+    def custom_any_of(validator, value, instance, schema):
+        return iter(())
+
+    validator_cls = jsonschema.validators.extend(
+        jsonschema.Draft7Validator, {"anyOf": custom_any_of}
+    )
+    lazy_cls = extend_with_lazy_keywords(validator_cls)
+    assert lazy_cls.VALIDATORS["anyOf"] is custom_any_of
+    assert lazy_cls.VALIDATORS["oneOf"] is not validator_cls.VALIDATORS["oneOf"]
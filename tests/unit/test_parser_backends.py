@@ -0,0 +1,142 @@
+import importlib.metadata
+import json
+import pickle
+
+import pytest
+
+from check_jsonschema.parsers import FailedFileLoadError, ParserSet, backends
+
+
+def _load_upper_keys(stream):
+    return {k.upper(): v for k, v in json.loads(stream.read()).items()}
+
+
+UPPER_BACKEND = backends.ParserBackend(
+    "upper", "json", _load_upper_keys, error_types=(json.JSONDecodeError,)
+)
+
+
+def _load_toml_date(stream):
+    import datetime
+
+    return {"when": datetime.date(2024, 1, 2)}
+
+
+TOML_DATE_BACKEND = backends.ParserBackend("dates", "toml", _load_toml_date)
+
+
+class _FakeEntryPoint:
+    def __init__(self, name, obj):
+        self.name = name
+        self.value = f"fake_module:{name}"
+        self._obj = obj
+
+    def load(self):
+        if isinstance(self._obj, Exception):
+            raise self._obj
+        return self._obj
+
+
+@pytest.fixture
+def plugin_entry_points(monkeypatch):
+    entry_points = []
+
+    def fake_entry_points(*, group):
+        assert group == backends.ENTRY_POINT_GROUP
+        return entry_points
+
+    monkeypatch.setattr(importlib.metadata, "entry_points", fake_entry_points)
+    backends.get_backends.cache_clear()
+    yield entry_points
+    backends.get_backends.cache_clear()
+
+
+def test_builtin_backends(plugin_entry_points):
+    available = backends.get_backends()
+    assert set(available["json"]) == {"default", "stdlib"}
+    assert set(available["toml"]) == {"default"}
+
+
+def test_plugin_backends_are_registered(plugin_entry_points):
+    plugin_entry_points.append(_FakeEntryPoint("upper", UPPER_BACKEND))
+    assert backends.get_backend("json", "upper") is UPPER_BACKEND
+
+
+def test_plugin_toml_backends_are_normalized(plugin_entry_points, tmp_path):
+    plugin_entry_points.append(_FakeEntryPoint("dates", TOML_DATE_BACKEND))
+    path = tmp_path / "foo.toml"
+    path.write_text("")
+    parsers = ParserSet(parser_backends={"toml": "dates"})
+    assert parsers.parse_file(path, "json") == {"when": "2024-01-02"}
+
+
+@pytest.mark.parametrize(
+    "entry_point, message",
+    (
+        (_FakeEntryPoint("broken", ImportError("no module")), "could not load"),
+        (_FakeEntryPoint("notabackend", object()), "is not a ParserBackend"),
+        (
+            _FakeEntryPoint(
+                "yaml", backends.ParserBackend("yaml", "yaml", _load_upper_keys)
+            ),
+            "unsupported filetype 'yaml'",
+        ),
+        (
+            _FakeEntryPoint(
+                "stdlib", backends.ParserBackend("stdlib", "json", _load_upper_keys)
+            ),
+            "another backend has that name",
+        ),
+    ),
+)
+def test_bad_plugins_are_skipped_with_a_warning(
+    plugin_entry_points, entry_point, message
+):
+    plugin_entry_points.append(entry_point)
+    with pytest.warns(UserWarning, match=message):
+        available = backends.get_backends()
+    assert available["json"]["stdlib"].load is not _load_upper_keys
+    assert set(available["json"]) == {"default", "stdlib"}
+
+
+@pytest.mark.parametrize(
+    "filetype, name, message",
+    (
+        ("json", "nosuchbackend", "available backends: default, stdlib"),
+        ("yaml", "default", "cannot be selected for 'yaml'"),
+    ),
+)
+def test_unknown_backends(plugin_entry_points, filetype, name, message):
+    with pytest.raises(backends.UnknownParserBackendError, match=message):
+        ParserSet(parser_backends={filetype: name})
+
+
+def test_parser_set_uses_the_selected_backend(plugin_entry_points, tmp_path):
+    plugin_entry_points.append(_FakeEntryPoint("upper", UPPER_BACKEND))
+    path = tmp_path / "foo.json"
+    path.write_text('{"a": 1}')
+    bad_path = tmp_path / "bad.json"
+    bad_path.write_text("{")
+
+    parsers = ParserSet(parser_backends={"json": "upper"})
+    assert parsers.parse_file(path, "json") == {"A": 1}
+    with pytest.raises(FailedFileLoadError):
+        parsers.parse_file(bad_path, "json")
+    # other filetypes keep their default parsers
+    assert ParserSet().parse_file(path, "json") == {"a": 1}
+
+    # the selection survives pickling, e.g. for use in a worker process
+    assert pickle.loads(pickle.dumps(parsers)).parse_file(path, "json") == {"A": 1}
+
+
+def test_json_lines_use_the_json_backend(plugin_entry_points, tmp_path):
+    plugin_entry_points.append(_FakeEntryPoint("upper", UPPER_BACKEND))
+    path = tmp_path / "foo.jsonl"
+    path.write_text('{"a": 1}\n{\n')
+
+    parsers = ParserSet(parser_backends={"json": "upper"})
+    with open(path, "rb") as fp:
+        records = list(parsers.iter_records_with_path(fp, path, "json"))
+    assert records[0] == (f"{path}:1", {"A": 1}, True)
+    assert records[1][0] == f"{path}:2"
+    assert isinstance(records[1][1], FailedFileLoadError)
@@ -0,0 +1,157 @@
+import pickle
+import re
+
+import jsonschema
+import pytest
+
+from check_jsonschema.regex_variants import RegexImplementation, RegexVariantName
+
+ALL_VARIANTS = tuple(RegexVariantName)
+
+
+def _validator(regex_impl, schema):
+    cls = jsonschema.validators.extend(
+        jsonschema.Draft202012Validator,
+        {
+            "pattern": regex_impl.pattern_keyword,
+            "patternProperties": regex_impl.patternProperties_keyword,
+        },
+    )
+    return cls(schema)
+
+
+@pytest.mark.parametrize("variant", ALL_VARIANTS)
+def test_pattern_is_compiled_once(variant):
+    regex_impl = RegexImplementation(variant)
+    validator = _validator(
+        regex_impl,
+        {
+            "type": "array",
+            "items": {"type": "string", "pattern": "^a"},
+        },
+    )
+    assert validator.is_valid(["a"] * 100)
+    assert not validator.is_valid(["b"])
+
+    info = regex_impl.pattern_cache_info()
+    assert info.misses == 1
+    assert info.hits == 100
+    assert info.currsize == 1
+
+
+@pytest.mark.parametrize("variant", ALL_VARIANTS)
+def test_pattern_properties_compile_once_per_pattern(variant):
+    regex_impl = RegexImplementation(variant)
+    validator = _validator(
+        regex_impl,
+        {
+            "type": "array",
+            "items": {
+                "patternProperties": {"^x-[a-z]": {"type": "string"}, "^y-[a-z]": True},
+            },
+        },
+    )
+    assert validator.is_valid([{"x-a": "1", "y-b": 2}] * 10)
+
+    info = regex_impl.pattern_cache_info()
+    assert info.misses == 2
+    assert info.currsize == 2
+
+
+@pytest.mark.parametrize("variant", ALL_VARIANTS)
+def test_match_all_pattern_properties_are_not_compiled(variant):
+    regex_impl = RegexImplementation(variant)
+    validator = _validator(
+        regex_impl,
+        {"patternProperties": {".*": {"type": "string"}, "": True, "^.*": True}},
+    )
+    assert validator.is_valid({"x-a": "1", "y-b": "2"})
+    assert not validator.is_valid({"x-a": 1})
+    assert regex_impl.pattern_cache_info().misses == 0
+
+
+PATTERN_PROPERTIES = {
+    "^x-": {"type": "string"},
+    "^x-y": {"minLength": 2},
+    "^x": {"maxLength": 3},
+    "": {"type": ["string", "integer"]},
+    ".*": {"not": {"const": "bad"}},
+    "-y": {"type": "string"},
+    "^[a-z]+$": {"type": "integer"},
+    "o+": {"type": "string"},
+}
+
+
+@pytest.mark.parametrize("variant", ALL_VARIANTS)
+@pytest.mark.parametrize(
+    "instance",
+    (
+        {},
+        {"x-y": "ab", "x-": 1, "foo": "bar", "x": "long", "zz": 1},
+        {"bar": "bad", "x-yz": "a", "xx-y": 2, "\n": None},
+        {"X-Y": 1, "x-y-": [], "\u00e9": "bad"},
+    ),
+)
+def test_pattern_properties_match_the_simple_loop(variant, instance):
+    # check the errors against a validator which tests every pattern with 'search'
+    def simple_pattern_properties(validator, patternProperties, instance, schema):
+        if not validator.is_type(instance, "object"):
+            return
+        for pattern, subschema in patternProperties.items():
+            for k, v in instance.items():
+                if re.search(pattern, k):
+                    yield from validator.descend(
+                        v, subschema, path=k, schema_path=pattern
+                    )
+
+    schema = {"patternProperties": PATTERN_PROPERTIES}
+    simple_cls = jsonschema.validators.extend(
+        jsonschema.Draft202012Validator,
+        {"patternProperties": simple_pattern_properties},
+    )
+    expected = [
+        (e.message, list(e.absolute_path), list(e.schema_path))
+        for e in simple_cls(schema).iter_errors(instance)
+    ]
+    actual = [
+        (e.message, list(e.absolute_path), list(e.schema_path))
+        for e in _validator(RegexImplementation(variant), schema).iter_errors(instance)
+    ]
+    assert actual == expected
+
+
+@pytest.mark.parametrize("variant", ALL_VARIANTS)
+def test_check_format_shares_the_cache(variant):
+    regex_impl = RegexImplementation(variant)
+    assert regex_impl.check_format("^a")
+    assert regex_impl.check_format("^a")
+    # invalid patterns are not cached
+    assert not regex_impl.check_format("[")
+    assert not regex_impl.check_format("[")
+
+    info = regex_impl.pattern_cache_info()
+    assert info.hits == 1
+    assert info.misses == 3
+    assert info.currsize == 1
+
+
+def test_pattern_cache_evicts_least_recently_used():
+    regex_impl = RegexImplementation(RegexVariantName.default, pattern_cache_size=2)
+    for pattern in ("a", "b", "a", "c", "a", "b"):
+        regex_impl.check_format(pattern)
+
+    info = regex_impl.pattern_cache_info()
+    # "b" was evicted by "c", then "c" by "b"
+    assert info.misses == 4
+    assert info.hits == 2
+    assert info.currsize == 2
+
+
+def test_regex_implementation_pickles_with_an_empty_cache():
+    regex_impl = RegexImplementation(RegexVariantName.default, pattern_cache_size=8)
+    regex_impl.check_format("^a")
+
+    rebuilt = pickle.loads(pickle.dumps(regex_impl))
+    assert rebuilt == regex_impl
+    assert rebuilt.pattern_cache_info() == (0, 0, 8, 0)
+    assert rebuilt.check_format("^a")
@@ -1,12 +1,21 @@
 import json
 import textwrap
 
+import jsonschema
 import pytest
 from jsonschema import Draft7Validator
 
 from check_jsonschema.parsers import ParseError
-from check_jsonschema.reporter import JsonReporter, TextReporter
+from check_jsonschema.reporter import (
+    JsonReporter,
+    NdjsonReporter,
+    StreamingTextReporter,
+    TextReporter,
+    find_best_deep_match,
+    summarize_error_tree,
+)
 from check_jsonschema.result import CheckResult
+from check_jsonschema.utils import iter_validation_error
 
 
 def _make_success_result():
@@ -261,3 +270,125 @@ def test_text_print_parse_error_with_cause(capsys):
               whoopsie during parsing
                 JSONDecodeError: a bad thing happened: line 1 column 2 (char 1)
             """) in captured.out
+
+
+def test_result_without_details_only_counts():
+    result = CheckResult(retain_details=False)
+    result.record_validation_success("foo.json")
+    result.record_parse_error("bar.json", ParseError("oh no"))
+    assert not result.success
+    assert (result.num_successes, result.num_parse_errors) == (1, 1)
+    assert result.successes == []
+    assert result.parse_errors == {}
+
+
+def _validation_errors():
+    schema = {"properties": {"foo": {"type": "string"}, "bar": {"type": "string"}}}
+    return list(Draft7Validator(schema).iter_errors({"foo": 1, "bar": 2}))
+
+
+@pytest.mark.parametrize("verbosity", (0, 1, 3))
+def test_streaming_text_format(capsys, verbosity):
+    reporter = StreamingTextReporter(verbosity=verbosity)
+    result = CheckResult(retain_details=False)
+    reporter.report_file_success("good.json")
+    result.record_validation_success("good.json")
+
+    errors = _validation_errors()
+    reporter.report_file_validation_errors("bad.json", errors)
+    for err in errors:
+        result.record_validation_error("bad.json", err)
+    reporter.report_result(result)
+
+    captured = capsys.readouterr()
+    assert captured.err == ""
+    if verbosity == 0:
+        assert captured.out == ""
+        return
+    lines = captured.out.splitlines()
+    if verbosity > 2:
+        assert lines.pop(0) == "ok -- good.json"
+    assert lines == [
+        "  bad.json::$.foo: 1 is not of type 'string'",
+        "  bad.json::$.bar: 2 is not of type 'string'",
+        "fail -- validation errors: 2, files which failed to parse: 0",
+    ]
+
+
+@pytest.mark.parametrize("verbosity", (0, 1, 2))
+def test_ndjson_format(capsys, verbosity):
+    reporter = NdjsonReporter(verbosity=verbosity)
+    result = CheckResult(retain_details=False)
+    reporter.report_file_success("good.json")
+    result.record_validation_success("good.json")
+
+    errors = _validation_errors()
+    reporter.report_file_validation_errors("bad.json", errors)
+    for err in errors:
+        result.record_validation_error("bad.json", err)
+    reporter.report_file_parse_error("broken.json", ParseError("oh no"))
+    result.record_parse_error("broken.json", ParseError("oh no"))
+    result.record_truncation("stopped after 2 errors (--max-errors)")
+    reporter.report_result(result)
+
+    captured = capsys.readouterr()
+    assert captured.err == ""
+    events = [json.loads(line) for line in captured.out.splitlines()]
+    assert events[-1] == {
+        "type": "summary",
+        "status": "fail",
+        "num_successes": 1,
+        "num_validation_errors": 2,
+        "num_parse_errors": 1,
+        "truncated": ["stopped after 2 errors (--max-errors)"],
+    }
+    expect_types = []
+    if verbosity > 1:
+        expect_types.append("success")
+    if verbosity > 0:
+        expect_types += ["validation_error", "validation_error", "parse_error"]
+    assert [e["type"] for e in events[:-1]] == expect_types
+    if verbosity > 0:
+        assert events[-3]["path"] == "$.bar"
+        assert events[-2] == {
+            "type": "parse_error",
+            "filename": "broken.json",
+            "message": "oh no",
+        }
+
+
+def _nested_any_of(depth):
+    if depth == 0:
+        return {"type": "string"}
+    return {
+        "anyOf": [
+            {"properties": {"a": _nested_any_of(depth - 1)}},
+            _nested_any_of(depth - 1),
+            {"type": "integer"},
+        ]
+    }
+
+
+def _nested_instance(depth):
+    return 1.5 if depth == 0 else {"a": _nested_instance(depth - 1)}
+
+
+@pytest.mark.parametrize("depth", (1, 2, 4))
+def test_summarize_error_tree_matches_separate_walks(depth):
+    schema = {"properties": {"x": _nested_any_of(depth)}}
+    (err,) = Draft7Validator(schema).iter_errors({"x": _nested_instance(depth)})
+
+    summary = summarize_error_tree(err, collect_sub_errors=True)
+    all_sub_errors = list(iter_validation_error(err))
+    assert summary.best_match is jsonschema.exceptions.best_match(err.context)
+    assert summary.best_deep_match is find_best_deep_match(err)
+    assert summary.num_sub_errors == len(all_sub_errors)
+    assert summary.sub_errors == all_sub_errors
+
+    assert summarize_error_tree(err).sub_errors == []
+
+
+def test_summarize_error_tree_requires_a_context():
+    (err,) = Draft7Validator({"type": "string"}).iter_errors(1)
+    with pytest.raises(ValueError):
+        summarize_error_tree(err)
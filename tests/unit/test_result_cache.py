@@ -0,0 +1,102 @@
+import os
+
+import jsonschema
+import pytest
+
+from check_jsonschema.result_cache import ResultCache
+from check_jsonschema.utils import iter_validation_error
+
+SCHEMA = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "properties": {"a": {"anyOf": [{"type": "string"}, {"type": "integer"}]}},
+}
+
+
+@pytest.fixture
+def results_cache_dir(cache_dir):
+    return cache_dir / "check_jsonschema" / "results"
+
+
+def _errors_for(instance):
+    return list(jsonschema.Draft202012Validator(SCHEMA).iter_errors(instance))
+
+
+def test_key_depends_on_content_filetype_and_schema():
+    cache = ResultCache(settings={})
+    key = cache.make_key(b"{}", "json", "schema1")
+    assert key == cache.make_key(b"{}", "json", "schema1")
+    assert key != cache.make_key(b"{ }", "json", "schema1")
+    assert key != cache.make_key(b"{}", "yaml", "schema1")
+    assert key != cache.make_key(b"{}", "json", "schema2")
+
+
+def test_key_depends_on_settings():
+    key1 = ResultCache(settings={"fill_defaults": False}).make_key(b"{}", "json", "s")
+    key2 = ResultCache(settings={"fill_defaults": True}).make_key(b"{}", "json", "s")
+    assert key1 != key2
+
+
+def test_miss_then_hit_on_success(results_cache_dir):
+    cache = ResultCache(settings={})
+    key = cache.make_key(b"{}", "json", "s")
+    assert cache.get(key) is None
+
+    cache.put(key, [])
+    assert cache.get(key) == []
+    assert len(os.listdir(results_cache_dir)) == 1
+
+
+def test_stored_errors_keep_their_structure():
+    cache = ResultCache(settings={})
+    key = cache.make_key(b'{"a": []}', "json", "s")
+    original = _errors_for({"a": []})
+    cache.put(key, original)
+
+    loaded = cache.get(key)
+    assert [e.json_path for e in loaded] == ["$.a"]
+    assert [e.json_path for e in iter_validation_error(loaded[0])] == [
+        "$.a",
+        "$.a",
+    ]
+    assert jsonschema.exceptions.best_match(loaded[0].context).message == (
+        jsonschema.exceptions.best_match(original[0].context).message
+    )
+
+
+def test_corrupt_entry_is_a_miss(results_cache_dir):
+    cache = ResultCache(settings={})
+    key = cache.make_key(b"{}", "json", "s")
+    cache.put(key, [])
+    (entry,) = results_cache_dir.iterdir()
+    entry.write_bytes(b"not a pickle")
+
+    assert cache.get(key) is None
+
+
+def test_unwritable_cache_dir_is_ignored(results_cache_dir):
+    results_cache_dir.parent.mkdir(parents=True)
+    results_cache_dir.write_text("not a directory")
+
+    cache = ResultCache(settings={})
+    key = cache.make_key(b"{}", "json", "s")
+    cache.put(key, [])
+    assert cache.get(key) is None
+    cache.prune()
+
+
+def test_prune_evicts_least_recently_used(results_cache_dir):
+    cache = ResultCache(settings={})
+    keys = [cache.make_key(str(i).encode(), "json", "s") for i in range(3)]
+    for i, key in enumerate(keys):
+        cache.put(key, _errors_for({"a": []}))
+        os.utime(results_cache_dir / f"{key}.pickle", (i, i))
+    entry_size = (results_cache_dir / f"{keys[0]}.pickle").stat().st_size
+
+    # use the oldest entry, marking it as recently used
+    assert cache.get(keys[0]) is not None
+
+    small_cache = ResultCache(settings={}, max_size=2 * entry_size)
+    small_cache.prune()
+    assert small_cache.get(keys[0]) is not None
+    assert small_cache.get(keys[1]) is None
+    assert small_cache.get(keys[2]) is not None
@@ -4,8 +4,15 @@ import pathlib
 import pytest
 import responses
 
-from check_jsonschema.schema_loader import SchemaLoader, SchemaParseError
+from check_jsonschema.formats import FormatOptions
+from check_jsonschema.regex_variants import RegexImplementation, RegexVariantName
+from check_jsonschema.schema_loader import (
+    MetaSchemaLoader,
+    SchemaLoader,
+    SchemaParseError,
+)
 from check_jsonschema.schema_loader.readers import HttpSchemaReader, LocalSchemaReader
+from check_jsonschema.schema_loader.resolver import iter_ref_uris
 
 
 @pytest.fixture
@@ -140,3 +147,65 @@ a: {b
     sl = SchemaLoader(str(f))
     with pytest.raises(SchemaParseError):
         sl.get_schema()
+
+
+def test_metaschema_loader_reuses_validators_per_dialect():
+    regex_impl = RegexImplementation(RegexVariantName.default)
+    format_opts = FormatOptions(regex_impl=regex_impl)
+    loader = MetaSchemaLoader()
+
+    def get_validator(doc):
+        return loader.get_validator("schema.json", doc, format_opts, regex_impl, False)
+
+    draft7 = {"$schema": "http://json-schema.org/draft-07/schema#"}
+    draft202012 = {"$schema": "https://json-schema.org/draft/2020-12/schema"}
+    validator = get_validator(draft7)
+    assert get_validator({**draft7, "type": "object"}) is validator
+    assert get_validator(draft202012) is not validator
+    # schemas without '$schema' use the latest draft
+    assert get_validator({}) is get_validator(draft202012)
+
+
+def test_iter_ref_uris_skips_instance_data():
+    schema = {
+        "properties": {
+            "a": {"$ref": "a.json"},
+            # properties may have the names of keywords which hold instance data
+            "default": {"items": [{"$ref": "b.json#/x"}]},
+        },
+        "$defs": {"enum": {"$ref": "c.json"}},
+        "default": {"$ref": "https://example.org/default.json"},
+        "examples": [{"$ref": "https://example.org/example.json"}],
+        "const": {"$ref": "https://example.org/const.json"},
+        "enum": [{"$ref": "https://example.org/enum.json"}],
+    }
+    uris = iter_ref_uris(schema, "https://example.org/schemas/main.json")
+    assert sorted(uris) == [
+        "https://example.org/schemas/a.json",
+        "https://example.org/schemas/b.json",
+        "https://example.org/schemas/c.json",
+    ]
+
+
+def test_iter_ref_uris_follows_embedded_ids():
+    schema = {
+        "$ref": "a.json",
+        "$defs": {
+            "sub": {
+                "$id": "https://example.org/other/sub.json",
+                "$ref": "b.json",
+                "properties": {"c": {"$ref": "c.json#/x"}},
+            },
+            # draft 2020-12 ids are resolved against the enclosing base URI
+            "rel": {"$id": "nested/rel.json", "items": {"$ref": "d.json"}},
+            # references to resources embedded in the document are not included
+            "local": {"$ref": "https://example.org/other/sub.json#/properties"},
+        },
+    }
+    uris = iter_ref_uris(schema, "https://example.org/schemas/main.json")
+    assert sorted(uris) == [
+        "https://example.org/other/b.json",
+        "https://example.org/other/c.json",
+        "https://example.org/schemas/a.json",
+        "https://example.org/schemas/nested/d.json",
+    ]
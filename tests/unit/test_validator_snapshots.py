@@ -0,0 +1,164 @@
+import json
+import os
+import time
+
+import jsonschema
+import pytest
+import responses
+
+from check_jsonschema.formats import FormatOptions
+from check_jsonschema.regex_variants import RegexImplementation, RegexVariantName
+from check_jsonschema.schema_loader import SchemaLoader
+from check_jsonschema.schema_loader.snapshots import (
+    ValidatorSnapshot,
+    ValidatorSnapshotCache,
+)
+
+DEFAULT_REGEX = RegexImplementation(RegexVariantName.default)
+FORMAT_OPTS = FormatOptions(regex_impl=DEFAULT_REGEX)
+
+
+def _get_validator(schema_path, **kwargs):
+    sl = SchemaLoader(str(schema_path), validator_snapshots=True, **kwargs)
+    return sl.get_validator(str(schema_path), {}, FORMAT_OPTS, DEFAULT_REGEX, False)
+
+
+@pytest.fixture
+def snapshot_dir(cache_dir):
+    return cache_dir / "check_jsonschema" / "validator-snapshots"
+
+
+@pytest.fixture
+def local_schema(tmp_path):
+    (tmp_path / "title.json").write_text(json.dumps({"type": "string"}))
+    schema = tmp_path / "schema.json"
+    schema.write_text(
+        json.dumps(
+            {
+                "$schema": "https://json-schema.org/draft/2020-12/schema",
+                "properties": {"title": {"$ref": "./title.json"}},
+            }
+        )
+    )
+    return schema
+
+
+def test_snapshot_key_depends_on_source_and_options():
+    cache = ValidatorSnapshotCache()
+    key = cache.make_key(b"{}", "file:///schema.json", None)
+    assert key == cache.make_key(b"{}", "file:///schema.json", None)
+    assert key != cache.make_key(b"{ }", "file:///schema.json", None)
+    assert key != cache.make_key(b"{}", "file:///other.json", None)
+    assert key != cache.make_key(b"{}", "file:///schema.json", "")
+
+
+def test_snapshot_is_stored_and_used(local_schema, snapshot_dir, monkeypatch):
+    validator = _get_validator(local_schema)
+    assert list(validator.iter_errors({"title": 1}))
+    assert len(os.listdir(snapshot_dir)) == 1
+
+    # with a snapshot, the schema is not parsed again
+    def fail_get_schema(self):
+        raise AssertionError("schema was loaded")
+
+    monkeypatch.setattr(SchemaLoader, "get_schema", fail_get_schema)
+    validator = _get_validator(local_schema)
+    assert list(validator.iter_errors({"title": 1}))
+    assert not list(validator.iter_errors({"title": "foo"}))
+
+
+def test_snapshot_is_not_used_after_a_local_ref_changes(local_schema):
+    _get_validator(local_schema)
+
+    title = local_schema.parent / "title.json"
+    title.write_text(json.dumps({"type": "integer"}))
+    # ensure that the change is visible even on coarse-grained filesystems
+    stat = title.stat()
+    os.utime(title, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    validator = _get_validator(local_schema)
+    assert not list(validator.iter_errors({"title": 1}))
+
+
+def test_invalid_schema_is_not_stored(tmp_path, snapshot_dir):
+    schema = tmp_path / "schema.json"
+    schema.write_text(
+        '{"$schema": "https://json-schema.org/draft/2020-12/schema", "type": "foo"}'
+    )
+    with pytest.raises(jsonschema.SchemaError):
+        _get_validator(schema)
+    assert not snapshot_dir.exists()
+
+
+@pytest.mark.parametrize(
+    "created_ago, kwargs, expect_current",
+    (
+        (0, {}, False),
+        (0, {"offline": True}, True),
+        (10, {"cache_ttl": 60}, True),
+        (100, {"cache_ttl": 60}, False),
+        (10**6, {"offline": True}, True),
+    ),
+)
+def test_remote_resources_are_only_reused_within_ttl_or_offline(
+    created_ago, kwargs, expect_current
+):
+    snapshot = ValidatorSnapshot(
+        {},
+        {"https://example.com/ref.json": {"type": "string"}},
+        created_at=time.time() - created_ago,
+    )
+    params = {"cache_ttl": None, "offline": False}
+    params.update(kwargs)
+    assert snapshot.is_current(**params) is expect_current
+
+
+@responses.activate
+def test_snapshot_of_remote_refs_avoids_requests(tmp_path):
+    responses.add(
+        "GET", "https://example.com/title.json", json={"type": "string"}, status=200
+    )
+    schema = tmp_path / "schema.json"
+    schema.write_text(
+        json.dumps(
+            {
+                "$schema": "https://json-schema.org/draft/2020-12/schema",
+                "properties": {"title": {"$ref": "https://example.com/title.json"}},
+            }
+        )
+    )
+    _get_validator(schema, disable_cache=False, cache_ttl=60)
+    assert len(responses.calls) == 1
+
+    validator = _get_validator(schema, disable_cache=False, cache_ttl=60)
+    assert list(validator.iter_errors({"title": 1}))
+    assert len(responses.calls) == 1
+
+
+def test_snapshot_is_stored_as_json(local_schema, snapshot_dir):
+    _get_validator(local_schema)
+    (snapshot_file,) = snapshot_dir.iterdir()
+    data = json.loads(snapshot_file.read_bytes())
+    assert data["schema"]["properties"] == {"title": {"$ref": "./title.json"}}
+    assert data["resources"] == {
+        (local_schema.parent / "title.json").as_uri(): {"type": "string"}
+    }
+
+    cache = ValidatorSnapshotCache()
+    snapshot = cache.get(snapshot_file.stem)
+    assert snapshot is not None
+    assert snapshot.local_files == {
+        uri: tuple(stamp) for uri, stamp in data["local_files"].items()
+    }
+    assert snapshot.is_current(cache_ttl=None, offline=False)
+
+
+@pytest.mark.parametrize(
+    "content", (b"not json", b"[]", b'{"schema": {}}', b'{"schema": 1}')
+)
+def test_unreadable_snapshot_is_a_miss(snapshot_dir, content):
+    cache = ValidatorSnapshotCache()
+    key = cache.make_key(b"{}", None)
+    snapshot_dir.mkdir(parents=True)
+    (snapshot_dir / f"{key}.json").write_bytes(content)
+    assert cache.get(key) is None
@@ -0,0 +1,155 @@
+import os
+
+import jsonschema
+import pytest
+
+from check_jsonschema.formats import FormatOptions, format_checker_for_regex_impl
+from check_jsonschema.regex_variants import RegexImplementation, RegexVariantName
+from check_jsonschema.schema_loader import SchemaLoader
+from check_jsonschema.schema_loader.main import _check_schema, _dialect_of_schema
+from check_jsonschema.schema_loader.verified_schemas import VerifiedSchemaCache
+
+DEFAULT_REGEX = RegexImplementation(RegexVariantName.default)
+PYTHON_REGEX = RegexImplementation(RegexVariantName.python)
+
+VALID_SCHEMA = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+}
+INVALID_SCHEMA = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "foo",
+}
+
+
+@pytest.fixture
+def verified_cache_dir(cache_dir):
+    return cache_dir / "check_jsonschema" / "verified-schemas"
+
+
+def _make_key(cache, validator_cls, schema, regex_impl):
+    # the key which '_check_schema' uses
+    format_checker = format_checker_for_regex_impl(
+        regex_impl, _dialect_of_schema(validator_cls.META_SCHEMA)
+    )
+    return cache.make_key(validator_cls, schema, regex_impl, format_checker)
+
+
+def test_key_depends_on_schema_dialect_and_regex_variant():
+    cache = VerifiedSchemaCache()
+    key = _make_key(cache, jsonschema.Draft202012Validator, VALID_SCHEMA, DEFAULT_REGEX)
+    assert key == _make_key(
+        cache, jsonschema.Draft202012Validator, dict(VALID_SCHEMA), DEFAULT_REGEX
+    )
+    assert key != _make_key(
+        cache, jsonschema.Draft202012Validator, INVALID_SCHEMA, DEFAULT_REGEX
+    )
+    assert key != _make_key(
+        cache, jsonschema.Draft7Validator, VALID_SCHEMA, DEFAULT_REGEX
+    )
+    assert key != _make_key(
+        cache, jsonschema.Draft202012Validator, VALID_SCHEMA, PYTHON_REGEX
+    )
+
+
+def test_key_depends_on_available_formats():
+    cache = VerifiedSchemaCache()
+    format_checker = format_checker_for_regex_impl(DEFAULT_REGEX)
+    key = cache.make_key(
+        jsonschema.Draft202012Validator, VALID_SCHEMA, DEFAULT_REGEX, format_checker
+    )
+
+    # as when an optional package which checks a format is installed
+    more_formats = jsonschema.FormatChecker(())
+    more_formats.checkers = {**format_checker.checkers, "new-format": (bool, ())}
+    assert key != cache.make_key(
+        jsonschema.Draft202012Validator, VALID_SCHEMA, DEFAULT_REGEX, more_formats
+    )
+
+
+def test_passing_schema_is_recorded(verified_cache_dir):
+    cache = VerifiedSchemaCache()
+    key = _make_key(cache, jsonschema.Draft202012Validator, VALID_SCHEMA, DEFAULT_REGEX)
+    assert key not in cache
+
+    _check_schema(
+        jsonschema.Draft202012Validator,
+        VALID_SCHEMA,
+        regex_impl=DEFAULT_REGEX,
+        verified_cache=cache,
+    )
+    assert key in cache
+    assert os.listdir(verified_cache_dir) == [key]
+
+
+def test_failing_schema_is_not_recorded(verified_cache_dir):
+    cache = VerifiedSchemaCache()
+    with pytest.raises(jsonschema.SchemaError):
+        _check_schema(
+            jsonschema.Draft202012Validator,
+            INVALID_SCHEMA,
+            regex_impl=DEFAULT_REGEX,
+            verified_cache=cache,
+        )
+    assert not verified_cache_dir.exists()
+
+
+def test_recorded_schema_skips_the_check():
+    # record an invalid schema, so that a skipped check is observable
+    cache = VerifiedSchemaCache()
+    cache.add(
+        _make_key(cache, jsonschema.Draft202012Validator, INVALID_SCHEMA, DEFAULT_REGEX)
+    )
+
+    _check_schema(
+        jsonschema.Draft202012Validator,
+        INVALID_SCHEMA,
+        regex_impl=DEFAULT_REGEX,
+        verified_cache=cache,
+    )
+    with pytest.raises(jsonschema.SchemaError):
+        _check_schema(
+            jsonschema.Draft202012Validator,
+            INVALID_SCHEMA,
+            regex_impl=DEFAULT_REGEX,
+            verified_cache=None,
+        )
+
+
+@pytest.mark.parametrize("recheck_schema", (True, False))
+def test_schemaloader_recheck_schema(tmp_path, recheck_schema):
+    cache = VerifiedSchemaCache()
+    cache.add(
+        _make_key(cache, jsonschema.Draft202012Validator, INVALID_SCHEMA, DEFAULT_REGEX)
+    )
+    f = tmp_path / "schema.json"
+    f.write_text(
+        '{"$schema": "https://json-schema.org/draft/2020-12/schema", "type": "foo"}'
+    )
+
+    sl = SchemaLoader(str(f), recheck_schema=recheck_schema)
+    format_opts = FormatOptions(regex_impl=DEFAULT_REGEX)
+    if recheck_schema:
+        with pytest.raises(jsonschema.SchemaError):
+            sl.get_validator(str(f), {}, format_opts, DEFAULT_REGEX, False)
+    else:
+        sl.get_validator(str(f), {}, format_opts, DEFAULT_REGEX, False)
+
+
+def test_records_are_pruned(verified_cache_dir):
+    cache = VerifiedSchemaCache()
+    first_key = _make_key(
+        cache, jsonschema.Draft202012Validator, VALID_SCHEMA, DEFAULT_REGEX
+    )
+    cache.add(first_key)
+    record_size = (verified_cache_dir / first_key).stat().st_size
+    os.utime(verified_cache_dir / first_key, (0, 0))
+
+    small_cache = VerifiedSchemaCache(max_size=record_size)
+    second_key = _make_key(
+        small_cache, jsonschema.Draft7Validator, VALID_SCHEMA, DEFAULT_REGEX
+    )
+    small_cache.add(second_key)
+    assert os.listdir(verified_cache_dir) == [second_key]
+    assert first_key not in small_cache
+    assert second_key in small_cache